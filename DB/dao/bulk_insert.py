@@ -0,0 +1,46 @@
+# DAO 공통 일괄 INSERT 도우미
+
+# executemany 한 번(= 트랜잭션 하나)에 보내는 행 수
+DEFAULT_BATCH_SIZE = 100
+
+
+def _auto_increment_step(cursor):
+    cursor.execute("SELECT @@auto_increment_increment")
+    return cursor.fetchone()[0] or 1
+
+
+def bulk_insert(db_connection, query, rows, batch_size=DEFAULT_BATCH_SIZE):
+    """rows를 batch_size개씩 executemany로 INSERT (배치마다 commit)
+    배치가 실패하면 해당 배치만 롤백하고 한 행씩 다시 넣어 실패한 행만 걸러냄
+    반환: (ids, errors) - ids는 rows와 같은 순서의 생성 ID(실패한 행은 None),
+          errors는 [(행 번호, 오류 메시지), ...]"""
+    ids = [None] * len(rows)
+    errors = []
+    if not rows:
+        return ids, errors
+
+    cursor = db_connection.cursor()
+    try:
+        step = _auto_increment_step(cursor)
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            try:
+                # 여러 행 INSERT 한 문장으로 보내지므로 lastrowid는 첫 행의 ID이고 나머지는 연속
+                cursor.executemany(query, batch)
+                first_id = cursor.lastrowid
+                db_connection.commit()
+                for offset in range(len(batch)):
+                    ids[start + offset] = first_id + offset * step
+            except Exception:
+                db_connection.rollback()
+                for offset, row in enumerate(batch):
+                    try:
+                        cursor.execute(query, row)
+                        ids[start + offset] = cursor.lastrowid
+                    except Exception as e:
+                        errors.append((start + offset, str(e)))
+                db_connection.commit()
+    finally:
+        cursor.close()
+
+    return ids, errors
@@ -1,12 +1,41 @@
 import mysql.connector
 from DB.dto.car_review_dto import CarReviewDTO
+from DB.dao.bulk_insert import bulk_insert, DEFAULT_BATCH_SIZE
+
+INSERT_QUERY = """INSERT INTO car_review_info (car_id, car_name, avg_score, survey_people_count, graph_info)
+                  VALUES (%s, %s, %s, %s, %s)"""
+
+# 차량명 → 대표 car_id (같은 모델이 연료 타입별로 여러 행이면 가장 작은 car_id)
+CAR_ID_INDEX_QUERY = """SELECT car_full_name, MIN(car_id) FROM car_info
+                        WHERE car_full_name IS NOT NULL
+                        GROUP BY car_full_name"""
 
 class CarReviewDAO:
     def __init__(self, db_connection):
         self.db_connection = db_connection
+        # 마지막 일괄 저장에서 실패한 행 [(행 번호, 오류 메시지), ...]
+        self.last_errors = []
+        self._car_id_index = None
+
+    def car_id_index(self):
+        """차량명 → 대표 car_id 딕셔너리 (처음 호출할 때 한 번만 조회)"""
+        if self._car_id_index is None:
+            cursor = self.db_connection.cursor()
+            try:
+                cursor.execute(CAR_ID_INDEX_QUERY)
+                self._car_id_index = dict(cursor.fetchall())
+            finally:
+                cursor.close()
+        return self._car_id_index
+
+    def resolve_car_id(self, car_review):
+        """리뷰의 차량명으로 car_id를 채움 (이미 있으면 그대로, 못 찾으면 None)"""
+        if car_review.car_id is None:
+            car_review.car_id = self.car_id_index().get(car_review.car_name)
+        return car_review.car_id
 
     def get_car_reviews(self):
-        query = "SELECT car_name, avg_score, survey_people_count, graph_info FROM car_review_info"
+        query = "SELECT car_name, avg_score, survey_people_count, graph_info, car_id FROM car_review_info"
         cursor = self.db_connection.cursor()
         cursor.execute(query)
         result = cursor.fetchall()
@@ -15,10 +44,9 @@ class CarReviewDAO:
     def insert_car_review(self, car_review):
         try:
             cursor = self.db_connection.cursor()
-            query = """INSERT INTO car_review_info (car_name, avg_score, survey_people_count, graph_info)
-                       VALUES (%s, %s, %s, %s)"""
-            cursor.execute(query, (
-            car_review.car_name, car_review.avg_score, car_review.survey_people_count, car_review.graph_info))
+            self.resolve_car_id(car_review)
+            cursor.execute(INSERT_QUERY, (
+            car_review.car_id, car_review.car_name, car_review.avg_score, car_review.survey_people_count, car_review.graph_info))
             self.db_connection.commit()
             car_review.review_id = cursor.lastrowid # 마지막 id 찾기
             return car_review.review_id
@@ -27,6 +55,20 @@ class CarReviewDAO:
         finally:
             cursor.close()
 
+    def insert_car_reviews(self, car_reviews, batch_size=DEFAULT_BATCH_SIZE):
+        """리뷰 여러 개를 배치 단위 트랜잭션으로 저장하고 생성된 ID 목록을 반환 (실패한 리뷰는 None)"""
+        rows = [
+            (self.resolve_car_id(r), r.car_name, r.avg_score, r.survey_people_count, r.graph_info)
+            for r in car_reviews
+        ]
+        ids, errors = bulk_insert(self.db_connection, INSERT_QUERY, rows, batch_size)
+        for car_review, review_id in zip(car_reviews, ids):
+            car_review.review_id = review_id
+        self.last_errors = errors
+        for index, message in errors:
+            print(f"Error while inserting car review ({car_reviews[index].car_name}): {message}")
+        return ids
+
 
 # 출력 확인 완료
 # if __name__ == "__main__":
@@ -1,9 +1,27 @@
+import hashlib
+
 import mysql.connector
 from DB.dto.comment_info_dto import CommentDTO
+from DB.dao.bulk_insert import bulk_insert, DEFAULT_BATCH_SIZE
+
+INSERT_QUERY = """INSERT INTO comment_info (review_id, nickname, comment_avg_score, comment_text, created_at, content_hash)
+                  VALUES (%s, %s, %s, %s, %s, %s)"""
+
+
+def comment_content_hash(nickname, comment_text):
+    """댓글 중복 판단용 해시 (닉네임 + 내용)
+    DB/migrations/003의 SHA2(CONCAT(nickname, CHAR(31), comment_text), 256)와 같은 값"""
+    payload = f"{nickname or ''}\x1f{comment_text or ''}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
 
 class CommentDAO:
     def __init__(self, db_connection):
         self.db_connection = db_connection
+        # 마지막 일괄 저장에서 실패한 행 [(행 번호, 오류 메시지), ...]
+        self.last_errors = []
+        # 마지막 일괄 저장에서 이미 있는 댓글이라 건너뛴 수
+        self.last_duplicates = 0
 
     def get_comments_by_review_id(self, review_id):
         query = "SELECT nickname, comment_avg_score, comment_text, created_at FROM comment_info WHERE review_id = %s"
@@ -12,23 +30,67 @@ class CommentDAO:
         result = cursor.fetchall()
         return [CommentDTO(review_id, *row) for row in result]
 
+    def _existing_hashes(self, review_ids):
+        """리뷰들에 이미 저장된 (review_id, content_hash) 집합"""
+        if not review_ids:
+            return set()
+        placeholders = ", ".join(["%s"] * len(review_ids))
+        cursor = self.db_connection.cursor()
+        try:
+            cursor.execute(
+                f"SELECT review_id, content_hash FROM comment_info WHERE review_id IN ({placeholders})",
+                tuple(review_ids)
+            )
+            return set(cursor.fetchall())
+        finally:
+            cursor.close()
+
     def insert_comment(self, comment_dto):
         try:
             cursor = self.db_connection.cursor()
-            query = """INSERT INTO comment_info (review_id, nickname, comment_avg_score, comment_text, created_at)
-                       VALUES (%s, %s, %s, %s, %s)"""
-            cursor.execute(query, (
+            cursor.execute(INSERT_QUERY, (
                 comment_dto.review_id,  # review_id를 사용하여 댓글과 리뷰를 연결
                 comment_dto.nickname,
                 comment_dto.comment_avg_score,
                 comment_dto.comment_text,
-                comment_dto.created_at
+                comment_dto.created_at,
+                comment_content_hash(comment_dto.nickname, comment_dto.comment_text)
             ))
             self.db_connection.commit()
 
             # 마지막으로 삽입된 comment의 id를 DTO에 설정
             comment_dto.comment_id = cursor.lastrowid
+        except mysql.connector.IntegrityError:
+            # 같은 리뷰에 같은 댓글이 이미 있음 (uq_comment_review_hash)
+            comment_dto.comment_id = None
         except Exception as e:
             print(f"Error while inserting comment: {e}")
         finally:
-            cursor.close()
\ No newline at end of file
+            cursor.close()
+
+    def insert_comments(self, comment_dtos, batch_size=DEFAULT_BATCH_SIZE):
+        """댓글 여러 개를 배치 단위 트랜잭션으로 저장하고 생성된 ID 목록을 반환
+        같은 리뷰에 이미 있거나 목록 안에서 겹치는 댓글은 건너뜀 (실패/중복 댓글은 None)"""
+        existing = self._existing_hashes(sorted({c.review_id for c in comment_dtos if c.review_id is not None}))
+
+        to_insert = []
+        for index, c in enumerate(comment_dtos):
+            key = (c.review_id, comment_content_hash(c.nickname, c.comment_text))
+            if key in existing:
+                continue
+            existing.add(key)
+            to_insert.append((index, (c.review_id, c.nickname, c.comment_avg_score, c.comment_text, c.created_at, key[1])))
+
+        inserted_ids, errors = bulk_insert(self.db_connection, INSERT_QUERY, [row for _, row in to_insert], batch_size)
+
+        ids = [None] * len(comment_dtos)
+        for (index, _), comment_id in zip(to_insert, inserted_ids):
+            ids[index] = comment_id
+        for comment_dto, comment_id in zip(comment_dtos, ids):
+            comment_dto.comment_id = comment_id
+
+        self.last_duplicates = len(comment_dtos) - len(to_insert)
+        self.last_errors = [(to_insert[i][0], message) for i, message in errors]
+        for index, message in self.last_errors:
+            print(f"Error while inserting comment ({comment_dtos[index].nickname}): {message}")
+        return ids
@@ -1,10 +1,19 @@
 class CarReviewDTO:
-    def __init__(self, car_name, avg_score, survey_people_count, graph_info):
+    def __init__(self, car_name, avg_score, survey_people_count, graph_info, car_id=None):
+        self.__car_id = car_id
         self.__car_name = car_name
         self.__avg_score = avg_score
         self.__survey_people_count = survey_people_count
         self.__graph_info = graph_info
 
+    @property
+    def car_id(self):
+        return self.__car_id
+
+    @car_id.setter
+    def car_id(self, value):
+        self.__car_id = value
+
     @property
     def car_name(self):
         return self.__car_name
@@ -38,7 +47,8 @@ class CarReviewDTO:
         self.__graph_info = value
 
     def __str__(self):
-        return (f"CarReviewDTO(car_name={self.__car_name}, "
+        return (f"CarReviewDTO(car_id={self.__car_id}, "
+                f"car_name={self.__car_name}, "
                 f"avg_score={self.__avg_score}, "
                 f"survey_people_count={self.__survey_people_count}, "
                 f"graph_info={self.__graph_info})")
@@ -1,3 +1,5 @@
+-- 새 DB는 teamdb.sql(차량/조회 테이블, DB/migrations/001의 숫자 타입과 인덱스, 002의 car_model_id 포함)을 먼저 적용한 뒤 이 파일을 실행
+-- 기존 DB는 DB/migrations의 스크립트를 번호 순서대로 적용
 # DROP TABLE IF EXISTS USER_INFO;
 # DROP TABLE IF EXISTS CAR_INFO;
 # DROP TABLE IF EXISTS FUEL_TYPE_INFO;
@@ -35,6 +37,21 @@ CREATE TABLE car_recommendation_info (
     FOREIGN KEY (car_id) REFERENCES car_info(car_id)
 );
 
+-- 통계 탭용 추천 수 롤업 (DB/migrations/004, 추천 데이터를 직접 넣은 뒤에는 recommendation_stats.py compact 실행)
+create table recommendation_stats (
+    age_group varchar(10) not null,
+    user_gender varchar(10) not null,
+    user_job int not null,
+    car_id int not null,
+    reco_count int not null default 0,
+    primary key (age_group, user_gender, user_job, car_id)
+);
+
+create table recommendation_stats_state (
+    id tinyint primary key,
+    last_reco_id int not null
+);
+
 -- 차의 리뷰
 create table car_review_info (
     review_id int auto_increment primary key ,
@@ -53,7 +70,10 @@ create table comment_info (
     nickname varchar(20) not null,
     comment_avg_score float,
     comment_text varchar(300),
-    created_at varchar(20)
+    created_at varchar(20),
+    content_hash char(64) not null,
+    unique key uq_comment_review_hash (review_id, content_hash),
+    index idx_comment_review_created (review_id, created_at)
 );
 
 INSERT INTO JOB_TYPE_INFO (job_name) VALUES
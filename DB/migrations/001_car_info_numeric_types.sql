@@ -0,0 +1,33 @@
+-- car_info 숫자 컬럼 타입 변경 + 필터/정렬용 인덱스
+-- varchar(255)로 저장된 가격/출력/연비/차체 크기를 숫자 타입으로 바꿔
+-- BETWEEN 필터와 ORDER BY가 문자열이 아닌 숫자로 비교되고 인덱스를 탈 수 있게 한다.
+-- DB/teamdb.sql에는 이미 반영되어 있으므로 그 이전 덤프로 만든 DB에만 적용한다.
+-- 적용: mysql -u <user> -p teamdb < DB/migrations/001_car_info_numeric_types.sql
+
+use teamdb;
+
+-- 1. 숫자로 변환할 수 없는 값은 NULL로 정리 (빈 문자열, '-' 등)
+update car_info set car_price = null where car_price not regexp '^[0-9]+(\\.[0-9]+)?$';
+update car_info set car_horsepower = null where car_horsepower not regexp '^[0-9]+(\\.[0-9]+)?$';
+update car_info set car_fuel_efficiency = null where car_fuel_efficiency not regexp '^[0-9]+(\\.[0-9]+)?$';
+update car_info set car_size = null where car_size not regexp '^[0-9]+(\\.[0-9]+)?$';
+
+-- 2. 타입 변경 (현재 데이터: 가격 1300~4990만원, 출력 2~334, 연비 6.3~452, 크기 50.42~71.58)
+alter table car_info
+    modify car_price int,
+    modify car_horsepower int,
+    modify car_fuel_efficiency decimal(6, 1),
+    modify car_size decimal(6, 2);
+
+-- 3. 인덱스
+-- 추천(3페이지): 바디타입 분류 + 연료 + 예산 범위
+create index idx_car_info_category_fuel_price on car_info (category_id, car_fuel_type, car_price);
+-- 차량 목록(4페이지): 연료만 고른 경우
+create index idx_car_info_fuel_price on car_info (car_fuel_type, car_price);
+-- 차량 목록(4페이지): 가격순 정렬 + 페이지 이동 (동점은 car_id)
+create index idx_car_info_price_id on car_info (car_price, car_id);
+-- 분류 이름 → category_id 조회
+create index idx_body_type_info_category on body_type_info (body_type_category, category_id);
+
+-- 선호도 정렬(연비/크기/출력/평점 중 3개, 순서 60가지)은 필터 후 후보가 수십 건 이하라
+-- 정렬용 인덱스를 따로 두지 않고 filesort로 처리한다.
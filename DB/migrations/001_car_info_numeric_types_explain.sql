@@ -0,0 +1,32 @@
+-- 001 마이그레이션 적용 후 실행 계획 확인용 쿼리
+-- 실제 실행 계획은 데이터 분포와 MySQL 버전에 따라 다르므로 여기에 기대값을 적지 않는다.
+-- 실행 결과의 ci 행에서 key(사용한 인덱스)와 type(ALL이면 전체 스캔)을 확인한다.
+-- 인덱스 전후 시간 비교는 benchmarks/bench_car_info_sql.py
+
+use teamdb;
+
+-- 3페이지 추천 (바디타입 + 연료 + 예산, 선호도 정렬)
+explain
+select ci.car_id, ci.car_full_name, ci.car_price
+from car_info ci
+where ci.car_price between 2000 and 4000
+  and ci.category_id in (select category_id from body_type_info where body_type_category = 'SUV')
+  and ci.car_fuel_type in (select fuel_type_id from fuel_type_info where fuel_type_name = '가솔린')
+order by ci.car_fuel_efficiency asc, ci.car_price asc, ci.car_size desc, ci.car_id asc
+limit 3;
+
+-- 4페이지 차량 목록 (필터 없음, 가격순 페이지)
+explain
+select ci.car_id, ci.car_full_name, ci.car_price
+from car_info ci
+order by ci.car_price, ci.car_id
+limit 8 offset 16;
+
+-- 4페이지 차량 목록 (연료만 선택)
+explain
+select ci.car_id, ci.car_full_name, ci.car_price
+from car_info ci
+where ci.car_price between 1000 and 5000
+  and ci.car_fuel_type in (select fuel_type_id from fuel_type_info where fuel_type_name = '전기')
+order by ci.car_price, ci.car_id
+limit 8;
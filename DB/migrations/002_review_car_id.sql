@@ -0,0 +1,34 @@
+-- 리뷰와 차량을 car_full_name 문자열 대신 정수 키로 연결
+-- car_review_info.car_id: 리뷰 대상 모델의 대표 car_id (같은 모델이 연료 타입별로 여러 행이면 가장 작은 car_id)
+-- car_info.car_model_id: 각 행이 속한 모델의 대표 car_id (차량 → 리뷰 방향 조인용)
+-- 4번 UPDATE는 ETL(WebScraping/car_info/etl.py, _04_all_data.py)이 적재할 때마다 같은 트랜잭션에서 다시 실행한다.
+-- ETL을 거치지 않고 car_info에 행을 직접 넣었다면 4번 UPDATE를 다시 실행한다.
+-- DB/teamdb.sql에는 이미 반영되어 있으므로 그 이전 덤프로 만든 DB에만 적용한다.
+-- 적용: mysql -u <user> -p teamdb < DB/migrations/002_review_car_id.sql
+
+use teamdb;
+
+-- 1. 모델 대표 car_id 컬럼
+alter table car_info add column car_model_id int;
+
+-- 2. 차량명 → 대표 car_id로 리뷰의 car_id 채우기 (스크래퍼가 채우지 않았던 기존 행)
+update car_review_info cri
+    join (
+        select car_full_name, min(car_id) as car_id
+        from car_info
+        group by car_full_name
+    ) ci on ci.car_full_name = cri.car_name
+set cri.car_id = ci.car_id
+where cri.car_id is null;
+
+-- 3. 인덱스 (car_review_info.car_id는 FK 인덱스가 이미 있음)
+create index idx_car_info_model_id on car_info (car_model_id);
+
+-- 4. 각 차량 행에 모델 대표 car_id 채우기
+update car_info ci
+    join (
+        select car_full_name, min(car_id) as car_model_id
+        from car_info
+        group by car_full_name
+    ) m on m.car_full_name = ci.car_full_name
+set ci.car_model_id = m.car_model_id;
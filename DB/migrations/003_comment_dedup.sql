@@ -0,0 +1,31 @@
+-- 댓글 중복 제거를 조회 시점(ROW_NUMBER 윈도 함수)에서 저장 시점으로 옮김
+-- content_hash = SHA2(닉네임 + CHAR(31) + 내용) (DB/dao/comment_info_dao.comment_content_hash와 같은 값)
+-- 같은 리뷰에 같은 댓글은 한 번만 저장되고, 차량별 댓글 조회는 (review_id, created_at) 인덱스 범위 스캔
+-- 적용: mysql -u <user> -p teamdb < DB/migrations/003_comment_dedup.sql
+
+use teamdb;
+
+-- 1. 내용 해시 컬럼 추가 및 기존 행 채우기
+alter table comment_info add column content_hash char(64);
+
+update comment_info
+set content_hash = sha2(concat(coalesce(nickname, ''), char(31), coalesce(comment_text, '')), 256);
+
+-- 2. 같은 리뷰 안의 중복 댓글은 가장 최근 것만 남기고 삭제 (마이그레이션 때 한 번만)
+delete c
+from comment_info c
+    join (
+        select comment_id,
+               row_number() over (
+                   partition by review_id, content_hash
+                   order by created_at desc, comment_id desc
+               ) as rn
+        from comment_info
+    ) d on d.comment_id = c.comment_id
+where d.rn > 1;
+
+-- 3. 리뷰별 고유 제약 + 차량별 댓글 조회용 인덱스
+alter table comment_info
+    modify content_hash char(64) not null,
+    add unique key uq_comment_review_hash (review_id, content_hash),
+    add index idx_comment_review_created (review_id, created_at);
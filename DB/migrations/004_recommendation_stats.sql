@@ -0,0 +1,44 @@
+-- 통계 탭이 추천 기록 전체를 조인/집계하지 않도록 (연령대, 성별, 직업, 차량)별 추천 수 롤업 테이블 추가
+-- 연령대 구간은 streamlit/ryuuung_practice/recommendation_stats.AGE_GROUPS와 같음
+-- recommendation_stats_state.last_reco_id: 롤업에 반영된 마지막 car_recommendation_info.reco_id
+-- 이후 추가되는 추천은 save_recommendation 또는 recommendation_stats.py compact가 반영한다.
+-- 적용: mysql -u <user> -p teamdb < DB/migrations/004_recommendation_stats.sql
+
+use teamdb;
+
+-- 1. 롤업 테이블
+create table recommendation_stats (
+    age_group varchar(10) not null,
+    user_gender varchar(10) not null,
+    user_job int not null,
+    car_id int not null,
+    reco_count int not null default 0,
+    primary key (age_group, user_gender, user_job, car_id)
+);
+
+create table recommendation_stats_state (
+    id tinyint primary key,
+    last_reco_id int not null
+);
+
+-- 2. 기존 추천 기록 집계
+insert into recommendation_stats (age_group, user_gender, user_job, car_id, reco_count)
+select
+    case
+        when u.user_age <= 0 then '기타'
+        when u.user_age <= 29 then '20대'
+        when u.user_age <= 39 then '30대'
+        when u.user_age <= 49 then '40대'
+        when u.user_age <= 100 then '50대 이상'
+        else '기타'
+    end as age_group,
+    u.user_gender,
+    u.user_job,
+    r.car_id,
+    count(*)
+from car_recommendation_info r
+    join user_info u on r.user_id = u.user_id
+group by age_group, u.user_gender, u.user_job, r.car_id;
+
+insert into recommendation_stats_state (id, last_reco_id)
+select 1, coalesce(max(reco_id), 0) from car_recommendation_info;
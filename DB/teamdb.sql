@@ -27,7 +27,8 @@ CREATE TABLE `body_type_info` (
   `body_name` varchar(255) NOT NULL,
   `body_type_category` varchar(255) DEFAULT NULL,
   `category_id` int DEFAULT NULL,
-  UNIQUE KEY `body_type` (`body_name`)
+  UNIQUE KEY `body_type` (`body_name`),
+  KEY `idx_body_type_info_category` (`body_type_category`,`category_id`)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
 /*!40101 SET character_set_client = @saved_cs_client */;
 
@@ -68,6 +69,8 @@ UNLOCK TABLES;
 
 --
 -- Table structure for table `car_info`
+-- (숫자 컬럼 타입과 필터/정렬 인덱스는 DB/migrations/001_car_info_numeric_types.sql,
+--  모델 대표 car_id(car_model_id)는 DB/migrations/002_review_car_id.sql 적용 후 기준)
 --
 
 DROP TABLE IF EXISTS `car_info`;
@@ -79,17 +82,22 @@ CREATE TABLE `car_info` (
   `car_body_type` varchar(255) DEFAULT NULL,
   `category_id` int DEFAULT NULL,
   `car_fuel_type` int DEFAULT NULL,
-  `car_price` varchar(255) DEFAULT NULL,
-  `car_horsepower` varchar(255) DEFAULT NULL,
-  `car_fuel_efficiency` varchar(255) DEFAULT NULL,
+  `car_price` int DEFAULT NULL,
+  `car_horsepower` int DEFAULT NULL,
+  `car_fuel_efficiency` decimal(6,1) DEFAULT NULL,
   `car_model_year` varchar(255) DEFAULT NULL,
-  `car_size` varchar(255) DEFAULT NULL,
+  `car_size` decimal(6,2) DEFAULT NULL,
   `car_engine_type` varchar(255) DEFAULT NULL,
   `car_img_url` varchar(255) DEFAULT NULL,
   `car_brand` int DEFAULT NULL,
+  `car_model_id` int DEFAULT NULL,
   PRIMARY KEY (`car_id`),
   KEY `fk_car_brand` (`car_brand`),
   KEY `fk_car_fuel_type` (`car_fuel_type`),
+  KEY `idx_car_info_category_fuel_price` (`category_id`,`car_fuel_type`,`car_price`),
+  KEY `idx_car_info_fuel_price` (`car_fuel_type`,`car_price`),
+  KEY `idx_car_info_price_id` (`car_price`,`car_id`),
+  KEY `idx_car_info_model_id` (`car_model_id`),
   CONSTRAINT `fk_car_brand` FOREIGN KEY (`car_brand`) REFERENCES `brand_info` (`brand_id`),
   CONSTRAINT `fk_car_fuel_type` FOREIGN KEY (`car_fuel_type`) REFERENCES `fuel_type_info` (`fuel_type_id`)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
@@ -101,7 +109,7 @@ CREATE TABLE `car_info` (
 
 LOCK TABLES `car_info` WRITE;
 /*!40000 ALTER TABLE `car_info` DISABLE KEYS */;
-INSERT INTO `car_info` VALUES (1,'현대 아반떼 하이브리드','준중형 세단',2,2,'2523','141','19.2','2026','57.75','I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250415_180%2Fauto_1744680029041ctpqu_PNG%2F20250415102020_yN16Eo80.png',24),(2,'현대 아반떼 하이브리드','준중형 세단',2,10,'2523','141','19.2','2026','57.75','I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250415_180%2Fauto_1744680029041ctpqu_PNG%2F20250415102020_yN16Eo80.png',24),(3,'현대 아반떼 N','준중형 세단',2,2,'3309','280','10.4','2026','57.75','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250415_35%2Fauto_1744678295823ls0Ea_PNG%2F20250415095127_leOyG4w5.png',24),(4,'현대 아반떼','준중형 세단',2,4,'2034','120','10.2','2026','57.75','I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250415_62%2Fauto_17446810639920MTtL_PNG%2F20250415103736_XifkW3uS.png',24),(5,'현대 아반떼','준중형 세단',2,2,'2034','120','10.2','2026','57.75','I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250415_62%2Fauto_17446810639920MTtL_PNG%2F20250415103736_XifkW3uS.png',24),(6,'르노코리아 아르카나 하이브리드 E-Tech','소형 SUV',3,2,'2849','86','17','2026','59.52','I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250401_82%2Fauto_1743489031475vgTD9_PNG%2F20250401153029_11XglZrB.png',15),(7,'르노코리아 아르카나 하이브리드 E-Tech','소형 SUV',3,10,'2849','86','17','2026','59.52','I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250401_82%2Fauto_1743489031475vgTD9_PNG%2F20250401153029_11XglZrB.png',15),(8,'르노코리아 아르카나','소형 SUV',3,2,'2300','123','12.8','2026','59.52','I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250401_45%2Fauto_1743469584987B6A5z_PNG%2F20250401100616_RDsipY31.png',15),(9,'혼다 어코드','중형 세단',2,2,'4350','190','12.9','2025','56.94','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250415_17%2Fauto_1744703687479MtaAv_PNG%2F20250415165437_axBc7NIn.png',6),(10,'푸조 308','준중형 해치백',2,2,'3990','134','15.2','2025','61.19','I3 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250404_282%2Fauto_1743753114807rzpqk_PNG%2F20250404165146_YRpfJ4ze.png',4),(11,'토요타 GR 86','스포츠카 쿠페',2,2,'4248','231','9.5','2025','60.38','F4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250408_234%2Fauto_1744074885058Npwre_PNG%2F20250408101437_X95Qx7Fs.png',14),(12,'KGM 토레스 EVX','중형 SUV',3,9,'4602','4','452','2025','56.84','80.6kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250403_197%2Fauto_1743656333870E6BP4_PNG%2F20250403135837_u2NsShUP.png',13),(13,'현대 코나 하이브리드','소형 SUV',3,2,'2955','141','18.1','2025','61.15','I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250423_105%2Fauto_1745372657011BlSRG_PNG%2F20250423104405_6bHhNrfO.png',24),(14,'현대 코나 하이브리드','소형 SUV',3,10,'2955','141','18.1','2025','61.15','I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250423_105%2Fauto_1745372657011BlSRG_PNG%2F20250423104405_6bHhNrfO.png',24),(15,'현대 코나','소형 SUV',3,2,'2409','149','11.2','2025','61.15','I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250423_47%2Fauto_1745373481139gS1Bv_PNG%2F20250423105749_MGfptdKE.png',24),(16,'기아 봉고3 EV','중형 트럭',4,9,'4325','3','217','2025','54.94','60.4kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250102_256%2Fauto_1735788696915g4Nqw_PNG%2F20250102123126_O3E1LomM.png',2),(17,'현대 베뉴','소형 SUV',3,2,'1926','123','13.3','2025','62.38','I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250403_112%2Fauto_1743654513242QlQzC_PNG%2F20250403132824_ydf5h9pK.png',24),(18,'폭스바겐 골프','준중형 해치백',2,7,'3937','148','17.3','2025','61.47','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250317_14%2Fauto_1742170520231Oj7JF_PNG%2F20250317091512_DaFx7ZUF.png',18),(19,'현대 포터2 일렉트릭','중형 트럭',4,9,'4325','3','217','2025','55.04','60.4kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250312_76%2Fauto_1741739941044Eqbg3_PNG%2F20250312093849_D8Yku2ph.png',24),(20,'KGM 토레스 하이브리드','중형 SUV',3,2,'3140','150','15.3','2025','56.96','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250311_114%2Fauto_1741665902522Kbg9c_PNG%2F20250311130500_8KuF3Ine.png',13),(21,'KGM 토레스 하이브리드','중형 SUV',3,10,'3140','150','15.3','2025','56.96','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250311_114%2Fauto_1741665902522Kbg9c_PNG%2F20250311130500_8KuF3Ine.png',13),(22,'미니 해치백 C 5도어','소형 해치백',2,2,'3820','161','12.3','2025','63.57','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240911_119%2Fauto_1726025463409pqX2V_PNG%2F20240911123050_5SAySnxz.png',10),(23,'미니 에이스맨 E','소형 SUV',3,9,'4970','5','312','2025','63.77','54.2kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250114_37%2Fauto_1736816330806JYNw1_PNG%2F20250114095836_ZqRXUUUj.png',10),(24,'KGM 무쏘 칸','준대형 트럭',3,7,'3172','202','10.2','2025','59.28','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250305_100%2Fauto_1741148398229ktUNd_PNG%2F20250305131950_ebmTOsPF.png',13),(25,'KGM 무쏘 스포츠','준대형 트럭',3,7,'2952','202','10.4','2025','60.72','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250305_212%2Fauto_1741148125804voe9A_PNG%2F20250305131511_CFTEE1MD.png',13),(26,'KGM 무쏘 EV','중형 트럭',4,9,'4800','4','400','2025','61.05','80.6kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250305_7%2Fauto_1741155685297pzSms_PNG%2F20250305152124_MIRAKJQ2.png',13),(27,'기아 EV4','준중형 세단',2,9,'4192','5','354','2025','59.62','58.3~81.4kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250217_115%2Fauto_17397550842015f2oa_PNG%2F20250217101727_zLt9kImB.png',2),(28,'푸조 408','준중형 세단',2,2,'4290','131','12.9','2025','59.36','I3 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250307_198%2Fauto_1741320433153zoxJO_PNG%2F20250307130702_yEvOzAYt.png',4),(29,'토요타 라브4 하이브리드','준중형 SUV',3,2,'4415','218','14.1','2025','58.48','I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250310_258%2Fauto_17415877000205NjmY_PNG%2F20250310152107_QJOJBZ9Y.png',14),(30,'토요타 라브4 하이브리드','준중형 SUV',3,10,'4415','218','14.1','2025','58.48','I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250310_258%2Fauto_17415877000205NjmY_PNG%2F20250310152107_QJOJBZ9Y.png',14),(31,'기아 타스만','준대형 트럭',3,2,'3750','281','7.7','2025','60.44','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250213_172%2Fauto_1739407540523R8Lul_PNG%2F20250213094523_JqWwn7Nn.png',2),(32,'볼보 EX30','소형 SUV',3,9,'4755','4','351','2025','62.57','66kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250203_71%2Fauto_1738542502852MIrGc_PNG%2F20250203092810_HCQla48u.png',17),(33,'기아 EV3','소형 SUV',3,9,'3995','5','347','2025','62.33','58.3~81.4kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240604_188%2Fauto_1717465349622ABxX2_PNG%2F20240604104209_wv4mJ48r.png',2),(34,'현대 팰리세이드 하이브리드','준대형 SUV',3,2,'4968','334','11.4','2025','58.7','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250115_261%2Fauto_1736915198937kMtja_PNG%2F20250115132637_t4pyA79a.png',24),(35,'현대 팰리세이드 하이브리드','준대형 SUV',3,10,'4968','334','11.4','2025','58.7','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250115_261%2Fauto_1736915198937kMtja_PNG%2F20250115132637_t4pyA79a.png',24),(36,'현대 팰리세이드','준대형 SUV',3,2,'4383','281','8.2','2025','58.7','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241220_28%2Fauto_1734661559288yob8P_PNG%2F20241220112557_KmIjofOr.png',24),(37,'아우디 A3 세단','준중형 세단',2,2,'4353','240','11.3','2025','58.47','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250122_265%2Fauto_1737506302963SFheT_PNG%2F20250122093811_zGVBjncA.png',22),(38,'KGM 렉스턴','준대형 SUV',3,7,'3953','202','10.6','2025','59.07','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250120_84%2Fauto_1737338325385PcQYW_PNG%2F20250120105838_NIBu11xB.png',13),(39,'BYD 아토3','소형 SUV',3,9,'3150','4','321','2025','61.05','60.4kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250116_70%2Fauto_1736993150387MErNz_PNG%2F20250116110536_ACjaet3t.png',11),(40,'현대 투싼 하이브리드','준중형 SUV',3,2,'3205','235','14.3','2025','59.38','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241119_295%2Fauto_1731995446863bpUUw_PNG%2F20241119145037_2XsWxaFX.png',24),(41,'현대 투싼 하이브리드','준중형 SUV',3,10,'3205','235','14.3','2025','59.38','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241119_295%2Fauto_1731995446863bpUUw_PNG%2F20241119145037_2XsWxaFX.png',24),(42,'현대 투싼','준중형 SUV',3,2,'2729','180','11.2','2025','59.38','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241119_168%2Fauto_17319946679953O4Va_PNG%2F20241119143601_1FXKDJy9.png',24),(43,'현대 투싼','준중형 SUV',3,7,'2729','180','11.2','2025','59.38','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241119_168%2Fauto_17319946679953O4Va_PNG%2F20241119143601_1FXKDJy9.png',24),(44,'토요타 캠리 하이브리드','중형 세단',2,2,'4800','224','17.1','2025','57.42','I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241126_195%2Fauto_1732582393885gcTvI_PNG%2F20241126095312_2Ibs92Dm.png',14),(45,'토요타 캠리 하이브리드','중형 세단',2,10,'4800','224','17.1','2025','57.42','I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241126_195%2Fauto_1732582393885gcTvI_PNG%2F20241126095312_2Ibs92Dm.png',14),(46,'기아 스포티지 하이브리드','준중형 SUV',3,2,'3305','230','14.3','2025','58.8','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241105_288%2Fauto_1730782420020HRsjd_PNG%2F20241105135331_EhWRQAh8.png',2),(47,'기아 스포티지 하이브리드','준중형 SUV',3,10,'3305','230','14.3','2025','58.8','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241105_288%2Fauto_1730782420020HRsjd_PNG%2F20241105135331_EhWRQAh8.png',2),(48,'기아 스포티지','준중형 SUV',3,4,'2793','146','8.6','2025','58.8','I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241105_183%2Fauto_17307851635384INzp_PNG%2F20241105143915_n3XV3FdC.png',2),(49,'기아 스포티지','준중형 SUV',3,2,'2793','146','8.6','2025','58.8','I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241105_183%2Fauto_17307851635384INzp_PNG%2F20241105143915_n3XV3FdC.png',2),(50,'기아 K5 하이브리드','중형 세단',2,2,'3241','195','18.8','2025','58.1','I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241105_233%2Fauto_17307763369068dIzb_PNG%2F20241105121207_XhisDIil.png',2),(51,'기아 K5 하이브리드','중형 세단',2,10,'3241','195','18.8','2025','58.1','I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241105_233%2Fauto_17307763369068dIzb_PNG%2F20241105121207_XhisDIil.png',2),(52,'기아 K5','중형 세단',2,4,'2724','146','9.5','2025','58.1','I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241105_269%2Fauto_1730778350108KI52q_PNG%2F20241105124541_FrTqeuoh.png',2),(53,'기아 K5','중형 세단',2,2,'2724','146','9.5','2025','58.1','I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241105_269%2Fauto_1730778350108KI52q_PNG%2F20241105124541_FrTqeuoh.png',2),(54,'BYD T4K','중형 트럭',4,9,'4669','2','246','2024','53.67','82kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241205_272%2Fauto_17333622433530P8NM_PNG%2F20241205103033_6HSSamev.png',11),(55,'현대 캐스퍼','경형 SUV',1,2,'1450','76','12.3','2025','66.76','I3 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241017_99%2Fauto_17291437105452FLrA_PNG%2F20241017144135_hHPOmLfr.png',24),(56,'기아 카니발 하이브리드','대형 RV',3,2,'4006','245','13.5','2025','59.94','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241015_156%2Fauto_17289650437018Vzxz_PNG%2F20241015130353_f9Pi6CSr.png',2),(57,'기아 카니발 하이브리드','대형 RV',3,10,'4006','245','13.5','2025','59.94','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241015_156%2Fauto_17289650437018Vzxz_PNG%2F20241015130353_f9Pi6CSr.png',2),(58,'기아 카니발','대형 RV',3,2,'3551','194','9','2025','59.94','V6, I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241015_252%2Fauto_1728964118687n65NG_PNG%2F20241015124831_NXDWOwWA.png',2),(59,'기아 카니발','대형 RV',3,7,'3551','194','9','2025','59.94','V6, I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241015_252%2Fauto_1728964118687n65NG_PNG%2F20241015124831_NXDWOwWA.png',2),(60,'현대 쏘나타 하이브리드','중형 세단',2,2,'3232','195','17.1','2025','57.84','I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241028_171%2Fauto_1730087437467QE3Yv_PNG%2F20241028125029_0Rvl6bTg.png',24),(61,'현대 쏘나타 하이브리드','중형 세단',2,10,'3232','195','17.1','2025','57.84','I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241028_171%2Fauto_1730087437467QE3Yv_PNG%2F20241028125029_0Rvl6bTg.png',24),(62,'현대 쏘나타','중형 세단',2,4,'2788','146','9.4','2025','57.84','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241028_207%2Fauto_1730088554765OahmJ_PNG%2F20241028130905_fBh38VWA.png',24),(63,'현대 쏘나타','중형 세단',2,2,'2788','146','9.4','2025','57.84','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241028_207%2Fauto_1730088554765OahmJ_PNG%2F20241028130905_fBh38VWA.png',24),(64,'미니 해치백 S 5도어','소형 해치백',2,2,'4970','204','12.4','2025','63.57','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240612_6%2Fauto_1718157865615FovVV_PNG%2F20240612110417_3flCh19o.png',10),(65,'기아 레이 EV','경형 RV',1,9,'2735','5','205','2025','70.1','35.2kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241002_179%2Fauto_1727849544067QfUhp_PNG%2F20241002151214_jBOcgzz1.png',2),(66,'기아 레이','경형 RV',1,2,'1340','76','12.6','2025','70.1','I3 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241002_70%2Fauto_1727849324802uY8r6_PNG%2F20241002150836_4sorr0EU.png',2),(67,'기아 쏘렌토 하이브리드','중형 SUV',3,2,'3867','235','13.8','2025','58.46','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240902_209%2Fauto_1725241349332O3rrY_PNG%2F20240902104215_3at9xyMw.png',2),(68,'기아 쏘렌토 하이브리드','중형 SUV',3,10,'3867','235','13.8','2025','58.46','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240902_209%2Fauto_1725241349332O3rrY_PNG%2F20240902104215_3at9xyMw.png',2),(69,'기아 쏘렌토','중형 SUV',3,2,'3550','194','9.3','2025','58.46','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240902_300%2Fauto_1725240960172FVRkB_PNG%2F20240902103550_wZm5QO5i.png',2),(70,'기아 쏘렌토','중형 SUV',3,7,'3550','194','9.3','2025','58.46','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240902_300%2Fauto_1725240960172FVRkB_PNG%2F20240902103550_wZm5QO5i.png',2),(71,'미니 해치백 C','소형 해치백',2,2,'3740','161','12.5','2025','64.39','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240911_252%2Fauto_1726026223690IPeP1_PNG%2F20240911124336_38TLIZPj.png',10),(72,'제네시스 G70 슈팅브레이크','중형 왜건',2,2,'4476','304','10.1','2025','60.51','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241120_298%2Fauto_1732088699284VtLfx_PNG%2F20241120164445_b2twihkK.png',3),(73,'제네시스 G70','중형 세단',2,2,'4281','304','8.8','2025','60.51','I4, V6 트윈터보 트윈터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241120_73%2Fauto_1732089072389857qq_PNG%2F20241120165104_G7b8KwrP.png',3),(74,'BMW 2시리즈 액티브 투어러','준중형 RV',2,2,'4570','150','12.2','2025','60.89','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241008_144%2Fauto_1728374877151vt84M_PNG%2F20241008170746_axO7htmM.png',19),(75,'BMW 2시리즈 액티브 투어러','준중형 RV',2,7,'4570','150','12.2','2025','60.89','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241008_144%2Fauto_1728374877151vt84M_PNG%2F20241008170746_axO7htmM.png',19),(76,'혼다 CR-V','준중형 SUV',3,2,'4260','190','12.1','2025','57.39','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240806_233%2Fauto_1722907625651UhkWd_PNG%2F20240806102654_PQqbDV7Q.png',6),(77,'현대 캐스퍼 일렉트릭','소형 SUV',3,9,'2740','5','278','2025','67.45','42~49kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240701_11%2Fauto_1719807003663gLEYY_PNG%2F20240701130953_0iie48em.png',24),(78,'KGM 액티언','중형 SUV',3,4,'3344','165','8.8','2025','56.54','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240715_292%2Fauto_1721005651001duNpH_PNG%2F20240715100717_VdW1jXyB.png',13),(79,'KGM 액티언','중형 SUV',3,2,'3344','165','8.8','2025','56.54','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240715_292%2Fauto_1721005651001duNpH_PNG%2F20240715100717_VdW1jXyB.png',13),(80,'현대 싼타페 하이브리드','중형 SUV',3,2,'3870','235','13','2025','58.28','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240827_45%2Fauto_1724731875304zcS3f_PNG%2F20240827131101_HosRKCHw.png',24),(81,'현대 싼타페 하이브리드','중형 SUV',3,10,'3870','235','13','2025','58.28','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240827_45%2Fauto_1724731875304zcS3f_PNG%2F20240827131101_HosRKCHw.png',24),(82,'현대 싼타페','중형 SUV',3,2,'3492','281','9.7','2025','58.28','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240827_92%2Fauto_1724730965884QrMLu_PNG%2F20240827125553_OeCYSwvQ.png',24),(83,'볼보 XC40','준중형 SUV',3,2,'4950','197','10.3','2025','60.86','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240826_276%2Fauto_17246545593723QLEF_PNG%2F20240826154231_46i0MqSK.png',17),(84,'기아 니로 하이브리드','소형 SUV',3,2,'2756','104','19.1','2025','61.54','I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240812_22%2Fauto_1723442727554QgNO6_PNG%2F20240812150512_Vh0R4YRa.png',2),(85,'기아 니로 하이브리드','소형 SUV',3,10,'2756','104','19.1','2025','61.54','I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240812_22%2Fauto_1723442727554QgNO6_PNG%2F20240812150512_Vh0R4YRa.png',2),(86,'기아 니로 EV','소형 SUV',3,9,'4855','5','401','2025','61.54','64.8kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240812_146%2Fauto_1723441898337yNnWp_PNG%2F20240812145126_9iXN3VHe.png',2),(87,'르노코리아 그랑 콜레오스 하이브리드 E-Tech','중형 SUV',3,2,'3760','242','15','2025','59','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240718_182%2Fauto_1721268613529xF9Du_PNG%2F20240718111012_tZkLPdAV.png',15),(88,'르노코리아 그랑 콜레오스 하이브리드 E-Tech','중형 SUV',3,10,'3760','242','15','2025','59','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240718_182%2Fauto_1721268613529xF9Du_PNG%2F20240718111012_tZkLPdAV.png',15),(89,'르노코리아 그랑 콜레오스','중형 SUV',3,2,'3442','211','9.8','2025','59','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240718_295%2Fauto_1721268683423ue9zk_PNG%2F20240718111122_nn4DGce6.png',15),(90,'기아 K8 하이브리드','준대형 세단',2,2,'4206','235','16.1','2025','57.33','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240809_27%2Fauto_1723181010469Qe5Va_PNG%2F20240809142321_HzrBtWTJ.png',2),(91,'기아 K8 하이브리드','준대형 세단',2,10,'4206','235','16.1','2025','57.33','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240809_27%2Fauto_1723181010469Qe5Va_PNG%2F20240809142321_HzrBtWTJ.png',2),(92,'기아 K8','준대형 세단',2,4,'3679','198','7.8','2025','57.33','I4, V6 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240809_5%2Fauto_1723183289030q5Et7_PNG%2F20240809150112_p9rJL9eG.png',2),(93,'기아 K8','준대형 세단',2,2,'3679','198','7.8','2025','57.33','I4, V6 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240809_5%2Fauto_1723183289030q5Et7_PNG%2F20240809150112_p9rJL9eG.png',2),(94,'기아 셀토스','소형 SUV',3,2,'2114','149','10.8','2025','59.91','I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240715_272%2Fauto_1721006750719jQQ4l_PNG%2F20240715102542_BYX9292r.png',2),(95,'기아 봉고3','중형 트럭',4,4,'2025','138','6.3','2025','50.42','l4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240716_198%2Fauto_1721096983620EKazt_PNG%2F20240716112924_5IOgs69B.png',2),(96,'미니 해치백 S','소형 해치백',2,2,'4810','204','12.7','2025','64.39','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240207_70%2Fauto_1707283994768fAR6I_PNG%2F20240207143302_wPTk85Ps.png',10),(97,'메르세데스-벤츠 A클래스 세단','준중형 세단',2,2,'4890','190','12.5','2025','59.87','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240729_118%2Fauto_1722225488193WHYgD_PNG%2F20240729125800_rEzEPPUj.png',20),(98,'메르세데스-벤츠 A클래스','준중형 해치백',2,2,'4710','190','12.2','2025','61.63','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240729_169%2Fauto_1722225286205JBAOx_PNG%2F20240729125435_cK4wz8Sc.png',20),(99,'KGM 코란도 EV','준중형 SUV',3,9,'4031','4','401','2025','59.91','73.4kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240604_13%2Fauto_1717468269494680oD_PNG%2F20240604113100_YIpz78Y5.png',13),(100,'미니 컨트리맨 S','소형 SUV',3,2,'4990','204','10.8','2025','60.52','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20231122_60%2Fauto_1700639373865JXoJi_PNG%2F20231122164924_8QXuNs6p.png',10),(101,'현대 그랜저 하이브리드','준대형 세단',2,2,'4267','230','15.7','2025','57.5','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240605_43%2Fauto_1717560332397QWfqm_PNG%2F20240605130522_nHmaB0MM.png',24),(102,'현대 그랜저 하이브리드','준대형 세단',2,10,'4267','230','15.7','2025','57.5','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240605_43%2Fauto_1717560332397QWfqm_PNG%2F20240605130522_nHmaB0MM.png',24),(103,'현대 그랜저','준대형 세단',2,4,'3711','198','7.8','2025','57.5','I4, V6 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240605_35%2Fauto_1717560153564QkgGC_PNG%2F20240605130224_Nciw6nAW.png',24),(104,'현대 그랜저','준대형 세단',2,2,'3711','198','7.8','2025','57.5','I4, V6 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240605_35%2Fauto_1717560153564QkgGC_PNG%2F20240605130224_Nciw6nAW.png',24),(105,'기아 모닝','경형 해치백',1,2,'1300','76','14.7','2024','66.76','I3 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240610_220%2Fauto_1717983398814p54Dl_PNG%2F20240610103631_KZvocwCk.png',2),(106,'대창모터스 e-토비','경형 밴',1,9,'3290','5','155','2024','71.58','30kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240605_162%2Fauto_1717567636065JGmpT_PNG%2F20240605150703_nvfcEhin.png',9),(107,'KGM 토레스','중형 SUV',3,4,'2666','165','8.9','2025','56.96','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240508_223%2Fauto_1715142050200OfLPy_PNG%2F20240508132037_B6mtusGV.png',13),(108,'KGM 토레스','중형 SUV',3,2,'2666','165','8.9','2025','56.96','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240508_223%2Fauto_1715142050200OfLPy_PNG%2F20240508132037_B6mtusGV.png',13),(109,'쉐보레 트레일블레이저','소형 SUV',3,2,'2799','156','11.6','2025','59.86','I3 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240522_216%2Fauto_1716349245705w90fU_PNG%2F20240522124036_7lHwUO0p.png',1),(110,'기아 EV6','준중형 SUV',3,9,'4660','4','382','2025','61.77','62.9~84kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240514_227%2Fauto_1715648708856oK00k_PNG%2F20240514100457_jYsRIyCH.png',2),(111,'르노코리아 QM6','중형 SUV',3,4,'2565','140','8.6','2025','57.86','I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240403_95%2Fauto_1712128088933nujuz_PNG%2F20240403160807_0ENdoTlh.png',15),(112,'르노코리아 QM6','중형 SUV',3,2,'2565','140','8.6','2025','57.86','I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240403_95%2Fauto_1712128088933nujuz_PNG%2F20240403160807_0ENdoTlh.png',15),(113,'대창모터스 다니고 W','소형 트럭',4,9,'4560',NULL,'186','2024',NULL,'RR ','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240403_259%2Fauto_1712133147020QQf0l_PNG%2F20240403173217_UY6UiJrk.png',9),(114,'대창모터스 다니고 T','소형 트럭',4,9,'4360',NULL,'170','2024',NULL,'RR ','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240403_97%2Fauto_1712133058147fgHxP_PNG%2F20240403173047_enH3F4UL.png',9),(115,'대창모터스 다니고 R','소형 트럭',4,9,'4780',NULL,'186','2024',NULL,'RR ','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240403_191%2Fauto_1712132761631WKlX5_PNG%2F20240403172549_9mr0vMU5.png',9),(116,'대창모터스 다니고 L','준중형 트럭',4,9,'4310',NULL,'200','2024',NULL,'RR ','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240403_198%2Fauto_1712132655799Nbtgv_PNG%2F20240403172402_5W4upe8W.png',9),(117,'대창모터스 다니고 C','소형 트럭',4,9,'3290','3','156','2024',NULL,'RR ','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240403_76%2Fauto_1712132523306LMPt9_PNG%2F20240403172202_K7Lhi9vp.png',9),(118,'쉐보레 트랙스 크로스오버','소형 SUV',3,2,'2188','139','12','2025','59.47','I3 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240314_77%2Fauto_1710388514584jQQpT_PNG%2F20240314125500_NmLokfQg.png',1),(119,'현대 코나 일렉트릭','소형 SUV',3,9,'4142','4','311','2024','61.08','48.6~64.8kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240304_59%2Fauto_1709525254210gNcCf_PNG%2F20240304130722_T4t8Lctd.png',24),(120,'현대 아이오닉 5','준중형 SUV',3,9,'4700','4','368','2024','64.45','63~84kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240304_98%2Fauto_1709528902943jPoon_PNG%2F20240304140811_eR5d4nKx.png',24),(121,'현대 스타리아 하이브리드','대형 RV',3,2,'3433','232','12.6','2024','62.32','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240228_118%2Fauto_1709089047729ayYJO_PNG%2F20240228115714_H5CSrE7B.png',24),(122,'현대 스타리아 하이브리드','대형 RV',3,10,'3433','232','12.6','2024','62.32','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240228_118%2Fauto_1709089047729ayYJO_PNG%2F20240228115714_H5CSrE7B.png',24),(123,'현대 스타리아','대형 RV',3,4,'2637','177','6.5','2024','62.32','I4, V6 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240228_255%2Fauto_1709088802210OQw3p_PNG%2F20240228115302_ZyL3pF1E.png',24),(124,'현대 스타리아','대형 RV',3,7,'2637','177','6.5','2024','62.32','I4, V6 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240228_255%2Fauto_1709088802210OQw3p_PNG%2F20240228115302_ZyL3pF1E.png',24),(125,'제이스모빌리티 이티밴 프로','준중형 밴',4,9,'3980','5','325','2024','65.63','53.6kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241114_239%2Fauto_1731561932940NqnOc_PNG%2F20241114142519_z7quDrun.png',16),(126,'제이스모빌리티 이티밴 미니','소형 밴',4,9,'3560','5','273','2024','65.35','41.9kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241114_192%2Fauto_1731562110510cRFat_PNG%2F20241114142820_KUOHD2DY.png',16),(127,'제이스모빌리티 이티밴 라이프','소형 밴',4,9,'2698','5','273','2024','65.35','41.9kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241114_39%2Fauto_1731562377435UabKW_PNG%2F20241114143247_egqPNUHD.png',16),(128,'르노 마스터','대형 밴',4,7,'3685','150','10.5','2024','62.76','I4 트윈터보 트윈터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240513_2%2Fauto_1715562079921BGCMR_PNG%2F20240513100108_705twXix.png',7),(129,'토요타 프리우스 플러그인 하이브리드','준중형 해치백',2,9,'4630','223','19.4','2024','59.78','I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20231213_239%2Fauto_1702428714401Y61Hb_PNG%2F20231213095143_mrfOWoCw.png',14),(130,'토요타 프리우스 플러그인 하이브리드','준중형 해치백',2,2,'4630','223','19.4','2024','59.78','I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20231213_239%2Fauto_1702428714401Y61Hb_PNG%2F20231213095143_mrfOWoCw.png',14),(131,'토요타 프리우스 플러그인 하이브리드','준중형 해치백',2,10,'4630','223','19.4','2024','59.78','I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20231213_239%2Fauto_1702428714401Y61Hb_PNG%2F20231213095143_mrfOWoCw.png',14),(132,'토요타 프리우스','준중형 해치백',2,2,'3990','196','20.9','2024','59.78','I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20231213_284%2Fauto_1702428199382FBcWA_PNG%2F20231213094306_6zhCh7AI.png',14),(133,'토요타 프리우스','준중형 해치백',2,10,'3990','196','20.9','2024','59.78','I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20231213_284%2Fauto_1702428199382FBcWA_PNG%2F20231213094306_6zhCh7AI.png',14),(134,'모빌리티네트웍스 쎄아 베이스캠프','중형 밴',4,9,'4307','3','184','2023','63.85','41.8kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240826_37%2Fauto_1724648100312MsLGz_PNG%2F20240826135449_yLQvDcNq.png',8),(135,'푸조 5008','중형 SUV',3,2,'4600','130','12.1','2024','61.08','I3 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20231122_101%2Fauto_1700633082425wkY9f_PNG%2F20231122150414_D3SLtPjr.png',4),(136,'현대 포터2','중형 트럭',4,4,'2028','138','6.3','2024','50.89','l4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20231122_191%2Fauto_17006315941352bVkU_PNG%2F20231122143945_CrFFeioN.png',24),(137,'푸조 3008','준중형 SUV',3,2,'4220','130','12.2','2024','60.04','I3 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20231027_40%2Fauto_1698388698523gC9cH_PNG%2F20231027153805_LMCbeDD5.png',4),(138,'KGM 코란도','준중형 SUV',3,4,'2410','165','9','2024','60.11','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20231010_2%2Fauto_1696899992578FmDOr_PNG%2F20231010100629_O2inv3gM.png',13),(139,'KGM 코란도','준중형 SUV',3,2,'2410','165','9','2024','60.11','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20231010_2%2Fauto_1696899992578FmDOr_PNG%2F20231010100629_O2inv3gM.png',13),(140,'BMW 2시리즈 그란쿠페','준중형 세단',2,2,'4900','192','10.4','2024','59.01','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20231024_291%2Fauto_1698127128060QrAju_PNG%2F20231024145839_yfrHUrlx.png',19),(141,'BMW 1시리즈','준중형 해치백',2,2,'4730','192','10','2024','61.81','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20231024_174%2Fauto_1698127069433PPmCw_PNG%2F20231024145741_7uNuS6Lk.png',19),(142,'지프 레니게이드','소형 SUV',3,2,'4550','171','10.4','2023','60.4','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241203_281%2Fauto_17331873732003S1bl_PNG%2F20241203095603_yGPNDexi.png',25),(143,'캠시스 CEVO-C SE','경형 해치백',1,9,'1690','6','69','2024','64.81','10.1kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20230911_125%2Fauto_1694406348265Imq1C_PNG%2F20230911132537_DtSvTqHf.png',23),(144,'현대 아이오닉 6','중형 세단',2,9,'4695','5','367','2024','60.76','53~77.4kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20230908_40%2Fauto_1694137242440YwuIn_PNG%2F20230908104033_crzsLzD9.png',24),(145,'모빌리티네트웍스 쎄아','중형 밴',4,9,'3980','3','184','2023','63.85','41.8kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240826_262%2Fauto_1724648006724rHHeR_PNG%2F20240826135315_aVdQ6dj1.png',8),(146,'마이브 M1','경형 해치백',1,9,'1892','5','57','2023','63.8','10kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20230706_171%2Fauto_1688605870100PCPd2_PNG%2F20230706101100_xwgY8xVn.png',5),(147,'KGM 티볼리','소형 SUV',3,4,'1872','126','9.4','2024','61.54','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20230601_1%2Fauto_1685582924851ArG94_PNG%2F20230601102837_PRlHuhFR.png',13),(148,'KGM 티볼리','소형 SUV',3,2,'1872','126','9.4','2024','61.54','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20230601_1%2Fauto_1685582924851ArG94_PNG%2F20230601102837_PRlHuhFR.png',13),(149,'미니 클럽맨','소형 왜건',2,2,'4370','136','11.5','2024','62.59','I3 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20230613_222%2Fauto_1686641126457rVLgO_PNG%2F20230613162518_Xnh6d0Vr.png',10),(150,'미니 컨버터블','소형 컨버터블',2,2,'4700','136','12.1','2024','64.55','I3 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20230613_97%2Fauto_1686640302773kUXS2_PNG%2F20230613161129_hujX7zlN.png',10),(151,'르노코리아 SM6','중형 세단',2,4,'2797','140','9.5','2024','57.88','I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20230406_128%2Fauto_1680742809898xtdfB_PNG%2F20230406095957_9cDq8uI3.png',15),(152,'르노코리아 SM6','중형 세단',2,2,'2797','140','9.5','2024','57.88','I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20230406_128%2Fauto_1680742809898xtdfB_PNG%2F20230406095957_9cDq8uI3.png',15),(153,'기아 니로 플러스','소형 SUV',3,9,'4755','5','392','2024','61.57','64kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20230208_226%2Fauto_1675816576423hWFSw_PNG%2F20230208093603_x44xFQFx.png',2),(154,'푸조 E-2008','소형 SUV',3,9,'3890','4','260','2023','60.51','50kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20230224_197%2Fauto_16772198103922oM9w_PNG%2F20230224152319_sZFZWEfB.png',4),(155,'SS모터스 젤라 EV','중형 트럭',4,9,'4180','2','194','2022','51.38','66.8kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20220609_105%2Fauto_1654734930848CMCgY_PNG%2F20220609093518_0YYKOiiQ.png',21),(156,'동풍소콘 펜곤 ix5','중형 SUV',3,2,'2380','150','9.8','2020','59.55','I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20191004_60%2Fauto_15701612805014klUm_PNG%2F20191004125425_UYB1Ea5L.png',12);
+INSERT INTO `car_info` VALUES (1,'현대 아반떼 하이브리드','준중형 세단',2,2,2523,141,19.2,'2026',57.75,'I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250415_180%2Fauto_1744680029041ctpqu_PNG%2F20250415102020_yN16Eo80.png',24,1),(2,'현대 아반떼 하이브리드','준중형 세단',2,10,2523,141,19.2,'2026',57.75,'I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250415_180%2Fauto_1744680029041ctpqu_PNG%2F20250415102020_yN16Eo80.png',24,1),(3,'현대 아반떼 N','준중형 세단',2,2,3309,280,10.4,'2026',57.75,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250415_35%2Fauto_1744678295823ls0Ea_PNG%2F20250415095127_leOyG4w5.png',24,3),(4,'현대 아반떼','준중형 세단',2,4,2034,120,10.2,'2026',57.75,'I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250415_62%2Fauto_17446810639920MTtL_PNG%2F20250415103736_XifkW3uS.png',24,4),(5,'현대 아반떼','준중형 세단',2,2,2034,120,10.2,'2026',57.75,'I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250415_62%2Fauto_17446810639920MTtL_PNG%2F20250415103736_XifkW3uS.png',24,4),(6,'르노코리아 아르카나 하이브리드 E-Tech','소형 SUV',3,2,2849,86,17,'2026',59.52,'I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250401_82%2Fauto_1743489031475vgTD9_PNG%2F20250401153029_11XglZrB.png',15,6),(7,'르노코리아 아르카나 하이브리드 E-Tech','소형 SUV',3,10,2849,86,17,'2026',59.52,'I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250401_82%2Fauto_1743489031475vgTD9_PNG%2F20250401153029_11XglZrB.png',15,6),(8,'르노코리아 아르카나','소형 SUV',3,2,2300,123,12.8,'2026',59.52,'I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250401_45%2Fauto_1743469584987B6A5z_PNG%2F20250401100616_RDsipY31.png',15,8),(9,'혼다 어코드','중형 세단',2,2,4350,190,12.9,'2025',56.94,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250415_17%2Fauto_1744703687479MtaAv_PNG%2F20250415165437_axBc7NIn.png',6,9),(10,'푸조 308','준중형 해치백',2,2,3990,134,15.2,'2025',61.19,'I3 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250404_282%2Fauto_1743753114807rzpqk_PNG%2F20250404165146_YRpfJ4ze.png',4,10),(11,'토요타 GR 86','스포츠카 쿠페',2,2,4248,231,9.5,'2025',60.38,'F4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250408_234%2Fauto_1744074885058Npwre_PNG%2F20250408101437_X95Qx7Fs.png',14,11),(12,'KGM 토레스 EVX','중형 SUV',3,9,4602,4,452,'2025',56.84,'80.6kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250403_197%2Fauto_1743656333870E6BP4_PNG%2F20250403135837_u2NsShUP.png',13,12),(13,'현대 코나 하이브리드','소형 SUV',3,2,2955,141,18.1,'2025',61.15,'I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250423_105%2Fauto_1745372657011BlSRG_PNG%2F20250423104405_6bHhNrfO.png',24,13),(14,'현대 코나 하이브리드','소형 SUV',3,10,2955,141,18.1,'2025',61.15,'I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250423_105%2Fauto_1745372657011BlSRG_PNG%2F20250423104405_6bHhNrfO.png',24,13),(15,'현대 코나','소형 SUV',3,2,2409,149,11.2,'2025',61.15,'I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250423_47%2Fauto_1745373481139gS1Bv_PNG%2F20250423105749_MGfptdKE.png',24,15),(16,'기아 봉고3 EV','중형 트럭',4,9,4325,3,217,'2025',54.94,'60.4kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250102_256%2Fauto_1735788696915g4Nqw_PNG%2F20250102123126_O3E1LomM.png',2,16),(17,'현대 베뉴','소형 SUV',3,2,1926,123,13.3,'2025',62.38,'I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250403_112%2Fauto_1743654513242QlQzC_PNG%2F20250403132824_ydf5h9pK.png',24,17),(18,'폭스바겐 골프','준중형 해치백',2,7,3937,148,17.3,'2025',61.47,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250317_14%2Fauto_1742170520231Oj7JF_PNG%2F20250317091512_DaFx7ZUF.png',18,18),(19,'현대 포터2 일렉트릭','중형 트럭',4,9,4325,3,217,'2025',55.04,'60.4kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250312_76%2Fauto_1741739941044Eqbg3_PNG%2F20250312093849_D8Yku2ph.png',24,19),(20,'KGM 토레스 하이브리드','중형 SUV',3,2,3140,150,15.3,'2025',56.96,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250311_114%2Fauto_1741665902522Kbg9c_PNG%2F20250311130500_8KuF3Ine.png',13,20),(21,'KGM 토레스 하이브리드','중형 SUV',3,10,3140,150,15.3,'2025',56.96,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250311_114%2Fauto_1741665902522Kbg9c_PNG%2F20250311130500_8KuF3Ine.png',13,20),(22,'미니 해치백 C 5도어','소형 해치백',2,2,3820,161,12.3,'2025',63.57,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240911_119%2Fauto_1726025463409pqX2V_PNG%2F20240911123050_5SAySnxz.png',10,22),(23,'미니 에이스맨 E','소형 SUV',3,9,4970,5,312,'2025',63.77,'54.2kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250114_37%2Fauto_1736816330806JYNw1_PNG%2F20250114095836_ZqRXUUUj.png',10,23),(24,'KGM 무쏘 칸','준대형 트럭',3,7,3172,202,10.2,'2025',59.28,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250305_100%2Fauto_1741148398229ktUNd_PNG%2F20250305131950_ebmTOsPF.png',13,24),(25,'KGM 무쏘 스포츠','준대형 트럭',3,7,2952,202,10.4,'2025',60.72,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250305_212%2Fauto_1741148125804voe9A_PNG%2F20250305131511_CFTEE1MD.png',13,25),(26,'KGM 무쏘 EV','중형 트럭',4,9,4800,4,400,'2025',61.05,'80.6kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250305_7%2Fauto_1741155685297pzSms_PNG%2F20250305152124_MIRAKJQ2.png',13,26),(27,'기아 EV4','준중형 세단',2,9,4192,5,354,'2025',59.62,'58.3~81.4kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250217_115%2Fauto_17397550842015f2oa_PNG%2F20250217101727_zLt9kImB.png',2,27),(28,'푸조 408','준중형 세단',2,2,4290,131,12.9,'2025',59.36,'I3 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250307_198%2Fauto_1741320433153zoxJO_PNG%2F20250307130702_yEvOzAYt.png',4,28),(29,'토요타 라브4 하이브리드','준중형 SUV',3,2,4415,218,14.1,'2025',58.48,'I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250310_258%2Fauto_17415877000205NjmY_PNG%2F20250310152107_QJOJBZ9Y.png',14,29),(30,'토요타 라브4 하이브리드','준중형 SUV',3,10,4415,218,14.1,'2025',58.48,'I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250310_258%2Fauto_17415877000205NjmY_PNG%2F20250310152107_QJOJBZ9Y.png',14,29),(31,'기아 타스만','준대형 트럭',3,2,3750,281,7.7,'2025',60.44,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250213_172%2Fauto_1739407540523R8Lul_PNG%2F20250213094523_JqWwn7Nn.png',2,31),(32,'볼보 EX30','소형 SUV',3,9,4755,4,351,'2025',62.57,'66kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250203_71%2Fauto_1738542502852MIrGc_PNG%2F20250203092810_HCQla48u.png',17,32),(33,'기아 EV3','소형 SUV',3,9,3995,5,347,'2025',62.33,'58.3~81.4kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240604_188%2Fauto_1717465349622ABxX2_PNG%2F20240604104209_wv4mJ48r.png',2,33),(34,'현대 팰리세이드 하이브리드','준대형 SUV',3,2,4968,334,11.4,'2025',58.7,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250115_261%2Fauto_1736915198937kMtja_PNG%2F20250115132637_t4pyA79a.png',24,34),(35,'현대 팰리세이드 하이브리드','준대형 SUV',3,10,4968,334,11.4,'2025',58.7,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250115_261%2Fauto_1736915198937kMtja_PNG%2F20250115132637_t4pyA79a.png',24,34),(36,'현대 팰리세이드','준대형 SUV',3,2,4383,281,8.2,'2025',58.7,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241220_28%2Fauto_1734661559288yob8P_PNG%2F20241220112557_KmIjofOr.png',24,36),(37,'아우디 A3 세단','준중형 세단',2,2,4353,240,11.3,'2025',58.47,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250122_265%2Fauto_1737506302963SFheT_PNG%2F20250122093811_zGVBjncA.png',22,37),(38,'KGM 렉스턴','준대형 SUV',3,7,3953,202,10.6,'2025',59.07,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250120_84%2Fauto_1737338325385PcQYW_PNG%2F20250120105838_NIBu11xB.png',13,38),(39,'BYD 아토3','소형 SUV',3,9,3150,4,321,'2025',61.05,'60.4kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20250116_70%2Fauto_1736993150387MErNz_PNG%2F20250116110536_ACjaet3t.png',11,39),(40,'현대 투싼 하이브리드','준중형 SUV',3,2,3205,235,14.3,'2025',59.38,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241119_295%2Fauto_1731995446863bpUUw_PNG%2F20241119145037_2XsWxaFX.png',24,40),(41,'현대 투싼 하이브리드','준중형 SUV',3,10,3205,235,14.3,'2025',59.38,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241119_295%2Fauto_1731995446863bpUUw_PNG%2F20241119145037_2XsWxaFX.png',24,40),(42,'현대 투싼','준중형 SUV',3,2,2729,180,11.2,'2025',59.38,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241119_168%2Fauto_17319946679953O4Va_PNG%2F20241119143601_1FXKDJy9.png',24,42),(43,'현대 투싼','준중형 SUV',3,7,2729,180,11.2,'2025',59.38,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241119_168%2Fauto_17319946679953O4Va_PNG%2F20241119143601_1FXKDJy9.png',24,42),(44,'토요타 캠리 하이브리드','중형 세단',2,2,4800,224,17.1,'2025',57.42,'I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241126_195%2Fauto_1732582393885gcTvI_PNG%2F20241126095312_2Ibs92Dm.png',14,44),(45,'토요타 캠리 하이브리드','중형 세단',2,10,4800,224,17.1,'2025',57.42,'I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241126_195%2Fauto_1732582393885gcTvI_PNG%2F20241126095312_2Ibs92Dm.png',14,44),(46,'기아 스포티지 하이브리드','준중형 SUV',3,2,3305,230,14.3,'2025',58.8,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241105_288%2Fauto_1730782420020HRsjd_PNG%2F20241105135331_EhWRQAh8.png',2,46),(47,'기아 스포티지 하이브리드','준중형 SUV',3,10,3305,230,14.3,'2025',58.8,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241105_288%2Fauto_1730782420020HRsjd_PNG%2F20241105135331_EhWRQAh8.png',2,46),(48,'기아 스포티지','준중형 SUV',3,4,2793,146,8.6,'2025',58.8,'I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241105_183%2Fauto_17307851635384INzp_PNG%2F20241105143915_n3XV3FdC.png',2,48),(49,'기아 스포티지','준중형 SUV',3,2,2793,146,8.6,'2025',58.8,'I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241105_183%2Fauto_17307851635384INzp_PNG%2F20241105143915_n3XV3FdC.png',2,48),(50,'기아 K5 하이브리드','중형 세단',2,2,3241,195,18.8,'2025',58.1,'I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241105_233%2Fauto_17307763369068dIzb_PNG%2F20241105121207_XhisDIil.png',2,50),(51,'기아 K5 하이브리드','중형 세단',2,10,3241,195,18.8,'2025',58.1,'I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241105_233%2Fauto_17307763369068dIzb_PNG%2F20241105121207_XhisDIil.png',2,50),(52,'기아 K5','중형 세단',2,4,2724,146,9.5,'2025',58.1,'I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241105_269%2Fauto_1730778350108KI52q_PNG%2F20241105124541_FrTqeuoh.png',2,52),(53,'기아 K5','중형 세단',2,2,2724,146,9.5,'2025',58.1,'I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241105_269%2Fauto_1730778350108KI52q_PNG%2F20241105124541_FrTqeuoh.png',2,52),(54,'BYD T4K','중형 트럭',4,9,4669,2,246,'2024',53.67,'82kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241205_272%2Fauto_17333622433530P8NM_PNG%2F20241205103033_6HSSamev.png',11,54),(55,'현대 캐스퍼','경형 SUV',1,2,1450,76,12.3,'2025',66.76,'I3 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241017_99%2Fauto_17291437105452FLrA_PNG%2F20241017144135_hHPOmLfr.png',24,55),(56,'기아 카니발 하이브리드','대형 RV',3,2,4006,245,13.5,'2025',59.94,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241015_156%2Fauto_17289650437018Vzxz_PNG%2F20241015130353_f9Pi6CSr.png',2,56),(57,'기아 카니발 하이브리드','대형 RV',3,10,4006,245,13.5,'2025',59.94,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241015_156%2Fauto_17289650437018Vzxz_PNG%2F20241015130353_f9Pi6CSr.png',2,56),(58,'기아 카니발','대형 RV',3,2,3551,194,9,'2025',59.94,'V6, I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241015_252%2Fauto_1728964118687n65NG_PNG%2F20241015124831_NXDWOwWA.png',2,58),(59,'기아 카니발','대형 RV',3,7,3551,194,9,'2025',59.94,'V6, I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241015_252%2Fauto_1728964118687n65NG_PNG%2F20241015124831_NXDWOwWA.png',2,58),(60,'현대 쏘나타 하이브리드','중형 세단',2,2,3232,195,17.1,'2025',57.84,'I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241028_171%2Fauto_1730087437467QE3Yv_PNG%2F20241028125029_0Rvl6bTg.png',24,60),(61,'현대 쏘나타 하이브리드','중형 세단',2,10,3232,195,17.1,'2025',57.84,'I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241028_171%2Fauto_1730087437467QE3Yv_PNG%2F20241028125029_0Rvl6bTg.png',24,60),(62,'현대 쏘나타','중형 세단',2,4,2788,146,9.4,'2025',57.84,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241028_207%2Fauto_1730088554765OahmJ_PNG%2F20241028130905_fBh38VWA.png',24,62),(63,'현대 쏘나타','중형 세단',2,2,2788,146,9.4,'2025',57.84,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241028_207%2Fauto_1730088554765OahmJ_PNG%2F20241028130905_fBh38VWA.png',24,62),(64,'미니 해치백 S 5도어','소형 해치백',2,2,4970,204,12.4,'2025',63.57,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240612_6%2Fauto_1718157865615FovVV_PNG%2F20240612110417_3flCh19o.png',10,64),(65,'기아 레이 EV','경형 RV',1,9,2735,5,205,'2025',70.1,'35.2kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241002_179%2Fauto_1727849544067QfUhp_PNG%2F20241002151214_jBOcgzz1.png',2,65),(66,'기아 레이','경형 RV',1,2,1340,76,12.6,'2025',70.1,'I3 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241002_70%2Fauto_1727849324802uY8r6_PNG%2F20241002150836_4sorr0EU.png',2,66),(67,'기아 쏘렌토 하이브리드','중형 SUV',3,2,3867,235,13.8,'2025',58.46,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240902_209%2Fauto_1725241349332O3rrY_PNG%2F20240902104215_3at9xyMw.png',2,67),(68,'기아 쏘렌토 하이브리드','중형 SUV',3,10,3867,235,13.8,'2025',58.46,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240902_209%2Fauto_1725241349332O3rrY_PNG%2F20240902104215_3at9xyMw.png',2,67),(69,'기아 쏘렌토','중형 SUV',3,2,3550,194,9.3,'2025',58.46,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240902_300%2Fauto_1725240960172FVRkB_PNG%2F20240902103550_wZm5QO5i.png',2,69),(70,'기아 쏘렌토','중형 SUV',3,7,3550,194,9.3,'2025',58.46,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240902_300%2Fauto_1725240960172FVRkB_PNG%2F20240902103550_wZm5QO5i.png',2,69),(71,'미니 해치백 C','소형 해치백',2,2,3740,161,12.5,'2025',64.39,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240911_252%2Fauto_1726026223690IPeP1_PNG%2F20240911124336_38TLIZPj.png',10,71),(72,'제네시스 G70 슈팅브레이크','중형 왜건',2,2,4476,304,10.1,'2025',60.51,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241120_298%2Fauto_1732088699284VtLfx_PNG%2F20241120164445_b2twihkK.png',3,72),(73,'제네시스 G70','중형 세단',2,2,4281,304,8.8,'2025',60.51,'I4, V6 트윈터보 트윈터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241120_73%2Fauto_1732089072389857qq_PNG%2F20241120165104_G7b8KwrP.png',3,73),(74,'BMW 2시리즈 액티브 투어러','준중형 RV',2,2,4570,150,12.2,'2025',60.89,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241008_144%2Fauto_1728374877151vt84M_PNG%2F20241008170746_axO7htmM.png',19,74),(75,'BMW 2시리즈 액티브 투어러','준중형 RV',2,7,4570,150,12.2,'2025',60.89,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241008_144%2Fauto_1728374877151vt84M_PNG%2F20241008170746_axO7htmM.png',19,74),(76,'혼다 CR-V','준중형 SUV',3,2,4260,190,12.1,'2025',57.39,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240806_233%2Fauto_1722907625651UhkWd_PNG%2F20240806102654_PQqbDV7Q.png',6,76),(77,'현대 캐스퍼 일렉트릭','소형 SUV',3,9,2740,5,278,'2025',67.45,'42~49kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240701_11%2Fauto_1719807003663gLEYY_PNG%2F20240701130953_0iie48em.png',24,77),(78,'KGM 액티언','중형 SUV',3,4,3344,165,8.8,'2025',56.54,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240715_292%2Fauto_1721005651001duNpH_PNG%2F20240715100717_VdW1jXyB.png',13,78),(79,'KGM 액티언','중형 SUV',3,2,3344,165,8.8,'2025',56.54,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240715_292%2Fauto_1721005651001duNpH_PNG%2F20240715100717_VdW1jXyB.png',13,78),(80,'현대 싼타페 하이브리드','중형 SUV',3,2,3870,235,13,'2025',58.28,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240827_45%2Fauto_1724731875304zcS3f_PNG%2F20240827131101_HosRKCHw.png',24,80),(81,'현대 싼타페 하이브리드','중형 SUV',3,10,3870,235,13,'2025',58.28,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240827_45%2Fauto_1724731875304zcS3f_PNG%2F20240827131101_HosRKCHw.png',24,80),(82,'현대 싼타페','중형 SUV',3,2,3492,281,9.7,'2025',58.28,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240827_92%2Fauto_1724730965884QrMLu_PNG%2F20240827125553_OeCYSwvQ.png',24,82),(83,'볼보 XC40','준중형 SUV',3,2,4950,197,10.3,'2025',60.86,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240826_276%2Fauto_17246545593723QLEF_PNG%2F20240826154231_46i0MqSK.png',17,83),(84,'기아 니로 하이브리드','소형 SUV',3,2,2756,104,19.1,'2025',61.54,'I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240812_22%2Fauto_1723442727554QgNO6_PNG%2F20240812150512_Vh0R4YRa.png',2,84),(85,'기아 니로 하이브리드','소형 SUV',3,10,2756,104,19.1,'2025',61.54,'I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240812_22%2Fauto_1723442727554QgNO6_PNG%2F20240812150512_Vh0R4YRa.png',2,84),(86,'기아 니로 EV','소형 SUV',3,9,4855,5,401,'2025',61.54,'64.8kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240812_146%2Fauto_1723441898337yNnWp_PNG%2F20240812145126_9iXN3VHe.png',2,86),(87,'르노코리아 그랑 콜레오스 하이브리드 E-Tech','중형 SUV',3,2,3760,242,15,'2025',59,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240718_182%2Fauto_1721268613529xF9Du_PNG%2F20240718111012_tZkLPdAV.png',15,87),(88,'르노코리아 그랑 콜레오스 하이브리드 E-Tech','중형 SUV',3,10,3760,242,15,'2025',59,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240718_182%2Fauto_1721268613529xF9Du_PNG%2F20240718111012_tZkLPdAV.png',15,87),(89,'르노코리아 그랑 콜레오스','중형 SUV',3,2,3442,211,9.8,'2025',59,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240718_295%2Fauto_1721268683423ue9zk_PNG%2F20240718111122_nn4DGce6.png',15,89),(90,'기아 K8 하이브리드','준대형 세단',2,2,4206,235,16.1,'2025',57.33,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240809_27%2Fauto_1723181010469Qe5Va_PNG%2F20240809142321_HzrBtWTJ.png',2,90),(91,'기아 K8 하이브리드','준대형 세단',2,10,4206,235,16.1,'2025',57.33,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240809_27%2Fauto_1723181010469Qe5Va_PNG%2F20240809142321_HzrBtWTJ.png',2,90),(92,'기아 K8','준대형 세단',2,4,3679,198,7.8,'2025',57.33,'I4, V6 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240809_5%2Fauto_1723183289030q5Et7_PNG%2F20240809150112_p9rJL9eG.png',2,92),(93,'기아 K8','준대형 세단',2,2,3679,198,7.8,'2025',57.33,'I4, V6 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240809_5%2Fauto_1723183289030q5Et7_PNG%2F20240809150112_p9rJL9eG.png',2,92),(94,'기아 셀토스','소형 SUV',3,2,2114,149,10.8,'2025',59.91,'I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240715_272%2Fauto_1721006750719jQQ4l_PNG%2F20240715102542_BYX9292r.png',2,94),(95,'기아 봉고3','중형 트럭',4,4,2025,138,6.3,'2025',50.42,'l4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240716_198%2Fauto_1721096983620EKazt_PNG%2F20240716112924_5IOgs69B.png',2,95),(96,'미니 해치백 S','소형 해치백',2,2,4810,204,12.7,'2025',64.39,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240207_70%2Fauto_1707283994768fAR6I_PNG%2F20240207143302_wPTk85Ps.png',10,96),(97,'메르세데스-벤츠 A클래스 세단','준중형 세단',2,2,4890,190,12.5,'2025',59.87,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240729_118%2Fauto_1722225488193WHYgD_PNG%2F20240729125800_rEzEPPUj.png',20,97),(98,'메르세데스-벤츠 A클래스','준중형 해치백',2,2,4710,190,12.2,'2025',61.63,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240729_169%2Fauto_1722225286205JBAOx_PNG%2F20240729125435_cK4wz8Sc.png',20,98),(99,'KGM 코란도 EV','준중형 SUV',3,9,4031,4,401,'2025',59.91,'73.4kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240604_13%2Fauto_1717468269494680oD_PNG%2F20240604113100_YIpz78Y5.png',13,99),(100,'미니 컨트리맨 S','소형 SUV',3,2,4990,204,10.8,'2025',60.52,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20231122_60%2Fauto_1700639373865JXoJi_PNG%2F20231122164924_8QXuNs6p.png',10,100),(101,'현대 그랜저 하이브리드','준대형 세단',2,2,4267,230,15.7,'2025',57.5,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240605_43%2Fauto_1717560332397QWfqm_PNG%2F20240605130522_nHmaB0MM.png',24,101),(102,'현대 그랜저 하이브리드','준대형 세단',2,10,4267,230,15.7,'2025',57.5,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240605_43%2Fauto_1717560332397QWfqm_PNG%2F20240605130522_nHmaB0MM.png',24,101),(103,'현대 그랜저','준대형 세단',2,4,3711,198,7.8,'2025',57.5,'I4, V6 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240605_35%2Fauto_1717560153564QkgGC_PNG%2F20240605130224_Nciw6nAW.png',24,103),(104,'현대 그랜저','준대형 세단',2,2,3711,198,7.8,'2025',57.5,'I4, V6 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240605_35%2Fauto_1717560153564QkgGC_PNG%2F20240605130224_Nciw6nAW.png',24,103),(105,'기아 모닝','경형 해치백',1,2,1300,76,14.7,'2024',66.76,'I3 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240610_220%2Fauto_1717983398814p54Dl_PNG%2F20240610103631_KZvocwCk.png',2,105),(106,'대창모터스 e-토비','경형 밴',1,9,3290,5,155,'2024',71.58,'30kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240605_162%2Fauto_1717567636065JGmpT_PNG%2F20240605150703_nvfcEhin.png',9,106),(107,'KGM 토레스','중형 SUV',3,4,2666,165,8.9,'2025',56.96,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240508_223%2Fauto_1715142050200OfLPy_PNG%2F20240508132037_B6mtusGV.png',13,107),(108,'KGM 토레스','중형 SUV',3,2,2666,165,8.9,'2025',56.96,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240508_223%2Fauto_1715142050200OfLPy_PNG%2F20240508132037_B6mtusGV.png',13,107),(109,'쉐보레 트레일블레이저','소형 SUV',3,2,2799,156,11.6,'2025',59.86,'I3 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240522_216%2Fauto_1716349245705w90fU_PNG%2F20240522124036_7lHwUO0p.png',1,109),(110,'기아 EV6','준중형 SUV',3,9,4660,4,382,'2025',61.77,'62.9~84kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240514_227%2Fauto_1715648708856oK00k_PNG%2F20240514100457_jYsRIyCH.png',2,110),(111,'르노코리아 QM6','중형 SUV',3,4,2565,140,8.6,'2025',57.86,'I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240403_95%2Fauto_1712128088933nujuz_PNG%2F20240403160807_0ENdoTlh.png',15,111),(112,'르노코리아 QM6','중형 SUV',3,2,2565,140,8.6,'2025',57.86,'I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240403_95%2Fauto_1712128088933nujuz_PNG%2F20240403160807_0ENdoTlh.png',15,111),(113,'대창모터스 다니고 W','소형 트럭',4,9,4560,NULL,186,'2024',NULL,'RR ','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240403_259%2Fauto_1712133147020QQf0l_PNG%2F20240403173217_UY6UiJrk.png',9,113),(114,'대창모터스 다니고 T','소형 트럭',4,9,4360,NULL,170,'2024',NULL,'RR ','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240403_97%2Fauto_1712133058147fgHxP_PNG%2F20240403173047_enH3F4UL.png',9,114),(115,'대창모터스 다니고 R','소형 트럭',4,9,4780,NULL,186,'2024',NULL,'RR ','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240403_191%2Fauto_1712132761631WKlX5_PNG%2F20240403172549_9mr0vMU5.png',9,115),(116,'대창모터스 다니고 L','준중형 트럭',4,9,4310,NULL,200,'2024',NULL,'RR ','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240403_198%2Fauto_1712132655799Nbtgv_PNG%2F20240403172402_5W4upe8W.png',9,116),(117,'대창모터스 다니고 C','소형 트럭',4,9,3290,3,156,'2024',NULL,'RR ','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240403_76%2Fauto_1712132523306LMPt9_PNG%2F20240403172202_K7Lhi9vp.png',9,117),(118,'쉐보레 트랙스 크로스오버','소형 SUV',3,2,2188,139,12,'2025',59.47,'I3 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240314_77%2Fauto_1710388514584jQQpT_PNG%2F20240314125500_NmLokfQg.png',1,118),(119,'현대 코나 일렉트릭','소형 SUV',3,9,4142,4,311,'2024',61.08,'48.6~64.8kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240304_59%2Fauto_1709525254210gNcCf_PNG%2F20240304130722_T4t8Lctd.png',24,119),(120,'현대 아이오닉 5','준중형 SUV',3,9,4700,4,368,'2024',64.45,'63~84kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240304_98%2Fauto_1709528902943jPoon_PNG%2F20240304140811_eR5d4nKx.png',24,120),(121,'현대 스타리아 하이브리드','대형 RV',3,2,3433,232,12.6,'2024',62.32,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240228_118%2Fauto_1709089047729ayYJO_PNG%2F20240228115714_H5CSrE7B.png',24,121),(122,'현대 스타리아 하이브리드','대형 RV',3,10,3433,232,12.6,'2024',62.32,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240228_118%2Fauto_1709089047729ayYJO_PNG%2F20240228115714_H5CSrE7B.png',24,121),(123,'현대 스타리아','대형 RV',3,4,2637,177,6.5,'2024',62.32,'I4, V6 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240228_255%2Fauto_1709088802210OQw3p_PNG%2F20240228115302_ZyL3pF1E.png',24,123),(124,'현대 스타리아','대형 RV',3,7,2637,177,6.5,'2024',62.32,'I4, V6 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240228_255%2Fauto_1709088802210OQw3p_PNG%2F20240228115302_ZyL3pF1E.png',24,123),(125,'제이스모빌리티 이티밴 프로','준중형 밴',4,9,3980,5,325,'2024',65.63,'53.6kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241114_239%2Fauto_1731561932940NqnOc_PNG%2F20241114142519_z7quDrun.png',16,125),(126,'제이스모빌리티 이티밴 미니','소형 밴',4,9,3560,5,273,'2024',65.35,'41.9kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241114_192%2Fauto_1731562110510cRFat_PNG%2F20241114142820_KUOHD2DY.png',16,126),(127,'제이스모빌리티 이티밴 라이프','소형 밴',4,9,2698,5,273,'2024',65.35,'41.9kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241114_39%2Fauto_1731562377435UabKW_PNG%2F20241114143247_egqPNUHD.png',16,127),(128,'르노 마스터','대형 밴',4,7,3685,150,10.5,'2024',62.76,'I4 트윈터보 트윈터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240513_2%2Fauto_1715562079921BGCMR_PNG%2F20240513100108_705twXix.png',7,128),(129,'토요타 프리우스 플러그인 하이브리드','준중형 해치백',2,9,4630,223,19.4,'2024',59.78,'I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20231213_239%2Fauto_1702428714401Y61Hb_PNG%2F20231213095143_mrfOWoCw.png',14,129),(130,'토요타 프리우스 플러그인 하이브리드','준중형 해치백',2,2,4630,223,19.4,'2024',59.78,'I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20231213_239%2Fauto_1702428714401Y61Hb_PNG%2F20231213095143_mrfOWoCw.png',14,129),(131,'토요타 프리우스 플러그인 하이브리드','준중형 해치백',2,10,4630,223,19.4,'2024',59.78,'I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20231213_239%2Fauto_1702428714401Y61Hb_PNG%2F20231213095143_mrfOWoCw.png',14,129),(132,'토요타 프리우스','준중형 해치백',2,2,3990,196,20.9,'2024',59.78,'I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20231213_284%2Fauto_1702428199382FBcWA_PNG%2F20231213094306_6zhCh7AI.png',14,132),(133,'토요타 프리우스','준중형 해치백',2,10,3990,196,20.9,'2024',59.78,'I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20231213_284%2Fauto_1702428199382FBcWA_PNG%2F20231213094306_6zhCh7AI.png',14,132),(134,'모빌리티네트웍스 쎄아 베이스캠프','중형 밴',4,9,4307,3,184,'2023',63.85,'41.8kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240826_37%2Fauto_1724648100312MsLGz_PNG%2F20240826135449_yLQvDcNq.png',8,134),(135,'푸조 5008','중형 SUV',3,2,4600,130,12.1,'2024',61.08,'I3 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20231122_101%2Fauto_1700633082425wkY9f_PNG%2F20231122150414_D3SLtPjr.png',4,135),(136,'현대 포터2','중형 트럭',4,4,2028,138,6.3,'2024',50.89,'l4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20231122_191%2Fauto_17006315941352bVkU_PNG%2F20231122143945_CrFFeioN.png',24,136),(137,'푸조 3008','준중형 SUV',3,2,4220,130,12.2,'2024',60.04,'I3 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20231027_40%2Fauto_1698388698523gC9cH_PNG%2F20231027153805_LMCbeDD5.png',4,137),(138,'KGM 코란도','준중형 SUV',3,4,2410,165,9,'2024',60.11,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20231010_2%2Fauto_1696899992578FmDOr_PNG%2F20231010100629_O2inv3gM.png',13,138),(139,'KGM 코란도','준중형 SUV',3,2,2410,165,9,'2024',60.11,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20231010_2%2Fauto_1696899992578FmDOr_PNG%2F20231010100629_O2inv3gM.png',13,138),(140,'BMW 2시리즈 그란쿠페','준중형 세단',2,2,4900,192,10.4,'2024',59.01,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20231024_291%2Fauto_1698127128060QrAju_PNG%2F20231024145839_yfrHUrlx.png',19,140),(141,'BMW 1시리즈','준중형 해치백',2,2,4730,192,10,'2024',61.81,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20231024_174%2Fauto_1698127069433PPmCw_PNG%2F20231024145741_7uNuS6Lk.png',19,141),(142,'지프 레니게이드','소형 SUV',3,2,4550,171,10.4,'2023',60.4,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20241203_281%2Fauto_17331873732003S1bl_PNG%2F20241203095603_yGPNDexi.png',25,142),(143,'캠시스 CEVO-C SE','경형 해치백',1,9,1690,6,69,'2024',64.81,'10.1kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20230911_125%2Fauto_1694406348265Imq1C_PNG%2F20230911132537_DtSvTqHf.png',23,143),(144,'현대 아이오닉 6','중형 세단',2,9,4695,5,367,'2024',60.76,'53~77.4kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20230908_40%2Fauto_1694137242440YwuIn_PNG%2F20230908104033_crzsLzD9.png',24,144),(145,'모빌리티네트웍스 쎄아','중형 밴',4,9,3980,3,184,'2023',63.85,'41.8kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20240826_262%2Fauto_1724648006724rHHeR_PNG%2F20240826135315_aVdQ6dj1.png',8,145),(146,'마이브 M1','경형 해치백',1,9,1892,5,57,'2023',63.8,'10kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20230706_171%2Fauto_1688605870100PCPd2_PNG%2F20230706101100_xwgY8xVn.png',5,146),(147,'KGM 티볼리','소형 SUV',3,4,1872,126,9.4,'2024',61.54,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20230601_1%2Fauto_1685582924851ArG94_PNG%2F20230601102837_PRlHuhFR.png',13,147),(148,'KGM 티볼리','소형 SUV',3,2,1872,126,9.4,'2024',61.54,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20230601_1%2Fauto_1685582924851ArG94_PNG%2F20230601102837_PRlHuhFR.png',13,147),(149,'미니 클럽맨','소형 왜건',2,2,4370,136,11.5,'2024',62.59,'I3 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20230613_222%2Fauto_1686641126457rVLgO_PNG%2F20230613162518_Xnh6d0Vr.png',10,149),(150,'미니 컨버터블','소형 컨버터블',2,2,4700,136,12.1,'2024',64.55,'I3 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20230613_97%2Fauto_1686640302773kUXS2_PNG%2F20230613161129_hujX7zlN.png',10,150),(151,'르노코리아 SM6','중형 세단',2,4,2797,140,9.5,'2024',57.88,'I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20230406_128%2Fauto_1680742809898xtdfB_PNG%2F20230406095957_9cDq8uI3.png',15,151),(152,'르노코리아 SM6','중형 세단',2,2,2797,140,9.5,'2024',57.88,'I4 자연흡기 자연흡기','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20230406_128%2Fauto_1680742809898xtdfB_PNG%2F20230406095957_9cDq8uI3.png',15,151),(153,'기아 니로 플러스','소형 SUV',3,9,4755,5,392,'2024',61.57,'64kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20230208_226%2Fauto_1675816576423hWFSw_PNG%2F20230208093603_x44xFQFx.png',2,153),(154,'푸조 E-2008','소형 SUV',3,9,3890,4,260,'2023',60.51,'50kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20230224_197%2Fauto_16772198103922oM9w_PNG%2F20230224152319_sZFZWEfB.png',4,154),(155,'SS모터스 젤라 EV','중형 트럭',4,9,4180,2,194,'2022',51.38,'66.8kWh 배터리 배터리','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20220609_105%2Fauto_1654734930848CMCgY_PNG%2F20220609093518_0YYKOiiQ.png',21,155),(156,'동풍소콘 펜곤 ix5','중형 SUV',3,2,2380,150,9.8,'2020',59.55,'I4 싱글터보 싱글터보','https://search.pstatic.net/common?type=a&size=174x108&quality=75&direct=true&ttype=input&src=https%3A%2F%2Fimgauto-phinf.pstatic.net%2F20191004_60%2Fauto_15701612805014klUm_PNG%2F20191004125425_UYB1Ea5L.png',12,156);
 /*!40000 ALTER TABLE `car_info` ENABLE KEYS */;
 UNLOCK TABLES;
 
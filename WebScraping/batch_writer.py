@@ -0,0 +1,150 @@
+import json
+import os
+import queue
+import threading
+import time
+
+# 큐 크기(이만큼 쌓이면 수집 쪽이 기다림), 배치 크기, 최대 대기 후 저장 간격(초)
+WRITER_QUEUE_SIZE = int(os.getenv("WRITER_QUEUE_SIZE", "100"))
+WRITER_BATCH_SIZE = int(os.getenv("WRITER_BATCH_SIZE", "20"))
+WRITER_FLUSH_INTERVAL = float(os.getenv("WRITER_FLUSH_INTERVAL", "2.0"))
+
+_STOP = object()
+
+
+class BatchWriter:
+    """수집 스레드(생산자)와 저장 스레드(소비자) 사이의 크기 제한 큐
+
+    put()으로 넣은 항목을 저장 스레드가 batch_size개 또는 flush_interval초마다 모아
+    write_batch(items)로 저장한다. 큐가 가득 차면 put()이 기다리므로 저장이 밀릴 때
+    수집 속도가 자동으로 조절된다. 저장에 성공한 배치는 on_written(items)으로 알려
+    체크포인트를 남길 수 있다."""
+
+    def __init__(self, write_batch, batch_size=WRITER_BATCH_SIZE, max_queue=WRITER_QUEUE_SIZE,
+                 flush_interval=WRITER_FLUSH_INTERVAL, on_written=None, name="batch-writer"):
+        self.write_batch = write_batch
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.on_written = on_written
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._error = None
+        self._closed = False
+
+        self.queued = 0
+        self.written = 0
+        self.batches = 0
+        self.max_depth = 0
+        self.blocked_seconds = 0.0
+
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def put(self, item):
+        """항목을 큐에 넣음 (가득 차 있으면 자리가 날 때까지 대기)"""
+        if self._error:
+            raise RuntimeError(f"저장 스레드 오류로 중단되었습니다: {self._error}") from self._error
+        if self._closed:
+            raise RuntimeError("이미 닫힌 BatchWriter입니다")
+
+        start = time.perf_counter()
+        self._queue.put(item)
+        self.blocked_seconds += time.perf_counter() - start
+        self.queued += 1
+        self.max_depth = max(self.max_depth, self._queue.qsize())
+
+    def _flush(self, batch):
+        if not batch:
+            return
+        self.write_batch(batch)
+        self.written += len(batch)
+        self.batches += 1
+        if self.on_written:
+            self.on_written(batch)
+
+    def _run(self):
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+        try:
+            while True:
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    item = None
+                if item is _STOP:
+                    self._flush(batch)
+                    return
+                if item is not None:
+                    batch.append(item)
+                if len(batch) >= self.batch_size or time.monotonic() >= deadline:
+                    self._flush(batch)
+                    batch = []
+                    deadline = time.monotonic() + self.flush_interval
+        except Exception as e:
+            self._error = e
+            print(f"저장 스레드 오류: {e} (저장하지 못한 항목 {len(batch)}건)")
+            # 수집 쪽이 put()에서 영원히 기다리지 않도록 남은 큐를 비움
+            while True:
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+    def close(self):
+        """큐에 남은 항목을 모두 저장하고 저장 스레드를 종료"""
+        if not self._closed:
+            self._closed = True
+            if not self._error:
+                self._queue.put(_STOP)
+            self._thread.join()
+        if self._error:
+            raise RuntimeError(f"저장 스레드 오류: {self._error}") from self._error
+
+    def stats(self):
+        return {
+            "queued": self.queued,
+            "written": self.written,
+            "batches": self.batches,
+            "max_depth": self.max_depth,
+            "blocked_seconds": round(self.blocked_seconds, 3),
+        }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class JsonlCheckpoint:
+    """저장이 끝난 항목을 한 줄에 하나씩 JSON으로 기록하는 체크포인트 파일
+    다시 실행하면 기록된 key(보통 URL)는 건너뛸 수 있다"""
+
+    def __init__(self, path):
+        self.path = path
+
+    def load(self):
+        """기록된 레코드 목록 (파일이 없으면 빈 목록, 마지막 줄이 깨졌으면 무시)"""
+        if not os.path.exists(self.path):
+            return []
+        records = []
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    break
+        return records
+
+    def done_keys(self):
+        return {record["key"] for record in self.load()}
+
+    def append(self, records):
+        with open(self.path, "a", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def clear(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
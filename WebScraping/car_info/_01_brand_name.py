@@ -1,6 +1,7 @@
-import pickle
 import mysql.connector
 
+from WebScraping.car_info.car_info_snapshot import open_snapshot
+
 
 def create_and_insert_table(unique_brand_names):
     """테이블 생성 및 브랜드 이름 데이터를 삽입하는 함수"""
@@ -49,25 +50,17 @@ def create_and_insert_table(unique_brand_names):
     conn.close()
 
 
-def load_car_info():
-    """car_info_list.pkl 파일에서 데이터를 불러오는 함수"""
-    with open('car_info_list.pkl', 'rb') as f:
-        car_info_list = pickle.load(f)
-
-    return car_info_list
-
-
-def extract_unique_brand_names(car_info_list):
-    """car_info_list에서 고유한 브랜드 이름을 추출하는 함수"""
-    return set(car_info.brand for car_info in car_info_list)
+def extract_unique_brand_names(snapshot):
+    """스냅샷에서 고유한 브랜드 이름을 추출하는 함수 (고유 값 목록만 읽음)"""
+    return set(snapshot.distinct('brand'))
 
 
 def main():
-    # car_info_list 불러오기
-    car_info_list = load_car_info()
+    # 차량 정보 스냅샷 열기 (필요한 컬럼만 읽음)
+    snapshot = open_snapshot()
 
-    # car_info_list에서 고유한 브랜드 이름 추출
-    unique_brand_names = extract_unique_brand_names(car_info_list)
+    # 스냅샷에서 고유한 브랜드 이름 추출
+    unique_brand_names = extract_unique_brand_names(snapshot)
 
     # 고유한 브랜드 이름 출력
     print("\n✅ 고유한 브랜드 이름들:")
@@ -1,6 +1,7 @@
-import pickle
 import mysql.connector
 
+from WebScraping.car_info.car_info_snapshot import open_snapshot
+
 
 def create_and_insert_table(unique_body_types):
     """tbl_body_type 테이블을 생성하고, 고유한 body_type 데이터를 삽입하는 함수"""
@@ -49,26 +50,18 @@ def create_and_insert_table(unique_body_types):
     conn.close()
 
 
-def load_car_info():
-    """car_info_list.pkl 파일에서 데이터를 불러오는 함수"""
-    with open('car_info_list.pkl', 'rb') as f:
-        car_info_list = pickle.load(f)
-
-    return car_info_list
-
-
-def extract_unique_body_types(car_info_list):
-    """car_info_list에서 고유한 body_type 값을 추출하는 함수"""
-    return set(car_info.body_type for car_info in car_info_list)
+def extract_unique_body_types(snapshot):
+    """스냅샷에서 고유한 body_type 값을 추출하는 함수 (고유 값 목록만 읽음)"""
+    return set(snapshot.distinct('body_type'))
 
 
 def main():
     """전체 흐름을 실행하는 main 함수"""
-    # car_info_list 불러오기
-    car_info_list = load_car_info()
+    # 차량 정보 스냅샷 열기 (필요한 컬럼만 읽음)
+    snapshot = open_snapshot()
 
     # 고유한 body_type 추출
-    unique_body_types = extract_unique_body_types(car_info_list)
+    unique_body_types = extract_unique_body_types(snapshot)
 
     # 고유한 body_type 출력
     print("\n✅ 고유한 body_type들:")
@@ -1,6 +1,35 @@
-import pickle
+import argparse
+import os
 import mysql.connector
 
+from WebScraping.car_info.catalog_version import publish_catalog_version
+from WebScraping.car_info.content_hash import car_info_hash, diff_car_infos
+from WebScraping.car_info.car_info_snapshot import load_car_info
+
+# executemany 한 번에 보내는 행 수
+BATCH_SIZE = int(os.getenv("ALL_DATA_BATCH_SIZE", "500"))
+
+INSERT_QUERY = '''
+    INSERT INTO all_data (
+        model_name, body_type, category_id, fuel_type_id, price, power,
+        fuel_efficiency, model_year, size, engine_type, image_link, brand_id, content_hash
+    )
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+'''
+
+# car_info 각 행에 모델 대표 car_id(같은 차량명의 가장 작은 car_id) 채우기 (DB/migrations/002 4번과 동일)
+# 비어 있거나 달라진 행만 갱신하므로 새로 들어간 차량도 리뷰 평점(avg_score)과 연결됨
+CAR_MODEL_ID_UPDATE = '''
+    UPDATE car_info ci
+        JOIN (
+            SELECT car_full_name, MIN(car_id) AS car_model_id
+            FROM car_info
+            GROUP BY car_full_name
+        ) m ON m.car_full_name = ci.car_full_name
+    SET ci.car_model_id = m.car_model_id
+    WHERE NOT (ci.car_model_id <=> m.car_model_id)
+'''
+
 def create_tbl_all_data_table():
     """all_data 테이블을 생성하는 함수"""
     conn = mysql.connector.connect(
@@ -11,6 +40,14 @@ def create_tbl_all_data_table():
     )
     cursor = conn.cursor()
 
+    create_all_data_table(cursor)
+
+    conn.commit()
+    cursor.close()
+    conn.close()
+
+def create_all_data_table(cursor):
+    """all_data 테이블 생성 및 content_hash 컬럼 보강 (커서 단위)"""
     # 테이블 생성 (이미 존재하면 무시)
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS all_data (
@@ -26,50 +63,110 @@ def create_tbl_all_data_table():
             size FLOAT,
             engine_type VARCHAR(255),
             image_link VARCHAR(255),
-            brand_id INT
+            brand_id INT,
+            content_hash CHAR(64),
+            INDEX idx_all_data_model_name (model_name)
         )
     ''')
 
-    conn.commit()
-    cursor.close()
-    conn.close()
-
-def fetch_ids_for_references(body_type, fuel_type, brand_name):
-    """brand_name, body_type, fuel_type에 대한 참조 ID 값을 찾아 반환하는 함수"""
-    conn = mysql.connector.connect(
-        host='localhost',
-        user='skn14',
-        password='skn14',
-        database='teamdb'
-    )
-    cursor = conn.cursor()
+    # 이전 버전에서 만든 테이블에는 content_hash 컬럼이 없으므로 추가
+    cursor.execute('''
+        SELECT COUNT(*) FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'all_data' AND COLUMN_NAME = 'content_hash'
+    ''')
+    if cursor.fetchone()[0] == 0:
+        cursor.execute('ALTER TABLE all_data ADD COLUMN content_hash CHAR(64)')
 
-    # brand_id 조회
-    cursor.execute('SELECT brand_id FROM tbl_brand WHERE brand_name = %s', (brand_name,))
-    brand_id = cursor.fetchone()
+def load_reference_ids(cursor):
+    """tbl_brand, tbl_fuel_type, tbl_body_type을 한 번씩 읽어 이름 → ID 딕셔너리로 반환하는 함수"""
+    cursor.execute('SELECT brand_name, brand_id FROM tbl_brand')
+    brand_ids = dict(cursor.fetchall())
 
-    # fuel_type_id 조회 (기본)
-    cursor.execute('SELECT fuel_type_id FROM tbl_fuel_type WHERE fuel_type = %s', (fuel_type,))
-    fuel_type_id = cursor.fetchone()
+    cursor.execute('SELECT fuel_type, fuel_type_id FROM tbl_fuel_type')
+    fuel_type_ids = dict(cursor.fetchall())
 
-    # body_type으로 category_id 조회
-    cursor.execute('SELECT category_id FROM tbl_body_type WHERE body_type = %s', (body_type,))
-    category_id = cursor.fetchone()
+    cursor.execute('SELECT body_type, category_id FROM tbl_body_type')
+    category_ids = dict(cursor.fetchall())
 
-    cursor.close()
-    conn.close()
+    return {
+        'brand_id': brand_ids,
+        'fuel_type_id': fuel_type_ids,
+        'category_id': category_ids
+    }
 
+def fetch_ids_for_references(reference_ids, body_type, fuel_type, brand_name):
+    """brand_name, body_type, fuel_type에 대한 참조 ID 값을 메모리의 딕셔너리에서 찾아 반환하는 함수"""
     return {
-        'brand_id': brand_id[0] if brand_id else None,
-        'fuel_type_id': fuel_type_id[0] if fuel_type_id else None,
-        'category_id': category_id[0] if category_id else None
+        'brand_id': reference_ids['brand_id'].get(brand_name),
+        'fuel_type_id': reference_ids['fuel_type_id'].get(fuel_type),
+        'category_id': reference_ids['category_id'].get(body_type)
     }
 
 def split_fuel_types(fuel_type):
     """연료 타입이 여러 개인 경우 나누는 함수"""
     return [ft.strip() for ft in fuel_type.split(',')]
 
-def save_all_data_to_db(car_info_list):
+def build_rows(car_info, reference_ids):
+    """CarInfo 하나를 연료 타입별 all_data 행(튜플) 목록으로 만드는 함수"""
+    content_hash = car_info_hash(car_info)
+    rows = []
+
+    for single_fuel_type in split_fuel_types(car_info.fuel_type):
+        ids = fetch_ids_for_references(
+            reference_ids,
+            car_info.body_type,
+            single_fuel_type,
+            car_info.brand
+        )
+        rows.append((
+            car_info.model_name,
+            car_info.body_type,
+            ids['category_id'],
+            ids['fuel_type_id'],
+            car_info.price,
+            car_info.power,
+            car_info.fuel_efficiency,
+            car_info.model_year,
+            car_info.size,
+            car_info.engine_type,
+            car_info.image_link,
+            ids['brand_id'],
+            content_hash
+        ))
+    return rows
+
+def insert_rows(cursor, rows, batch_size=BATCH_SIZE):
+    """all_data 행들을 batch_size개씩 executemany로 INSERT하는 함수"""
+    for start in range(0, len(rows), batch_size):
+        cursor.executemany(INSERT_QUERY, rows[start:start + batch_size])
+
+def has_car_model_id(cursor):
+    """car_info에 car_model_id 컬럼이 있는지 (DB/migrations/002 적용 여부)"""
+    cursor.execute('''
+        SELECT COUNT(*) FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'car_info' AND COLUMN_NAME = 'car_model_id'
+    ''')
+    return cursor.fetchone()[0] > 0
+
+def update_car_model_ids(cursor):
+    """car_info.car_model_id를 채우고 갱신한 행 수를 반환하는 함수 (커밋은 호출한 쪽에서)
+    002 적용 전 DB면 건너뛰고 None 반환"""
+    if not has_car_model_id(cursor):
+        print("car_info에 car_model_id 컬럼이 없어 건너뜁니다 (DB/migrations/002_review_car_id.sql 적용 필요)")
+        return None
+    cursor.execute(CAR_MODEL_ID_UPDATE)
+    return cursor.rowcount
+
+def save_car_infos(cursor, car_info_list, batch_size=BATCH_SIZE):
+    """참조 ID를 한 번에 읽은 뒤 car_info_list를 일괄 INSERT하고 넣은 행 수를 반환하는 함수
+    같은 트랜잭션에서 car_info.car_model_id도 채움"""
+    reference_ids = load_reference_ids(cursor)
+    rows = [row for car_info in car_info_list for row in build_rows(car_info, reference_ids)]
+    insert_rows(cursor, rows, batch_size)
+    update_car_model_ids(cursor)
+    return len(rows)
+
+def save_all_data_to_db(car_info_list, batch_size=BATCH_SIZE):
     """car_info_list의 데이터를 all_data 테이블에 저장하는 함수"""
     conn = mysql.connector.connect(
         host='localhost',
@@ -79,52 +176,86 @@ def save_all_data_to_db(car_info_list):
     )
     cursor = conn.cursor()
 
-    for car_info in car_info_list:
-        fuel_types = split_fuel_types(car_info.fuel_type)
-
-        for single_fuel_type in fuel_types:
-            ids = fetch_ids_for_references(
-                car_info.body_type,
-                single_fuel_type,
-                car_info.brand
-            )
-
-            cursor.execute('''
-                INSERT INTO all_data (
-                    model_name, body_type, category_id, fuel_type_id, price, power,
-                    fuel_efficiency, model_year, size, engine_type, image_link, brand_id
-                )
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            ''', (
-                car_info.model_name,
-                car_info.body_type,
-                ids['category_id'],
-                ids['fuel_type_id'],
-                car_info.price,
-                car_info.power,
-                car_info.fuel_efficiency,
-                car_info.model_year,
-                car_info.size,
-                car_info.engine_type,
-                car_info.image_link,
-                ids['brand_id']
-            ))
+    try:
+        save_car_infos(cursor, car_info_list, batch_size)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+        conn.close()
 
-    conn.commit()
-    cursor.close()
-    conn.close()
+def fetch_existing_hashes(cursor):
+    """all_data에 저장된 모델별 content_hash를 {model_name: hash}로 반환
+    content_hash 컬럼 추가 전에 들어간 모델은 hash가 None (diff_car_infos가 변경으로 보고 지운 뒤 다시 넣음)"""
+    cursor.execute('''
+        SELECT model_name, MAX(content_hash) FROM all_data
+        WHERE model_name IS NOT NULL
+        GROUP BY model_name
+    ''')
+    return {model_name: content_hash for model_name, content_hash in cursor.fetchall()}
+
+def upsert_changed_to_db(car_info_list, batch_size=BATCH_SIZE):
+    """내용 해시가 달라진 모델과 신규 모델만 all_data에 반영하는 함수
+    모델 하나가 연료 타입별 여러 행이므로, 변경된 모델은 기존 행을 지우고 같은 트랜잭션에서 다시 넣음
+    반환: (신규 수, 변경 수, 동일 수)"""
+    conn = mysql.connector.connect(
+        host='localhost',
+        user='skn14',
+        password='skn14',
+        database='teamdb'
+    )
+    cursor = conn.cursor()
 
-def load_car_info():
-    """car_info_list.pkl 파일에서 데이터를 불러오는 함수"""
-    with open('car_info_list.pkl', 'rb') as f:
-        car_info_list = pickle.load(f)
-    return car_info_list
+    try:
+        counts = upsert_changed(cursor, car_info_list, batch_size)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+        conn.close()
 
-def main():
+    return counts
+
+def upsert_changed(cursor, car_info_list, batch_size=BATCH_SIZE):
+    """upsert_changed_to_db의 본체 (커밋은 호출한 쪽에서)"""
+    new, changed, unchanged = diff_car_infos(car_info_list, fetch_existing_hashes(cursor))
+
+    if changed:
+        cursor.executemany('DELETE FROM all_data WHERE model_name = %s',
+                           [(car_info.model_name,) for car_info in changed])
+    save_car_infos(cursor, new + changed, batch_size)
+
+    return len(new), len(changed), len(unchanged)
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="all_data 테이블 적재")
+    parser.add_argument("--incremental", action="store_true",
+                        help="내용 해시가 바뀐 모델과 신규 모델만 반영 (기본은 전체 INSERT)")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="executemany 한 번에 보내는 행 수")
+    return parser.parse_args()
+
+def main(args=None):
+    args = args or parse_args()
     car_info_list = load_car_info()
     create_tbl_all_data_table()
-    save_all_data_to_db(car_info_list)
-    print("✅ all_data 테이블에 데이터 삽입이 완료되었습니다.")
+
+    if args.incremental:
+        new_count, changed_count, unchanged_count = upsert_changed_to_db(car_info_list, args.batch_size)
+        print(f"✅ all_data 증분 반영 완료: 신규 {new_count}, 변경 {changed_count}, 동일(건너뜀) {unchanged_count}")
+        if new_count == 0 and changed_count == 0:
+            # 바뀐 내용이 없으면 카탈로그 캐시도 그대로 둠
+            return
+    else:
+        save_all_data_to_db(car_info_list, args.batch_size)
+        print("✅ all_data 테이블에 데이터 삽입이 완료되었습니다.")
+
+    # Streamlit 카탈로그 캐시 무효화
+    version = publish_catalog_version()
+    print(f"✅ 카탈로그 버전 갱신: {version}")
 
 if __name__ == "__main__":
     main()
@@ -2,62 +2,120 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 from bs4 import BeautifulSoup as bs
 import re
-import time
+from dataclasses import asdict
 from WebScraping.car_info.car_info_dto import CarInfo
+from WebScraping.batch_writer import BatchWriter, JsonlCheckpoint
+from WebScraping.page_fetcher import HostRateLimiter, HttpFetcher, DriverPool, fetch_pages
+from WebScraping.scrape_wait import StepTimer, wait_present, wait_clickable, wait_text_changed, WAIT_TIMEOUT
+
+# 상세 페이지 로딩 완료를 판단하는 모델명 선택자
+MODEL_NAME_SELECTOR = 'span.area_text_title strong._text'
+
+# 네이버 자동차 검색 결과의 가격 필터 / 목록 페이지 XPath
+PRICE_FILTER_XPATH = '//*[@id="main_pack"]/div[3]/div[2]/div[1]/div/div[1]/div/div/div/ul/li[5]/div/a'
+PRICE_SLIDER_XPATH = '//*[@id="main_pack"]/div[3]/div[2]/div[1]/div/div[1]/div/div/div/div/div/div/div[2]/div[1]/div[3]/div/span/span[7]'
+PRICE_APPLY_XPATH = '//*[@id="main_pack"]/div[3]/div[2]/div[1]/div/div[1]/div/div/div/div/div/div/div[2]/div[2]/a'
+PAGE_CONTAINER_XPATH = '//*[@id="main_pack"]/div[3]/div[2]/div[1]/div/div[3]/div[{page}]'
+NEXT_PAGE_XPATH = '//*[@id="main_pack"]/div[3]/div[2]/div[1]/div/div[4]/div/a[2]'
+
+# 모델 검색 URL 뒤에 붙이는 검색어 (" 정보" / " 오너평가")
+SPEC_URL_SUFFIX = '%20%EC%A0%95%EB%B3%B4'
+REVIEW_URL_SUFFIX = '%20%EC%98%A4%EB%84%88%ED%8F%89%EA%B0%80'
 
 class CarInfoDAO:
-    def __init__(self):
-        self.driver = webdriver.Chrome()
+    def __init__(self, use_browser=True):
+        # URL 목록을 이미 갖고 있고 HTTP로만 수집할 때는 브라우저를 띄우지 않음
+        self.driver = webdriver.Chrome() if use_browser else None
         self.car_info_list = []
+        self.model_urls = []
         self.url_list = []
+        self.timer = StepTimer()
+        # 체크포인트: 수집한 CarInfo를 저장 스레드가 파일에 이어 쓰고, 재실행 시 완료된 URL은 건너뜀
+        self.checkpoint = None
+        self.writer = None
+        self.done_urls = set()
+
+    def enable_checkpoint(self, path):
+        """체크포인트 파일에서 이전 수집 결과를 복원하고 이후 결과를 계속 기록"""
+        self.checkpoint = JsonlCheckpoint(path)
+        for record in self.checkpoint.load():
+            self.done_urls.add(record["key"])
+            self.car_info_list.append(CarInfo(**record["car_info"]))
+        if self.done_urls:
+            print(f"체크포인트에서 {len(self.done_urls)}개 차량 정보를 복원했습니다")
+        self.writer = BatchWriter(self.checkpoint.append, name="car-info-checkpoint")
+
+    def close_checkpoint(self):
+        """큐에 남은 결과를 체크포인트에 모두 기록하고 저장 스레드를 종료"""
+        if self.writer:
+            self.writer.close()
+            self.writer = None
+
+    def _pending_urls(self):
+        """(번호, URL) 목록에서 체크포인트에 이미 있는 URL을 제외"""
+        return [(idx, url) for idx, url in enumerate(self.url_list, 1) if url not in self.done_urls]
 
     def open_site(self):
-        self.driver.get("https://naver.com")
-        time.sleep(3)
-        search_box = self.driver.find_element(By.ID, "query")
-        search_box.send_keys("네이버 자동차")
-        search_box.send_keys(Keys.ENTER)
-        time.sleep(3)
+        with self.timer.step("open_site"):
+            self.driver.get("https://naver.com")
+            search_box = wait_present(self.driver, (By.ID, "query"))
+            search_box.send_keys("네이버 자동차")
+            search_box.send_keys(Keys.ENTER)
+            wait_clickable(self.driver, (By.XPATH, PRICE_FILTER_XPATH))
 
     def apply_filters(self):
-        button = self.driver.find_element(By.XPATH, '//*[@id="main_pack"]/div[3]/div[2]/div[1]/div/div[1]/div/div/div/ul/li[5]/div/a')
-        button.click()
-        time.sleep(2)
+        with self.timer.step("apply_filters"):
+            button = wait_clickable(self.driver, (By.XPATH, PRICE_FILTER_XPATH))
+            button.click()
+
+            slider = wait_clickable(self.driver, (By.XPATH, PRICE_SLIDER_XPATH))
+            slider.click()
 
-        slider = self.driver.find_element(By.XPATH, '//*[@id="main_pack"]/div[3]/div[2]/div[1]/div/div[1]/div/div/div/div/div/div/div[2]/div[1]/div[3]/div/span/span[7]')
-        slider.click()
-        time.sleep(2)
+            actions = ActionChains(self.driver)
+            for _ in range(2):
+                actions.send_keys(Keys.ARROW_LEFT).perform()
 
-        actions = ActionChains(self.driver)
-        for _ in range(2):
-            actions.send_keys(Keys.ARROW_LEFT).perform()
-        time.sleep(2)
+            # 적용 전 첫 페이지 내용을 기억해 두고, 목록이 바뀔 때까지 대기
+            old_text = self._page_text(1)
+            apply = wait_clickable(self.driver, (By.XPATH, PRICE_APPLY_XPATH))
+            apply.click()
+            if not wait_text_changed(self.driver, (By.XPATH, PAGE_CONTAINER_XPATH.format(page=1)), old_text):
+                print("필터 적용 후 목록 변화가 감지되지 않았습니다 (대기 시간 초과)")
 
-        apply = self.driver.find_element(By.XPATH, '//*[@id="main_pack"]/div[3]/div[2]/div[1]/div/div[1]/div/div/div/div/div/div/div[2]/div[2]/a')
-        apply.click()
-        time.sleep(2)
+    def _page_text(self, page):
+        elements = self.driver.find_elements(By.XPATH, PAGE_CONTAINER_XPATH.format(page=page))
+        return elements[0].text if elements else None
 
     def collect_urls(self):
+        """모델 URL을 수집하고 상세정보(정보) 페이지 URL 목록을 만든다"""
+        self.collect_model_urls()
+        self.url_list = [url + SPEC_URL_SUFFIX for url in self.model_urls]
+
+    def collect_model_urls(self):
+        """검색 결과 15페이지에서 모델별 검색 URL(접미어 없음)을 수집"""
         for page in range(1, 16):
             try:
-                container = self.driver.find_element(By.XPATH, f'//*[@id="main_pack"]/div[3]/div[2]/div[1]/div/div[3]/div[' + str(page) + ']')
+                with self.timer.step("collect_urls_page"):
+                    container = wait_present(self.driver, (By.XPATH, PAGE_CONTAINER_XPATH.format(page=page)))
+
+                    car_list = container.find_elements(By.CSS_SELECTOR, ".info_box")
 
-                car_list = container.find_elements(By.CSS_SELECTOR, ".info_box")
+                    for car_tag in car_list:
+                        link = car_tag.find_element(By.CSS_SELECTOR, "a:first-of-type")
+                        href = link.get_attribute('href')
+                        if href and href not in self.model_urls:
+                            self.model_urls.append(href)
 
-                for car_tag in car_list:
-                    link = car_tag.find_element(By.CSS_SELECTOR, "a:first-of-type")
-                    href = link.get_attribute('href')
-                    if href and href not in self.url_list:
-                        self.url_list.append(href + '%20%EC%A0%95%EB%B3%B4')
+                    if page == 15:
+                        break
 
-                next_button = self.driver.find_element(By.XPATH, '//*[@id="main_pack"]/div[3]/div[2]/div[1]/div/div[4]/div/a[2]')
-                next_button.click()
-                time.sleep(3)
+                    # 다음 페이지 컨테이너가 나타날 때까지 대기
+                    next_button = wait_clickable(self.driver, (By.XPATH, NEXT_PAGE_XPATH))
+                    next_button.click()
+                    wait_present(self.driver, (By.XPATH, PAGE_CONTAINER_XPATH.format(page=page + 1)))
 
             except Exception as e:
                 print(f"오류 발생 (페이지 {page}): {e}")
@@ -78,84 +136,128 @@ class CarInfoDAO:
             return round(num, 1) if return_float else int(num)
         return None
 
+    def parse_car_info(self, html, idx):
+        """상세 페이지 HTML에서 CarInfo를 추출 (모델명이 없으면 None)"""
+        soup = bs(html, 'html.parser')
+
+        model_name_tag = soup.select_one(MODEL_NAME_SELECTOR)
+        model_name = model_name_tag.text.strip() if model_name_tag else None
+
+        sub_title_tags = soup.select('div.sub_title .txt')
+        body_type = sub_title_tags[0].text.strip() if len(sub_title_tags) > 0 else None
+        model_year = sub_title_tags[1].text.strip() if len(sub_title_tags) > 1 else None
+
+        image_tag = soup.select_one('div.detail_info a.thumb.type_87_87 img')
+        image_link = image_tag['src'] if image_tag else None
+
+        info_groups = soup.select('dl.info .info_group')
+
+        price_text = self._get_text_from_dd(info_groups, 0)
+        price = self._extract_first_number(price_text)
+
+        fuel_type = self._get_text_from_dd(info_groups, 1)
+
+        fuel_efficiency_text = self._get_text_from_dd(info_groups, 2)
+        fuel_efficiency = self._extract_first_number(fuel_efficiency_text, return_float=True)
+
+        power_text = self._get_text_from_dd(info_groups, 3)
+        power = self._extract_first_number(power_text)
+
+        engine_type = None
+        if len(info_groups) > 6:
+            engine_dd = info_groups[6].select_one('dd')
+            engine_span = info_groups[6].select_one('span.value_text')
+            engine_type = (engine_dd.text.strip() if engine_dd else '') + " " + (engine_span.text.strip() if engine_span else '')
+
+        size = None
+        size_text1 = self._get_text_from_dd(info_groups, 9)
+        size_text2 = self._get_text_from_dd(info_groups, 12)
+        if size_text1 and size_text2:
+            size_num1 = self._extract_first_number(size_text1)
+            size_num2 = self._extract_first_number(size_text2)
+            if size_num1 and size_num2:
+                size = round((size_num2 / size_num1) * 100, 2)
+
+        brand = model_name.split()[0] if model_name else None
+
+        if not model_name:
+            return None
+        return CarInfo(
+            id=idx,
+            model_name=model_name,
+            body_type=body_type,
+            fuel_type=fuel_type,
+            price=price,
+            power=power,
+            fuel_efficiency=fuel_efficiency,
+            model_year=model_year,
+            size=size,
+            engine_type=engine_type,
+            image_link=image_link,
+            brand=brand
+        )
+
+    def _add_car_info(self, html, idx, url=None):
+        car_info = self.parse_car_info(html, idx)
+        if car_info:
+            self.car_info_list.append(car_info)
+            if self.writer:
+                self.writer.put({"key": url, "car_info": asdict(car_info)})
+            print(f"[{idx}] {car_info}")
+        else:
+            print(f"[{idx}] 모델명 없음")
+
     def collect_car_info(self):
-        for idx, url in enumerate(self.url_list, 1):
+        for idx, url in self._pending_urls():
             try:
-                self.driver.get(url)
-
-                WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, 'span.area_text_title strong._text'))
-                )
+                with self.timer.step("detail_page_load"):
+                    self.driver.get(url)
+                    wait_present(self.driver, (By.CSS_SELECTOR, MODEL_NAME_SELECTOR))
 
-                soup = bs(self.driver.page_source, 'html.parser')
-
-                model_name_tag = soup.select_one('span.area_text_title strong._text')
-                model_name = model_name_tag.text.strip() if model_name_tag else None
-
-                sub_title_tags = soup.select('div.sub_title .txt')
-                body_type = sub_title_tags[0].text.strip() if len(sub_title_tags) > 0 else None
-                model_year = sub_title_tags[1].text.strip() if len(sub_title_tags) > 1 else None
-
-                image_tag = soup.select_one('div.detail_info a.thumb.type_87_87 img')
-                image_link = image_tag['src'] if image_tag else None
-
-                info_groups = soup.select('dl.info .info_group')
-
-                price_text = self._get_text_from_dd(info_groups, 0)
-                price = self._extract_first_number(price_text)
-
-                fuel_type = self._get_text_from_dd(info_groups, 1)
-
-                fuel_efficiency_text = self._get_text_from_dd(info_groups, 2)
-                fuel_efficiency = self._extract_first_number(fuel_efficiency_text, return_float=True)
-
-                power_text = self._get_text_from_dd(info_groups, 3)
-                power = self._extract_first_number(power_text)
-
-                engine_type = None
-                if len(info_groups) > 6:
-                    engine_dd = info_groups[6].select_one('dd')
-                    engine_span = info_groups[6].select_one('span.value_text')
-                    engine_type = (engine_dd.text.strip() if engine_dd else '') + " " + (engine_span.text.strip() if engine_span else '')
-
-                size = None
-                size_text1 = self._get_text_from_dd(info_groups, 9)
-                size_text2 = self._get_text_from_dd(info_groups, 12)
-                if size_text1 and size_text2:
-                    size_num1 = self._extract_first_number(size_text1)
-                    size_num2 = self._extract_first_number(size_text2)
-                    if size_num1 and size_num2:
-                        size = round((size_num2 / size_num1) * 100, 2)
-
-                brand = model_name.split()[0] if model_name else None
-
-                if model_name:
-                    car_info = CarInfo(
-                        id=idx,
-                        model_name=model_name,
-                        body_type=body_type,
-                        fuel_type=fuel_type,
-                        price=price,
-                        power=power,
-                        fuel_efficiency=fuel_efficiency,
-                        model_year=model_year,
-                        size=size,
-                        engine_type=engine_type,
-                        image_link=image_link,
-                        brand=brand
-                    )
-                    self.car_info_list.append(car_info)
-                    print(f"[{idx}] {car_info}")
-                else:
-                    print(f"[{idx}] 모델명 없음")
+                with self.timer.step("detail_page_parse"):
+                    self._add_car_info(self.driver.page_source, idx, url)
 
             except TimeoutException:
                 print(f"[{idx}] 타임아웃 발생: {url}")
             except Exception as e:
                 print(f"[{idx}] 에러 발생: {e} URL: {url}")
 
+    def collect_car_info_concurrent(self, workers=4, mode="http", requests_per_second=2.0, retries=3, backoff=1.0):
+        """상세 페이지를 workers개 작업자로 동시에 수집 (결과는 url_list 순서대로 저장)
+        mode="http": 브라우저 없이 HTTP 요청, mode="driver": 헤드리스 Chrome 여러 개 사용"""
+        if mode == "http":
+            fetcher = HttpFetcher()
+        else:
+            fetcher = DriverPool(size=workers, wait_selector=MODEL_NAME_SELECTOR, timeout=WAIT_TIMEOUT)
+
+        jobs = self._pending_urls()
+        try:
+            with self.timer.step("detail_pages_fetch"):
+                pages = fetch_pages(
+                    [url for _, url in jobs],
+                    fetcher.fetch,
+                    workers=workers,
+                    rate_limiter=HostRateLimiter(requests_per_second),
+                    retries=retries,
+                    backoff=backoff
+                )
+        finally:
+            fetcher.close()
+
+        for (idx, url), page in zip(jobs, pages):
+            if isinstance(page, Exception):
+                print(f"[{idx}] 에러 발생: {page} URL: {url}")
+                continue
+            try:
+                with self.timer.step("detail_page_parse"):
+                    self._add_car_info(page, idx, url)
+            except Exception as e:
+                print(f"[{idx}] 에러 발생: {e} URL: {url}")
+
     def quit(self):
-        self.driver.quit()
+        self.close_checkpoint()
+        if self.driver:
+            self.driver.quit()
 
     def get_car_info_list(self):
         return self.car_info_list
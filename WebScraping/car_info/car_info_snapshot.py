@@ -0,0 +1,185 @@
+"""CarInfo 목록을 컬럼 단위로 저장하는 스냅샷 (car_info_list.pkl 대체)
+
+디렉터리 하나에 컬럼별 파일을 둔다.
+- 숫자 컬럼: <컬럼>.npy (float64, 값이 없으면 NaN) - np.load(mmap_mode="r")로 메모리 매핑
+- 문자열 컬럼: <컬럼>.codes.npy (int32, 값이 없으면 -1) + <컬럼>.values.json (고유 값 목록)
+- meta.json: 행 수와 컬럼 정보
+
+필요한 컬럼만 읽을 수 있으므로 _01_brand_name은 brand의 고유 값 목록만 읽는다.
+
+pickle 변환: python -m WebScraping.car_info.car_info_snapshot convert [car_info_list.pkl] [출력 디렉터리]
+"""
+import argparse
+import json
+import os
+import pickle
+import shutil
+from dataclasses import fields
+from pathlib import Path
+
+import numpy as np
+
+from WebScraping.car_info.car_info_dto import CarInfo
+
+BASE_DIR = Path(__file__).resolve().parent
+SNAPSHOT_DIR = BASE_DIR / "car_info_snapshot"
+LEGACY_PICKLE = BASE_DIR / "car_info_list.pkl"
+
+FORMAT_VERSION = 1
+
+# CarInfo 필드별 저장 형식 (int/float는 숫자 컬럼, str은 사전 인코딩 문자열 컬럼)
+COLUMN_KINDS = {
+    "id": "int",
+    "model_name": "str",
+    "body_type": "str",
+    "fuel_type": "str",
+    "price": "int",
+    "power": "int",
+    "fuel_efficiency": "float",
+    "model_year": "str",
+    "size": "float",
+    "engine_type": "str",
+    "image_link": "str",
+    "brand": "str",
+}
+COLUMNS = [f.name for f in fields(CarInfo)]
+
+
+def _encode_strings(values):
+    """문자열 목록을 (코드 배열, 고유 값 목록)으로 사전 인코딩 (None은 -1)"""
+    lookup = {}
+    codes = np.empty(len(values), dtype=np.int32)
+    for i, value in enumerate(values):
+        if value is None:
+            codes[i] = -1
+        else:
+            codes[i] = lookup.setdefault(value, len(lookup))
+    return codes, list(lookup)
+
+
+def write_snapshot(car_info_list, path=SNAPSHOT_DIR):
+    """CarInfo 목록을 컬럼 스냅샷으로 저장 (임시 디렉터리에 쓴 뒤 교체)"""
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir(parents=True)
+
+    for name in COLUMNS:
+        values = [getattr(car_info, name) for car_info in car_info_list]
+        if COLUMN_KINDS[name] == "str":
+            codes, distinct = _encode_strings(values)
+            np.save(tmp / f"{name}.codes.npy", codes)
+            with open(tmp / f"{name}.values.json", "w", encoding="utf-8") as f:
+                json.dump(distinct, f, ensure_ascii=False)
+        else:
+            array = np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+            np.save(tmp / f"{name}.npy", array)
+
+    with open(tmp / "meta.json", "w", encoding="utf-8") as f:
+        json.dump({"format": FORMAT_VERSION, "rows": len(car_info_list), "columns": COLUMN_KINDS}, f, indent=2)
+
+    # 기존 스냅샷은 새 스냅샷이 완성된 뒤에만 교체
+    old = path.with_name(path.name + ".old")
+    shutil.rmtree(old, ignore_errors=True)
+    if path.exists():
+        os.replace(path, old)
+    os.replace(tmp, path)
+    shutil.rmtree(old, ignore_errors=True)
+    return path
+
+
+class CarInfoSnapshot:
+    """컬럼 스냅샷 읽기 (컬럼은 처음 요청될 때만 파일에서 읽음)"""
+
+    def __init__(self, path=SNAPSHOT_DIR, mmap=True):
+        self.path = Path(path)
+        self.mmap_mode = "r" if mmap else None
+        with open(self.path / "meta.json", encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("format") != FORMAT_VERSION:
+            raise ValueError(f"지원하지 않는 스냅샷 형식입니다: {meta.get('format')}")
+        self.rows = meta["rows"]
+        self.kinds = meta["columns"]
+        self._distinct = {}
+
+    def __len__(self):
+        return self.rows
+
+    def distinct(self, name):
+        """문자열 컬럼의 고유 값 목록 (None 제외, 코드 배열은 읽지 않음)"""
+        if name not in self._distinct:
+            with open(self.path / f"{name}.values.json", encoding="utf-8") as f:
+                self._distinct[name] = json.load(f)
+        return self._distinct[name]
+
+    def codes(self, name):
+        """문자열 컬럼의 코드 배열 (distinct(name)의 인덱스, 값이 없으면 -1)"""
+        return np.load(self.path / f"{name}.codes.npy", mmap_mode=self.mmap_mode)
+
+    def column(self, name):
+        """숫자 컬럼은 float64 배열(메모리 매핑), 문자열 컬럼은 object 배열로 반환"""
+        if self.kinds[name] != "str":
+            return np.load(self.path / f"{name}.npy", mmap_mode=self.mmap_mode)
+        table = np.array(self.distinct(name) + [None], dtype=object)
+        # -1(값 없음)은 마지막에 붙인 None을 가리킴
+        return table[self.codes(name)]
+
+    def columns(self, names):
+        """필요한 컬럼만 {이름: 배열}로 반환"""
+        return {name: self.column(name) for name in names}
+
+    def to_car_infos(self):
+        """CarInfo 목록으로 복원 (int 컬럼은 int로, NaN은 None으로)"""
+        data = self.columns(COLUMNS)
+        car_info_list = []
+        for i in range(self.rows):
+            values = {}
+            for name in COLUMNS:
+                value = data[name][i]
+                kind = self.kinds[name]
+                if kind == "str":
+                    values[name] = value
+                elif np.isnan(value):
+                    values[name] = None
+                else:
+                    values[name] = int(value) if kind == "int" else float(value)
+            car_info_list.append(CarInfo(**values))
+        return car_info_list
+
+
+def open_snapshot(path=SNAPSHOT_DIR):
+    """스냅샷을 열되, 아직 없고 기존 pickle만 있으면 변환해서 연다"""
+    path = Path(path)
+    if not (path / "meta.json").exists() and LEGACY_PICKLE.exists():
+        convert_pickle(LEGACY_PICKLE, path)
+    return CarInfoSnapshot(path)
+
+
+def load_car_info(path=SNAPSHOT_DIR):
+    """스냅샷에서 CarInfo 목록을 불러오는 함수"""
+    return open_snapshot(path).to_car_infos()
+
+
+def convert_pickle(pickle_path=LEGACY_PICKLE, path=SNAPSHOT_DIR):
+    """기존 car_info_list.pkl을 컬럼 스냅샷으로 변환"""
+    with open(pickle_path, "rb") as f:
+        car_info_list = pickle.load(f)
+    write_snapshot(car_info_list, path)
+    print(f"✅ {pickle_path} → {path} 변환 완료 ({len(car_info_list)}건)")
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CarInfo 컬럼 스냅샷 도구")
+    sub = parser.add_subparsers(dest="command", required=True)
+    convert = sub.add_parser("convert", help="car_info_list.pkl을 컬럼 스냅샷으로 변환")
+    convert.add_argument("pickle_path", nargs="?", default=str(LEGACY_PICKLE))
+    convert.add_argument("path", nargs="?", default=str(SNAPSHOT_DIR))
+    args = parser.parse_args()
+
+    if args.command == "convert":
+        convert_pickle(args.pickle_path, args.path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,19 @@
+import os
+import time
+from pathlib import Path
+
+# Streamlit 카탈로그 캐시(car_catalog.py)가 감시하는 버전 마커 파일
+CATALOG_VERSION_FILE = Path(os.getenv(
+    "CATALOG_VERSION_FILE",
+    Path(__file__).resolve().parents[2] / "DB" / "catalog_version"
+))
+
+
+def publish_catalog_version():
+    """ETL 완료 후 버전 마커를 갱신해 Streamlit 카탈로그 스냅샷을 무효화하는 함수"""
+    version = str(time.time_ns())
+    CATALOG_VERSION_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = CATALOG_VERSION_FILE.with_suffix(".tmp")
+    tmp_path.write_text(version)
+    os.replace(tmp_path, CATALOG_VERSION_FILE)
+    return version
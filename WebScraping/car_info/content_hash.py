@@ -0,0 +1,30 @@
+import hashlib
+import json
+from dataclasses import asdict
+
+# 해시에서 제외하는 필드 (id는 수집 순서라 실행마다 달라짐)
+IGNORED_FIELDS = ("id",)
+
+
+def car_info_hash(car_info):
+    """CarInfo의 파싱된 필드로 만든 내용 해시 (sha256 hex)"""
+    fields = {k: v for k, v in asdict(car_info).items() if k not in IGNORED_FIELDS}
+    payload = json.dumps(fields, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def diff_car_infos(car_info_list, previous_hashes):
+    """이전 해시({model_name: hash})와 비교해 신규/변경/동일 목록으로 나눔
+    같은 모델명이 여러 번 있으면 마지막 것을 사용
+    이전 해시가 None인 모델(해시 컬럼 추가 전에 들어간 행)은 이미 있는 모델이므로 변경으로 분류"""
+    latest = {car_info.model_name: car_info for car_info in car_info_list if car_info.model_name}
+
+    new, changed, unchanged = [], [], []
+    for model_name, car_info in latest.items():
+        if model_name not in previous_hashes:
+            new.append(car_info)
+        elif previous_hashes[model_name] != car_info_hash(car_info):
+            changed.append(car_info)
+        else:
+            unchanged.append(car_info)
+    return new, changed, unchanged
@@ -0,0 +1,201 @@
+"""_01 ~ _04 스크립트를 한 번에 실행하는 ETL
+
+스냅샷을 한 번만 읽어 브랜드/바디타입/연료타입 차원 값을 메모리에서 만들고,
+하나의 연결과 하나의 트랜잭션 안에서 차원 테이블과 all_data를 일괄 저장하고
+car_info.car_model_id(리뷰 연결용 모델 대표 car_id)도 같은 트랜잭션에서 채운다.
+여러 번 실행해도 결과가 같다 (차원은 UPSERT, all_data는 전체 교체 또는 증분 반영).
+
+실행: python -m WebScraping.car_info.etl [--incremental] [--batch-size N]
+"""
+import argparse
+
+import mysql.connector
+
+from WebScraping.car_info.car_info_snapshot import open_snapshot
+from WebScraping.car_info.catalog_version import publish_catalog_version
+from WebScraping.car_info._04_all_data import (
+    BATCH_SIZE, create_all_data_table, save_car_infos, split_fuel_types, upsert_changed
+)
+from WebScraping.scrape_wait import StepTimer
+
+DB_CONFIG = dict(host='localhost', user='skn14', password='skn14', database='teamdb')
+
+# 세부 바디타입 → 바디타입 분류 (_02-1_add_body_type.py와 동일)
+BODY_TYPE_CATEGORY = {
+    '준대형 세단': '승용차',
+    '준대형 트럭': 'SUV',
+    '준대형 SUV': 'SUV',
+    '경형 RV': '경차',
+    '소형 SUV': 'SUV',
+    '중형 트럭': '기타',
+    '경형 해치백': '경차',
+    '준중형 세단': '승용차',
+    '소형 트럭': '기타',
+    '경형 밴': '경차',
+    '준중형 SUV': 'SUV',
+    '중형 밴': '기타',
+    '준중형 해치백': '승용차',
+    '중형 왜건': '승용차',
+    '소형 왜건': '승용차',
+    '소형 컨버터블': '승용차',
+    '스포츠카 쿠페': '승용차',
+    '대형 밴': '기타',
+    '준중형 RV': '승용차',
+    '소형 해치백': '승용차',
+    '준중형 밴': '기타',
+    '중형 SUV': 'SUV',
+    '대형 RV': 'SUV',
+    '중형 세단': '승용차',
+    '소형 밴': '기타',
+    '경형 SUV': '경차',
+    '준중형 트럭': '기타',
+}
+
+# 바디타입 분류 → category_id (_02-2_add_body_type_category_id.py와 동일)
+CATEGORY_IDS = {'경차': 1, '승용차': 2, 'SUV': 3, '기타': 4}
+
+
+def create_dimension_tables(cursor):
+    """차원 테이블 생성 (이미 있으면 _02-1/_02-2에서 추가하던 컬럼만 보강)"""
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS tbl_brand (
+            brand_id INT AUTO_INCREMENT PRIMARY KEY,
+            brand_name VARCHAR(255) UNIQUE
+        )
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS tbl_body_type (
+            body_type_id INT AUTO_INCREMENT PRIMARY KEY,
+            body_type VARCHAR(255) UNIQUE,
+            body_type_category VARCHAR(255),
+            category_id INT
+        )
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS tbl_fuel_type (
+            fuel_type_id INT AUTO_INCREMENT PRIMARY KEY,
+            fuel_type VARCHAR(255) UNIQUE
+        )
+    ''')
+
+    cursor.execute('''
+        SELECT COLUMN_NAME FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'tbl_body_type'
+    ''')
+    existing = {row[0] for row in cursor.fetchall()}
+    if 'body_type_category' not in existing:
+        cursor.execute('ALTER TABLE tbl_body_type ADD COLUMN body_type_category VARCHAR(255)')
+    if 'category_id' not in existing:
+        cursor.execute('ALTER TABLE tbl_body_type ADD COLUMN category_id INT')
+
+    create_all_data_table(cursor)
+
+
+def derive_dimensions(snapshot):
+    """스냅샷의 고유 값 목록만으로 차원 테이블에 들어갈 행을 만듦"""
+    brands = sorted(snapshot.distinct('brand'))
+
+    body_types = []
+    for body_type in sorted(snapshot.distinct('body_type')):
+        category = BODY_TYPE_CATEGORY.get(body_type)
+        body_types.append((body_type, category, CATEGORY_IDS.get(category)))
+
+    # all_data는 "가솔린, 하이브리드"처럼 여러 개인 연료 타입을 나눠 저장하므로 나눈 값 기준
+    fuel_types = sorted({
+        single for fuel_type in snapshot.distinct('fuel_type') for single in split_fuel_types(fuel_type)
+    })
+
+    return brands, body_types, fuel_types
+
+
+def upsert_dimensions(cursor, brands, body_types, fuel_types):
+    """차원 값을 일괄 UPSERT (이미 있는 값은 ID를 유지)"""
+    cursor.executemany('''
+        INSERT INTO tbl_brand (brand_name) VALUES (%s)
+        ON DUPLICATE KEY UPDATE brand_name = brand_name
+    ''', [(brand,) for brand in brands])
+
+    cursor.executemany('''
+        INSERT INTO tbl_body_type (body_type, body_type_category, category_id) VALUES (%s, %s, %s)
+        ON DUPLICATE KEY UPDATE
+            body_type_category = COALESCE(VALUES(body_type_category), body_type_category),
+            category_id = COALESCE(VALUES(category_id), category_id)
+    ''', body_types)
+
+    cursor.executemany('''
+        INSERT INTO tbl_fuel_type (fuel_type) VALUES (%s)
+        ON DUPLICATE KEY UPDATE fuel_type = fuel_type
+    ''', [(fuel_type,) for fuel_type in fuel_types])
+
+
+def run_etl(incremental=False, batch_size=BATCH_SIZE, timer=None):
+    """스냅샷 → 차원 테이블 → all_data를 하나의 트랜잭션으로 적재하고 결과 요약을 반환"""
+    timer = timer or StepTimer()
+
+    with timer.step("load_snapshot"):
+        snapshot = open_snapshot()
+        car_info_list = snapshot.to_car_infos()
+
+    with timer.step("derive_dimensions"):
+        brands, body_types, fuel_types = derive_dimensions(snapshot)
+
+    conn = mysql.connector.connect(**DB_CONFIG)
+    cursor = conn.cursor()
+    try:
+        # DDL은 MySQL에서 자동 커밋되므로 트랜잭션 시작 전에 실행
+        with timer.step("create_tables"):
+            create_dimension_tables(cursor)
+
+        conn.start_transaction()
+
+        with timer.step("upsert_dimensions"):
+            upsert_dimensions(cursor, brands, body_types, fuel_types)
+
+        with timer.step("load_all_data"):
+            if incremental:
+                new_count, changed_count, unchanged_count = upsert_changed(cursor, car_info_list, batch_size)
+            else:
+                # 전체 교체: 같은 스냅샷으로 다시 실행해도 행이 늘어나지 않음
+                cursor.execute('DELETE FROM all_data')
+                save_car_infos(cursor, car_info_list, batch_size)
+                new_count, changed_count, unchanged_count = len(car_info_list), 0, 0
+
+        with timer.step("commit"):
+            conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+        conn.close()
+
+    return {
+        "cars": len(car_info_list),
+        "brands": len(brands),
+        "body_types": len(body_types),
+        "fuel_types": len(fuel_types),
+        "new": new_count,
+        "changed": changed_count,
+        "unchanged": unchanged_count,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="차량 정보 ETL (_01~_04 통합)")
+    parser.add_argument("--incremental", action="store_true", help="all_data는 바뀐 모델과 신규 모델만 반영")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="executemany 한 번에 보내는 행 수")
+    args = parser.parse_args()
+
+    timer = StepTimer()
+    summary = run_etl(incremental=args.incremental, batch_size=args.batch_size, timer=timer)
+    print(f"✅ ETL 완료: {summary}")
+
+    if summary["new"] or summary["changed"]:
+        # Streamlit 카탈로그 캐시 무효화
+        print(f"✅ 카탈로그 버전 갱신: {publish_catalog_version()}")
+
+    timer.print_report()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,31 +1,86 @@
+import argparse
+
 from WebScraping.car_info.car_info_dao import CarInfoDAO
+from WebScraping.car_info.content_hash import car_info_hash, diff_car_infos
+from WebScraping.car_info.car_info_snapshot import SNAPSHOT_DIR, open_snapshot, write_snapshot
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="네이버 자동차 정보 수집")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="상세 페이지 동시 수집 작업자 수 (0이면 기존 순차 수집)")
+    parser.add_argument("--mode", choices=["http", "driver"], default="http",
+                        help="동시 수집 방식: http(브라우저 없이) / driver(헤드리스 Chrome 여러 개)")
+    parser.add_argument("--rps", type=float, default=2.0, help="호스트당 초당 요청 수 제한")
+    parser.add_argument("--url-file", help="URL 목록 파일 (한 줄에 하나, 지정하면 검색/필터 단계를 건너뜀)")
+    parser.add_argument("--checkpoint", help="수집 결과를 이어 쓸 체크포인트 파일 (중단 후 다시 실행하면 이어서 수집)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="이전 결과와 내용 해시를 비교해 변경분을 보고하고, 이번에 수집하지 못한 모델은 이전 값을 유지")
+    return parser.parse_args()
+
+def main(args=None):
+    args = args or parse_args()
 
-def main():
-    dao = CarInfoDAO()
+    # URL 목록 파일을 쓰는 HTTP 동시 수집에는 브라우저가 필요 없음
+    use_browser = not (args.url_file and args.workers > 0 and args.mode == "http")
+    dao = CarInfoDAO(use_browser=use_browser)
+    if args.checkpoint:
+        dao.enable_checkpoint(args.checkpoint)
 
     try:
-        dao.open_site()
-        dao.apply_filters()
-        dao.collect_urls()
-        dao.collect_car_info()
+        if args.url_file:
+            with open(args.url_file, encoding="utf-8") as f:
+                dao.url_list = [line.strip() for line in f if line.strip()]
+        else:
+            dao.open_site()
+            dao.apply_filters()
+            dao.collect_urls()
+
+        if args.workers > 0:
+            dao.collect_car_info_concurrent(workers=args.workers, mode=args.mode, requests_per_second=args.rps)
+        else:
+            dao.collect_car_info()
 
     finally:
         dao.quit()
+        # 단계별 수집 시간 보고
+        dao.timer.print_report()
 
     #print("\n✅ 최종 수집된 CarInfo 수:", len(dao.get_car_info_list()))
 
     # 크롤링 후 최종 수집된 데이터
     car_info_list = dao.get_car_info_list()
 
+    if args.incremental:
+        car_info_list = merge_with_previous(car_info_list)
+
     # car_info_list 반환
     return car_info_list
 
+def load_previous(path=SNAPSHOT_DIR):
+    """이전 실행의 car_info_list (없으면 빈 목록)"""
+    try:
+        return open_snapshot(path).to_car_infos()
+    except FileNotFoundError:
+        return []
+
+def merge_with_previous(car_info_list, path=SNAPSHOT_DIR):
+    """이전 결과와 비교해 신규/변경/동일 모델 수를 출력하고 병합한 목록을 반환
+    이번 실행에서 타임아웃 등으로 빠진 모델은 이전 값을 그대로 유지"""
+    previous = load_previous(path)
+    previous_hashes = {car_info.model_name: car_info_hash(car_info) for car_info in previous}
+    new, changed, unchanged = diff_car_infos(car_info_list, previous_hashes)
+
+    print(f"✅ 증분 수집 결과: 신규 {len(new)}, 변경 {len(changed)}, 동일 {len(unchanged)}")
+    for car_info in changed:
+        print(f"  변경: {car_info.model_name}")
+
+    merged = {car_info.model_name: car_info for car_info in previous}
+    merged.update((car_info.model_name, car_info) for car_info in car_info_list if car_info.model_name)
+    return list(merged.values())
+
 if __name__ == "__main__":
     # 크롤링 데이터 저장
     car_info_list = main()
 
-    # 저장된 데이터를 pickle로 저장
-    import pickle
-    with open('car_info_list.pkl', 'wb') as f:
-        pickle.dump(car_info_list, f)
-
+    # 저장된 데이터를 컬럼 스냅샷으로 저장 (_01~_04가 읽음)
+    print(f"✅ 스냅샷 저장: {write_snapshot(car_info_list)}")
@@ -0,0 +1,296 @@
+"""차량 상세정보와 오너평가를 한 번의 크롤링으로 수집하는 파이프라인
+
+모델 URL 목록은 한 번만 수집해 디스크에 캐시하고, 모델마다 상세정보(정보) 페이지와
+오너평가 페이지를 이어서 방문한다.
+수집 결과는 저장 스레드(BatchWriter)가 배치마다 오너평가를 DB에 저장하고 체크포인트에 남긴다.
+중간에 멈춰도 다시 실행하면 체크포인트에 있는 모델은 건너뛰고 이어서 수집한다.
+
+실행: python -m WebScraping.crawl_pipeline [--workers N] [--refresh-urls] [--skip-db] [--restart]
+"""
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+
+from WebScraping.car_info.car_info_dao import (
+    CarInfoDAO, MODEL_NAME_SELECTOR, SPEC_URL_SUFFIX, REVIEW_URL_SUFFIX
+)
+from WebScraping.car_info.car_info_dto import CarInfo
+from WebScraping.car_info.car_info_snapshot import SNAPSHOT_DIR, write_snapshot
+from WebScraping.page_fetcher import DriverPool
+from WebScraping.batch_writer import BatchWriter, JsonlCheckpoint
+from WebScraping.review_writer import REVIEW_FLUSH_SIZE, save_review_batch
+from WebScraping.review_parser import parse_review, parse_comments, REVIEW_TITLE_SELECTOR, COMMENT_BOX_SELECTOR
+from WebScraping.scrape_wait import wait_present, wait_optional
+
+# 모델 URL 캐시 파일과 유효 시간(초)
+MODEL_URL_CACHE = Path(os.getenv(
+    "MODEL_URL_CACHE", Path(__file__).resolve().parent / "cache" / "model_urls.json"
+))
+MODEL_URL_CACHE_MAX_AGE = float(os.getenv("MODEL_URL_CACHE_MAX_AGE", str(24 * 3600)))
+
+# 저장이 끝난 모델을 기록하는 체크포인트 (전체 수집이 끝나면 삭제)
+CRAWL_CHECKPOINT = Path(os.getenv(
+    "CRAWL_CHECKPOINT", Path(__file__).resolve().parent / "cache" / "crawl_checkpoint.jsonl"
+))
+
+@dataclass
+class ModelResult:
+    """모델 하나의 수집 결과 (상세정보 + 오너평가)"""
+    idx: int
+    model_url: str
+    car_info: CarInfo = None
+    review: dict = None
+    comments: list = field(default_factory=list)
+    errors: list = field(default_factory=list)
+
+
+def load_model_urls(path=MODEL_URL_CACHE, max_age=MODEL_URL_CACHE_MAX_AGE):
+    """캐시된 모델 URL 목록 (없거나 만료되었으면 None)"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if time.time() - cached.get("collected_at", 0) > max_age:
+        return None
+    return cached.get("urls") or None
+
+
+def save_model_urls(urls, path=MODEL_URL_CACHE):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"collected_at": time.time(), "urls": urls}, f, ensure_ascii=False, indent=2)
+
+
+def scrape_model(dao, driver, idx, model_url):
+    """한 드라이버로 모델의 상세정보 페이지와 오너평가 페이지를 차례로 수집"""
+    result = ModelResult(idx=idx, model_url=model_url)
+
+    try:
+        with dao.timer.step("spec_page_load"):
+            driver.get(model_url + SPEC_URL_SUFFIX)
+            wait_present(driver, (By.CSS_SELECTOR, MODEL_NAME_SELECTOR))
+        with dao.timer.step("spec_page_parse"):
+            result.car_info = dao.parse_car_info(driver.page_source, idx)
+    except TimeoutException:
+        result.errors.append("상세정보 타임아웃")
+    except Exception as e:
+        result.errors.append(f"상세정보 오류: {e}")
+
+    try:
+        with dao.timer.step("review_page_load"):
+            driver.get(model_url + REVIEW_URL_SUFFIX)
+            # 리뷰/댓글이 없는 모델도 있으므로 나타나지 않아도 진행
+            if wait_optional(EC.presence_of_element_located((By.CSS_SELECTOR, REVIEW_TITLE_SELECTOR)), driver):
+                wait_optional(EC.presence_of_element_located((By.CSS_SELECTOR, COMMENT_BOX_SELECTOR)), driver)
+        with dao.timer.step("review_page_parse"):
+            html = driver.page_source
+            result.review = parse_review(html)
+            if result.review:
+                result.comments = parse_comments(html)
+    except Exception as e:
+        result.errors.append(f"오너평가 오류: {e}")
+
+    status = result.car_info.model_name if result.car_info else "모델명 없음"
+    review_status = f"리뷰 {result.review['avg_score']}점, 댓글 {len(result.comments)}개" if result.review else "리뷰 없음"
+    print(f"[{idx}] {status} / {review_status} {' '.join(result.errors)}")
+    return result
+
+
+def review_dtos(result):
+    """수집 결과의 오너평가를 (리뷰 DTO, 댓글 DTO 목록)으로 변환"""
+    from DB.dto.car_review_dto import CarReviewDTO
+    from DB.dto.comment_info_dto import CommentDTO
+
+    review = result.review
+    car_review = CarReviewDTO(review["car_name"], review["avg_score"], review["survey_people_count"], review["graph_info"])
+    comments = [
+        CommentDTO(
+            None,
+            comment["nickname"],
+            comment["comment_avg_score"],
+            comment["comment_text"],
+            comment["created_at"]
+        )
+        for comment in result.comments
+    ]
+    return car_review, comments
+
+
+class CrawlWriter:
+    """모델별 수집 결과를 저장 스레드로 넘겨 배치마다 오너평가를 저장하고 체크포인트에 남기는 writer
+
+    체크포인트에는 모델 URL, 상세정보(CarInfo), 리뷰 유무와 저장 여부를 한 줄씩 기록한다.
+    같은 URL이 여러 번 기록되면 마지막 기록을 쓴다."""
+
+    def __init__(self, checkpoint_path=CRAWL_CHECKPOINT, save_db=True, batch_size=REVIEW_FLUSH_SIZE):
+        Path(checkpoint_path).parent.mkdir(parents=True, exist_ok=True)
+        self.checkpoint = JsonlCheckpoint(checkpoint_path)
+        self.daos = self._create_daos() if save_db else None
+        self.saved_reviews = 0
+        self.saved_comments = 0
+        self._writer = BatchWriter(
+            self._write_batch,
+            batch_size=batch_size,
+            on_written=self._record_checkpoint,
+            name="crawl-writer"
+        )
+
+    @staticmethod
+    def _create_daos():
+        # DB 연결은 저장할 때만 필요
+        from WebScraping.mysql_connector import db_connection
+        from DB.dao.car_review_dao import CarReviewDAO
+        from DB.dao.comment_info_dao import CommentDAO
+
+        return CarReviewDAO(db_connection), CommentDAO(db_connection)
+
+    def records(self):
+        """모델 URL → 마지막 체크포인트 기록"""
+        return {record["key"]: record for record in self.checkpoint.load()}
+
+    def done_urls(self):
+        """다시 수집하지 않아도 되는 모델 URL (오류 없이 수집했고 리뷰가 있으면 저장까지 끝난 것)"""
+        return {
+            url for url, record in self.records().items()
+            if not record["errors"] and (not record["has_review"] or record["review_saved"])
+        }
+
+    def put(self, result):
+        # 큐가 가득 차면 저장이 따라올 때까지 대기
+        self._writer.put((result, review_dtos(result) if result.review else None))
+
+    def _write_batch(self, items):
+        if self.daos is None:
+            return
+        saved_reviews, saved_comments = save_review_batch(*self.daos, [dtos for _, dtos in items if dtos])
+        self.saved_reviews += saved_reviews
+        self.saved_comments += saved_comments
+
+    def _record_checkpoint(self, items):
+        self.checkpoint.append(
+            {
+                "key": result.model_url,
+                "idx": result.idx,
+                "car_info": asdict(result.car_info) if result.car_info else None,
+                "has_review": dtos is not None,
+                # 저장에 실패한 리뷰는 다음 실행에서 다시 수집
+                "review_saved": dtos is not None and getattr(dtos[0], "review_id", None) is not None,
+                "errors": result.errors,
+            }
+            for result, dtos in items
+        )
+
+    def close(self):
+        self._writer.close()
+
+    def stats(self):
+        return dict(self._writer.stats(), saved_reviews=self.saved_reviews, saved_comments=self.saved_comments)
+
+
+def crawl(writer, workers=1, refresh_urls=False):
+    """모델 URL 수집(또는 캐시 사용) 후 모델별 상세정보와 오너평가를 수집해 writer로 넘김
+    체크포인트에 있는 모델은 건너뜀, 반환: (전체 모델 URL 목록, 단계별 타이머)"""
+    model_urls = None if refresh_urls else load_model_urls()
+
+    # URL 캐시가 있고 여러 작업자를 쓰면 검색용 브라우저는 필요 없음
+    dao = CarInfoDAO(use_browser=model_urls is None or workers <= 1)
+    try:
+        if model_urls is None:
+            dao.open_site()
+            dao.apply_filters()
+            dao.collect_model_urls()
+            model_urls = dao.model_urls
+            save_model_urls(model_urls)
+            print(f"✅ 모델 URL {len(model_urls)}개 수집 후 캐시 저장: {MODEL_URL_CACHE}")
+        else:
+            print(f"✅ 캐시된 모델 URL {len(model_urls)}개 사용: {MODEL_URL_CACHE}")
+
+        done_urls = writer.done_urls()
+        if done_urls:
+            print(f"체크포인트에서 이미 수집된 모델 {len(done_urls)}개를 건너뜁니다")
+        jobs = [(idx, url) for idx, url in enumerate(model_urls, 1) if url not in done_urls]
+        if workers <= 1:
+            for idx, url in jobs:
+                writer.put(scrape_model(dao, dao.driver, idx, url))
+        else:
+            pool = DriverPool(size=workers)
+            try:
+                def task(job):
+                    with pool.borrow() as driver:
+                        return scrape_model(dao, driver, *job)
+
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    # 끝난 순서가 아니라 모델 순서대로 넘기되, 결과를 모아 두지 않고 바로 저장 스레드로 보냄
+                    for result in executor.map(task, jobs):
+                        writer.put(result)
+            finally:
+                pool.close()
+    finally:
+        dao.quit()
+
+    return model_urls, dao.timer
+
+
+def save_car_info(records, model_urls, path=SNAPSHOT_DIR):
+    """체크포인트 기록으로 ETL 스크립트(_01~_04)가 읽는 차량 정보 스냅샷 저장 (모델 URL 순서)"""
+    car_info_list = [
+        CarInfo(**records[url]["car_info"])
+        for url in model_urls
+        if url in records and records[url]["car_info"]
+    ]
+    write_snapshot(car_info_list, path)
+    print(f"✅ 차량 정보 {len(car_info_list)}건 저장: {path}")
+    return car_info_list
+
+
+def main():
+    parser = argparse.ArgumentParser(description="상세정보 + 오너평가 통합 수집")
+    parser.add_argument("--workers", type=int, default=1, help="동시에 사용할 헤드리스 드라이버 수")
+    parser.add_argument("--refresh-urls", action="store_true", help="모델 URL 캐시를 무시하고 다시 수집")
+    parser.add_argument("--skip-db", action="store_true", help="오너평가를 DB에 저장하지 않음")
+    parser.add_argument("--restart", action="store_true", help="체크포인트를 지우고 처음부터 수집")
+    args = parser.parse_args()
+
+    if args.restart:
+        JsonlCheckpoint(CRAWL_CHECKPOINT).clear()
+
+    writer = CrawlWriter(CRAWL_CHECKPOINT, save_db=not args.skip_db)
+    try:
+        model_urls, timer = crawl(writer, workers=args.workers, refresh_urls=args.refresh_urls)
+    finally:
+        # 큐에 남은 결과까지 저장 (중단되어도 저장된 모델은 체크포인트에 남음)
+        writer.close()
+        print(f"저장 스레드 통계: {writer.stats()}")
+
+    records = writer.records()
+    save_car_info(records, model_urls)
+    if not args.skip_db:
+        print(f"✅ 오너평가 {writer.saved_reviews}건, 댓글 {writer.saved_comments}건 저장 (이번 실행)")
+
+    no_review_car_names = [
+        records[url]["car_info"]["model_name"]
+        for url in model_urls
+        if url in records and records[url]["car_info"] and not records[url]["has_review"]
+    ]
+    if no_review_car_names:
+        print(f"리뷰가 없는 차 이름들: {no_review_car_names}")
+
+    remaining = set(model_urls) - writer.done_urls()
+    if remaining:
+        print(f"다시 수집할 모델 {len(remaining)}개가 체크포인트에 남아 있습니다 (다시 실행하면 이어서 수집)")
+    else:
+        writer.checkpoint.clear()
+    timer.print_report()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""저장해 둔 HTML을 로컬에서 서빙하는 테스트용 HTTP 서버
+
+실행: python -m WebScraping.fixture_server <HTML 폴더> [--port 8000]
+이후 http://127.0.0.1:8000/<파일명> 목록을 --url-file 로 넘겨 수집 과정을 재현할 수 있음
+"""
+import argparse
+import functools
+import threading
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+
+
+class FixtureHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+def start_fixture_server(directory, port=0, handler_class=FixtureHandler):
+    """백그라운드 스레드로 서버를 띄우고 (server, base_url) 반환 (port=0이면 빈 포트 자동 선택)
+    handler_class: 지연/실패 응답을 흉내 내는 테스트용 FixtureHandler 하위 클래스"""
+    handler = functools.partial(handler_class, directory=str(directory))
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="저장된 HTML 서빙용 로컬 서버")
+    parser.add_argument("directory")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+
+    server, base_url = start_fixture_server(args.directory, args.port)
+    print(f"✅ {args.directory} 를 {base_url} 에서 서빙 중 (Ctrl+C로 종료)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
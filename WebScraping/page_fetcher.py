@@ -0,0 +1,133 @@
+import queue
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+    ),
+    "Accept-Language": "ko-KR,ko;q=0.9",
+}
+
+
+class HostRateLimiter:
+    """호스트별 초당 요청 수를 제한하는 클래스 (여러 스레드에서 공유)"""
+
+    def __init__(self, requests_per_second=2.0):
+        self.interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_allowed = {}
+
+    def wait(self, url):
+        host = urlsplit(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_allowed.get(host, now))
+            self._next_allowed[host] = slot + self.interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+def is_retryable(error):
+    """재시도할 만한 오류인지 판단 (4xx는 429만 재시도)"""
+    if isinstance(error, urllib.error.HTTPError):
+        return error.code == 429 or error.code >= 500
+    return True
+
+
+def fetch_with_retry(fetch, url, rate_limiter=None, retries=3, backoff=1.0):
+    """fetch(url)을 실패 시 지수 백오프(backoff * 2^n + 지터)로 재시도"""
+    for attempt in range(retries + 1):
+        if rate_limiter:
+            rate_limiter.wait(url)
+        try:
+            return fetch(url)
+        except Exception as e:
+            if attempt == retries or not is_retryable(e):
+                raise
+            time.sleep(backoff * (2 ** attempt) + random.uniform(0, backoff / 2))
+
+
+def fetch_pages(urls, fetch, workers=4, rate_limiter=None, retries=3, backoff=1.0):
+    """urls를 workers개 스레드로 동시에 가져와 입력 순서대로 반환
+    실패한 URL 자리에는 예외 객체가 들어감"""
+    def task(url):
+        try:
+            return fetch_with_retry(fetch, url, rate_limiter, retries, backoff)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(task, urls))
+
+
+class HttpFetcher:
+    """브라우저 없이 HTTP로 페이지 HTML을 가져오는 fetcher"""
+
+    def __init__(self, timeout=10, headers=None):
+        self.timeout = timeout
+        self.headers = dict(DEFAULT_HEADERS, **(headers or {}))
+
+    def fetch(self, url):
+        request = urllib.request.Request(url, headers=self.headers)
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            charset = response.headers.get_content_charset() or "utf-8"
+            return response.read().decode(charset, errors="replace")
+
+    def close(self):
+        pass
+
+
+class DriverPool:
+    """헤드리스 Chrome 드라이버 여러 개를 돌려 쓰는 fetcher
+    wait_selector가 나타날 때까지 기다린 뒤 page_source를 반환"""
+
+    def __init__(self, size=2, wait_selector=None, timeout=10):
+        # selenium은 드라이버 모드에서만 필요
+        from selenium import webdriver
+
+        self.wait_selector = wait_selector
+        self.timeout = timeout
+        self._drivers = []
+        self._idle = queue.Queue()
+        for _ in range(size):
+            options = webdriver.ChromeOptions()
+            options.add_argument("--headless=new")
+            options.add_argument("--log-level=3")
+            driver = webdriver.Chrome(options=options)
+            self._drivers.append(driver)
+            self._idle.put(driver)
+
+    @contextmanager
+    def borrow(self):
+        """쉬고 있는 드라이버 하나를 빌려 쓰고 돌려놓음"""
+        driver = self._idle.get()
+        try:
+            yield driver
+        finally:
+            self._idle.put(driver)
+
+    def fetch(self, url):
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+
+        with self.borrow() as driver:
+            driver.get(url)
+            if self.wait_selector:
+                WebDriverWait(driver, self.timeout).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, self.wait_selector))
+                )
+            return driver.page_source
+
+    def close(self):
+        for driver in self._drivers:
+            driver.quit()
@@ -0,0 +1,94 @@
+import re
+from datetime import datetime, timedelta
+
+from bs4 import BeautifulSoup as bs
+
+# 오너평가 페이지 로딩 완료를 판단하는 선택자
+REVIEW_TITLE_SELECTOR = ".area_text_title"
+COMMENT_BOX_SELECTOR = ".u_cbox_comment_box"
+
+# 차량별로 저장하는 댓글 수
+MAX_COMMENTS = 6
+
+
+# 설문 조사 사람들 숫자만 가져오기
+def get_count_ppl(ppl_unformatted: str) -> int:
+    ppl_formatted = "".join(c for c in ppl_unformatted if c.isdigit())
+    return int(ppl_formatted)
+
+#댓글 ~시간전 ~일전 따로 계산하기
+def convert_relative_time_to_datetime(relative_time: str) -> str:
+    now = datetime.now()  # 현재 시간
+
+    # '일 전', '시간 전', '분 전' 등을 처리하는 정규 표현식
+    day_pattern = r"(\d+)일 전"
+    hour_pattern = r"(\d+)시간 전"
+    minute_pattern = r"(\d+)분 전"
+
+    # '일 전' 처리
+    match = re.search(day_pattern, relative_time)
+    if match:
+        days_ago = int(match.group(1))
+        return (now - timedelta(days=days_ago)).strftime('%Y-%m-%d %H:%M:%S')
+
+    # '시간 전' 처리
+    match = re.search(hour_pattern, relative_time)
+    if match:
+        hours_ago = int(match.group(1))
+        return (now - timedelta(hours=hours_ago)).strftime('%Y-%m-%d %H:%M:%S')
+
+    # '분 전' 처리
+    match = re.search(minute_pattern, relative_time)
+    if match:
+        minutes_ago = int(match.group(1))
+        return (now - timedelta(minutes=minutes_ago)).strftime('%Y-%m-%d %H:%M:%S')
+
+    # 그 외의 경우 (예: '방금')
+    return now.strftime('%Y-%m-%d %H:%M:%S')
+
+
+def _text(tag, separator=""):
+    return tag.get_text(separator, strip=True) if tag else None
+
+
+def parse_review(html):
+    """오너평가 페이지에서 리뷰 요약을 추출
+    반환: {car_name, avg_score, survey_people_count, graph_info} (리뷰가 없으면 None)"""
+    soup = bs(html, 'html.parser')
+
+    car_name = _text(soup.select_one(REVIEW_TITLE_SELECTOR), " ")
+    avg_score = _text(soup.select_one(".area_star_number._avg"))
+    count_ppl = _text(soup.select_one(".area_people"))
+    if not (car_name and avg_score and count_ppl):
+        return None
+
+    # 그래프 데이터 ("항목\n점수" 형식을 쉼표로 연결)
+    graph_data = [li.get_text("\n", strip=True) for li in soup.select(".guide._chart_label > li")]
+
+    return {
+        "car_name": car_name,
+        "avg_score": avg_score,
+        "survey_people_count": get_count_ppl(count_ppl),
+        "graph_info": ",".join(graph_data),
+    }
+
+
+def parse_comments(html, limit=MAX_COMMENTS):
+    """오너평가 페이지에서 댓글 최대 limit개를 추출
+    반환: [{nickname, comment_avg_score, comment_text, created_at}, ...]"""
+    soup = bs(html, 'html.parser')
+    comments = []
+    for box in soup.select(COMMENT_BOX_SELECTOR)[:limit]:
+        nickname = _text(box.select_one(".u_cbox_nick"))
+        average_rating = _text(box.select_one(".u_cbox_multirating_totalcount_value"))
+        comment_text = _text(box.select_one(".u_cbox_contents"), "\n")
+        date = _text(box.select_one(".u_cbox_date"))
+        if nickname is None or comment_text is None:
+            continue
+        comments.append({
+            "nickname": nickname,
+            "comment_avg_score": average_rating,
+            "comment_text": comment_text,
+            "created_at": convert_relative_time_to_datetime(date or ""),
+        })
+    return comments
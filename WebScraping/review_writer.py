@@ -0,0 +1,105 @@
+import os
+
+from WebScraping.batch_writer import BatchWriter, JsonlCheckpoint
+
+# 몇 대의 차량 리뷰를 모았다가 한 번에 저장할지
+REVIEW_FLUSH_SIZE = int(os.getenv("REVIEW_FLUSH_SIZE", "20"))
+
+
+def save_review_batch(car_review_dao, comment_info_dao, pending):
+    """[(리뷰 DTO, 댓글 DTO 목록), ...]의 리뷰를 일괄 저장한 뒤 생성된 review_id를 댓글에 연결해 저장
+    반환: (저장된 리뷰 수, 저장된 댓글 수)"""
+    if not pending:
+        return 0, 0
+
+    review_ids = car_review_dao.insert_car_reviews([car_review for car_review, _ in pending])
+
+    comments = []
+    for (car_review, review_comments), review_id in zip(pending, review_ids):
+        if review_id is None:
+            # 리뷰 저장에 실패하면 그 리뷰의 댓글도 저장하지 않음
+            continue
+        for comment in review_comments:
+            comment.review_id = review_id
+            comments.append(comment)
+    comment_ids = comment_info_dao.insert_comments(comments)
+
+    print(f"✅ 리뷰 {len(review_ids)}건 / 댓글 {len(comments)}건 일괄 저장")
+    return (
+        sum(review_id is not None for review_id in review_ids),
+        sum(comment_id is not None for comment_id in comment_ids)
+    )
+
+
+class ReviewBuffer:
+    """리뷰와 댓글을 모아 두었다가 DAO의 일괄 저장 메서드로 한 번에 저장하는 버퍼"""
+
+    def __init__(self, car_review_dao, comment_info_dao, flush_size=REVIEW_FLUSH_SIZE):
+        self.car_review_dao = car_review_dao
+        self.comment_info_dao = comment_info_dao
+        self.flush_size = flush_size
+        self._pending = []
+        self.saved_reviews = 0
+        self.saved_comments = 0
+
+    def add(self, car_review, comments=()):
+        """리뷰 DTO와 그 리뷰의 댓글 DTO 목록을 추가 (review_id는 저장 시 채워짐)"""
+        self._pending.append((car_review, list(comments)))
+        if len(self._pending) >= self.flush_size:
+            self.flush()
+
+    def flush(self):
+        pending, self._pending = self._pending, []
+        saved_reviews, saved_comments = save_review_batch(self.car_review_dao, self.comment_info_dao, pending)
+        self.saved_reviews += saved_reviews
+        self.saved_comments += saved_comments
+
+    def close(self):
+        self.flush()
+
+
+class ReviewWriter:
+    """리뷰 저장을 별도 스레드에서 처리하는 writer (수집 스레드는 put만 하고 바로 다음 페이지로)
+    저장이 끝난 URL은 체크포인트 파일에 남겨, 중간에 중단되어도 다시 실행하면 이어서 수집할 수 있다"""
+
+    def __init__(self, car_review_dao, comment_info_dao, checkpoint_path=None, batch_size=REVIEW_FLUSH_SIZE):
+        self.car_review_dao = car_review_dao
+        self.comment_info_dao = comment_info_dao
+        self.checkpoint = JsonlCheckpoint(checkpoint_path) if checkpoint_path else None
+        self.saved_reviews = 0
+        self.saved_comments = 0
+        self._writer = BatchWriter(
+            self._write_batch,
+            batch_size=batch_size,
+            on_written=self._record_checkpoint,
+            name="review-writer"
+        )
+
+    def done_urls(self):
+        """이전 실행에서 저장까지 끝난 URL 집합"""
+        return self.checkpoint.done_keys() if self.checkpoint else set()
+
+    def put(self, url, car_review, comments=()):
+        self._writer.put((url, car_review, list(comments)))
+
+    def _write_batch(self, items):
+        saved_reviews, saved_comments = save_review_batch(
+            self.car_review_dao,
+            self.comment_info_dao,
+            [(car_review, comments) for _, car_review, comments in items]
+        )
+        self.saved_reviews += saved_reviews
+        self.saved_comments += saved_comments
+
+    def _record_checkpoint(self, items):
+        if self.checkpoint:
+            # 저장에 실패한 리뷰는 다음 실행에서 다시 수집하도록 기록하지 않음
+            self.checkpoint.append(
+                {"key": url} for url, car_review, _ in items if getattr(car_review, "review_id", None) is not None
+            )
+
+    def close(self):
+        self._writer.close()
+
+    def stats(self):
+        return dict(self._writer.stats(), saved_reviews=self.saved_reviews, saved_comments=self.saved_comments)
@@ -0,0 +1,84 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+# 조건 대기 최대 시간(초) - 고정 sleep 대신 이 시간 안에 조건이 만족되면 바로 진행
+WAIT_TIMEOUT = float(os.getenv("SCRAPE_WAIT_TIMEOUT", "10"))
+# 없을 수도 있는 요소(댓글 등)를 기다리는 최대 시간(초)
+OPTIONAL_WAIT_TIMEOUT = float(os.getenv("SCRAPE_OPTIONAL_WAIT_TIMEOUT", "3"))
+
+
+def wait_present(driver, locator, timeout=None):
+    """요소가 DOM에 나타날 때까지 대기 후 반환"""
+    return WebDriverWait(driver, timeout or WAIT_TIMEOUT).until(EC.presence_of_element_located(locator))
+
+
+def wait_clickable(driver, locator, timeout=None):
+    """요소가 클릭 가능해질 때까지 대기 후 반환"""
+    return WebDriverWait(driver, timeout or WAIT_TIMEOUT).until(EC.element_to_be_clickable(locator))
+
+
+def wait_optional(condition, driver, timeout=None):
+    """조건을 기다리되 시간 초과 시 예외 없이 None 반환 (없을 수도 있는 요소용)"""
+    try:
+        return WebDriverWait(driver, timeout or OPTIONAL_WAIT_TIMEOUT).until(condition)
+    except TimeoutException:
+        return None
+
+
+def wait_text_changed(driver, locator, old_text, timeout=None):
+    """요소의 텍스트가 old_text와 달라질 때까지 대기 (필터 적용 후 목록 갱신 확인용)
+    시간 초과 시 False 반환"""
+    def changed(d):
+        elements = d.find_elements(*locator)
+        return bool(elements) and elements[0].text != old_text
+
+    return wait_optional(changed, driver, timeout or WAIT_TIMEOUT) is not None
+
+
+class StepTimer:
+    """수집 단계별 소요 시간을 누적하고 보고서로 출력하는 클래스"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._steps = {}
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def step(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def record(self, name, seconds):
+        with self._lock:
+            stat = self._steps.setdefault(name, {"count": 0, "total": 0.0, "max": 0.0})
+            stat["count"] += 1
+            stat["total"] += seconds
+            stat["max"] = max(stat["max"], seconds)
+
+    def report(self):
+        """단계별 횟수/합계/평균/최대 시간 표 문자열"""
+        wall = time.perf_counter() - self._started
+        lines = [f"{'단계':<24}{'횟수':>6}{'합계(s)':>10}{'평균(s)':>10}{'최대(s)':>10}{'비중':>8}"]
+        with self._lock:
+            steps = sorted(self._steps.items(), key=lambda item: -item[1]["total"])
+        for name, stat in steps:
+            lines.append(
+                f"{name:<24}{stat['count']:>6}{stat['total']:>10.2f}"
+                f"{stat['total'] / stat['count']:>10.2f}{stat['max']:>10.2f}"
+                f"{stat['total'] / wall * 100 if wall else 0:>7.1f}%"
+            )
+        lines.append(f"전체 경과 시간: {wall:.2f}s")
+        return "\n".join(lines)
+
+    def print_report(self):
+        print("\n⏱ 단계별 수집 시간")
+        print(self.report())
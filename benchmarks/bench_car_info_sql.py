@@ -0,0 +1,184 @@
+"""car_info 숫자 컬럼 타입/인덱스(DB/migrations/001) 적용 전후의 쿼리 시간과 실행 계획 비교
+
+합성 차량 n대로 varchar 버전과 숫자 타입 + 인덱스 버전 벤치 테이블을 만들고
+3페이지 추천 쿼리와 4페이지 목록 쿼리를 반복 실행한다. MySQL 서버가 필요하다.
+접속 정보는 Streamlit 앱과 같은 DB_HOST/DB_USER/DB_PASSWORD/DB_NAME 환경변수를 쓴다.
+
+실행: python benchmarks/bench_car_info_sql.py [차량 수 ...] [--repeat N] [--keep]
+"""
+import argparse
+import os
+import random
+import time
+
+import mysql.connector
+from dotenv import load_dotenv
+
+from synthetic import synthetic_car_columns, BODY_TYPES, FUEL_TYPES
+
+VARCHAR_TABLE = "car_info_bench_varchar"
+TYPED_TABLE = "car_info_bench_typed"
+
+# 바디타입 분류/연료 이름 → car_info에 저장되는 ID
+CATEGORY_IDS = {name: i for i, name in enumerate(BODY_TYPES, 1)}
+FUEL_IDS = {name: i for i, name in enumerate(FUEL_TYPES, 1)}
+
+CREATE_VARCHAR = f"""
+    CREATE TABLE {VARCHAR_TABLE} (
+        car_id INT PRIMARY KEY,
+        car_full_name VARCHAR(255),
+        category_id INT,
+        car_fuel_type INT,
+        car_price VARCHAR(255),
+        car_horsepower VARCHAR(255),
+        car_fuel_efficiency VARCHAR(255),
+        car_size VARCHAR(255)
+    )
+"""
+
+CREATE_TYPED = f"""
+    CREATE TABLE {TYPED_TABLE} (
+        car_id INT PRIMARY KEY,
+        car_full_name VARCHAR(255),
+        category_id INT,
+        car_fuel_type INT,
+        car_price INT,
+        car_horsepower INT,
+        car_fuel_efficiency DECIMAL(6, 1),
+        car_size DECIMAL(6, 2),
+        INDEX idx_car_info_category_fuel_price (category_id, car_fuel_type, car_price),
+        INDEX idx_car_info_fuel_price (car_fuel_type, car_price),
+        INDEX idx_car_info_price_id (car_price, car_id)
+    )
+"""
+
+# (이름, varchar 테이블용 쿼리, 숫자 타입 테이블용 쿼리) - {table} 자리에 테이블 이름
+QUERIES = [
+    (
+        "추천 (바디+연료+예산, 선호도 정렬)",
+        """SELECT car_id FROM {table}
+           WHERE CAST(car_price AS DECIMAL(10, 2)) BETWEEN %s AND %s AND category_id = %s AND car_fuel_type = %s
+           ORDER BY CAST(car_fuel_efficiency AS DECIMAL(10, 2)) ASC, CAST(car_price AS DECIMAL(10, 2)) ASC,
+                    CAST(car_size AS DECIMAL(10, 2)) DESC, car_id ASC
+           LIMIT 3""",
+        """SELECT car_id FROM {table}
+           WHERE car_price BETWEEN %s AND %s AND category_id = %s AND car_fuel_type = %s
+           ORDER BY car_fuel_efficiency ASC, car_price ASC, car_size DESC, car_id ASC
+           LIMIT 3""",
+    ),
+    (
+        "목록 (필터 없음, 가격순 3페이지)",
+        """SELECT car_id FROM {table}
+           ORDER BY CAST(car_price AS DECIMAL(10, 2)), car_id LIMIT 8 OFFSET 16""",
+        """SELECT car_id FROM {table}
+           ORDER BY car_price, car_id LIMIT 8 OFFSET 16""",
+    ),
+    (
+        "목록 (연료+예산, 가격순)",
+        """SELECT car_id FROM {table}
+           WHERE CAST(car_price AS DECIMAL(10, 2)) BETWEEN %s AND %s AND car_fuel_type = %s
+           ORDER BY CAST(car_price AS DECIMAL(10, 2)), car_id LIMIT 8""",
+        """SELECT car_id FROM {table}
+           WHERE car_price BETWEEN %s AND %s AND car_fuel_type = %s
+           ORDER BY car_price, car_id LIMIT 8""",
+    ),
+]
+
+
+def connect():
+    load_dotenv()
+    return mysql.connector.connect(
+        host=os.getenv("DB_HOST", "localhost"),
+        user=os.getenv("DB_USER"),
+        password=os.getenv("DB_PASSWORD"),
+        database=os.getenv("DB_NAME", "teamdb"),
+    )
+
+
+def create_tables(cursor, n, batch_size=5000):
+    cols = synthetic_car_columns(n)
+    rows = [
+        (
+            int(cols["car_id"][i]),
+            cols["car_full_name"][i],
+            CATEGORY_IDS[cols["body_type_category"][i]],
+            FUEL_IDS[cols["fuel_type_name"][i]],
+            int(cols["car_price"][i]),
+            int(cols["car_horsepower"][i]),
+            float(cols["car_fuel_efficiency"][i]),
+            float(cols["car_size"][i]),
+        )
+        for i in range(n)
+    ]
+    for table, ddl in ((VARCHAR_TABLE, CREATE_VARCHAR), (TYPED_TABLE, CREATE_TYPED)):
+        cursor.execute(f"DROP TABLE IF EXISTS {table}")
+        cursor.execute(ddl)
+        insert = f"INSERT INTO {table} VALUES (%s, %s, %s, %s, %s, %s, %s, %s)"
+        for start in range(0, n, batch_size):
+            # varchar 테이블에도 같은 값을 넣음 (드라이버가 문자열로 변환)
+            cursor.executemany(insert, rows[start:start + batch_size])
+        cursor.execute(f"ANALYZE TABLE {table}")
+        cursor.fetchall()
+
+
+def query_params(name, rnd):
+    min_val, max_val = sorted(rnd.sample(range(1000, 5001, 500), 2))
+    if name.startswith("추천"):
+        return (min_val, max_val, rnd.choice(list(CATEGORY_IDS.values())), rnd.choice(list(FUEL_IDS.values())))
+    if "연료" in name:
+        return (min_val, max_val, rnd.choice(list(FUEL_IDS.values())))
+    return ()
+
+
+def explain(cursor, query, params):
+    """EXPLAIN 결과에서 벤치 테이블 행의 (type, key, rows, Extra)"""
+    cursor.execute("EXPLAIN " + query, params)
+    columns = [d[0] for d in cursor.description]
+    for row in cursor.fetchall():
+        plan = dict(zip(columns, row))
+        if plan["table"] in (VARCHAR_TABLE, TYPED_TABLE):
+            return plan["type"], plan["key"], plan["rows"], plan["Extra"]
+    return None
+
+
+def bench(cursor, n, repeat):
+    print(f"\n차량 {n:,}대 (쿼리마다 {repeat}회)")
+    for name, varchar_query, typed_query in QUERIES:
+        for label, table, query in (("varchar", VARCHAR_TABLE, varchar_query), ("typed", TYPED_TABLE, typed_query)):
+            query = query.format(table=table)
+            # 두 버전이 같은 입력 순서를 쓰도록 같은 시드 사용
+            rnd = random.Random(0)
+            params_list = [query_params(name, rnd) for _ in range(repeat)]
+            start = time.perf_counter()
+            for params in params_list:
+                cursor.execute(query, params)
+                cursor.fetchall()
+            avg_ms = (time.perf_counter() - start) * 1000 / repeat
+            plan = explain(cursor, query, params_list[0])
+            print(f"  {name:<28} {label:<8} {avg_ms:8.2f} ms  plan={plan}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="car_info 타입/인덱스 벤치마크")
+    parser.add_argument("sizes", nargs="*", type=int, default=[10_000, 200_000])
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--keep", action="store_true", help="벤치 테이블을 지우지 않음")
+    args = parser.parse_args()
+
+    conn = connect()
+    cursor = conn.cursor()
+    try:
+        for n in args.sizes:
+            create_tables(cursor, n)
+            conn.commit()
+            bench(cursor, n, args.repeat)
+    finally:
+        if not args.keep:
+            for table in (VARCHAR_TABLE, TYPED_TABLE):
+                cursor.execute(f"DROP TABLE IF EXISTS {table}")
+        cursor.close()
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
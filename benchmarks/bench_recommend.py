@@ -0,0 +1,55 @@
+"""우선순위 순 정렬과 가중치 점수 추천 방식의 실행 시간 비교
+
+실행: python benchmarks/bench_recommend.py [차량 수 ...]
+"""
+import itertools
+import random
+import sys
+import time
+
+from synthetic import synthetic_car_columns, BODY_TYPES, FUEL_TYPES
+
+from car_catalog import CarCatalog
+from recommend import RecommendEngine, PREFERENCE_COLUMNS, MODE_LEXICOGRAPHIC, MODE_WEIGHTED
+
+
+def make_requests(count, seed=0):
+    """옵션 페이지에서 나올 수 있는 입력 조합을 무작위로 생성"""
+    rnd = random.Random(seed)
+    budgets = list(range(1000, 5001, 500))
+    triples = list(itertools.permutations(PREFERENCE_COLUMNS, 3))
+    requests = []
+    for _ in range(count):
+        min_val, max_val = sorted(rnd.sample(budgets, 2))
+        requests.append((min_val, max_val, rnd.choice(BODY_TYPES), rnd.choice(FUEL_TYPES), rnd.choice(triples)))
+    return requests
+
+
+def bench(n, repeat):
+    start = time.perf_counter()
+    catalog = CarCatalog.from_columns(synthetic_car_columns(n), version=1)
+    engine = RecommendEngine(catalog)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    requests = make_requests(repeat)
+    print(f"\n차량 {n:,}대 (스냅샷+엔진 생성 {build_ms:,.0f} ms, 요청 {repeat}회)")
+    for mode in (MODE_LEXICOGRAPHIC, MODE_WEIGHTED):
+        start = time.perf_counter()
+        for min_val, max_val, body, fuel, prefs in requests:
+            mask = engine.filter_mask(min_val, max_val, body, fuel)
+            if mode == MODE_WEIGHTED:
+                engine.weighted_top_k_indices(mask, prefs, 3)
+            else:
+                engine.top_k_indices(mask, prefs, 3)
+        per_request_us = (time.perf_counter() - start) / repeat * 1e6
+        print(f"  {mode:<14} {per_request_us:>12,.1f} us/요청")
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 1_000_000]
+    for n in sizes:
+        bench(n, repeat=200 if n <= 100_000 else 20)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""통계 탭 상위 차량 집계: 기존 방식(슬라이스마다 groupby)과 한 번에 집계하는 방식 비교
+
+실행: python benchmarks/bench_stats_topk.py [추천 건수 ...] [--repeat N]
+"""
+import argparse
+import time
+
+import pandas as pd
+
+from synthetic import synthetic_recommendation_columns, AGE_GROUPS, JOBS
+
+from stats_summary import top_cars_by_dimension
+
+TOP_K = {"age_group": 3, "user_gender": 5, "job_name": 3}
+
+
+def legacy_top_cars(stats_df):
+    """기존 4_fourth_page 방식: 연령대/성별마다 슬라이스 후 groupby, 직업은 groupby 후 정렬
+    반환: {(차원, 값): [추천 수, ...]} (기존 직업 정렬은 직업 안의 순위 순서를 보장하지 않아 내림차순으로 맞춤)"""
+    result = {}
+    for age in AGE_GROUPS[:3]:
+        age_data = stats_df[stats_df['age_group'] == age]
+        top_cars = (
+            age_data.groupby('car_full_name').size().reset_index(name='count')
+            .sort_values('count', ascending=False).head(3)
+        )
+        result[("age_group", age)] = sorted(top_cars['count'], reverse=True)
+    for gender in stats_df['user_gender'].dropna().unique():
+        gender_data = stats_df[stats_df['user_gender'] == gender]
+        top_cars = (
+            gender_data.groupby('car_full_name').size().reset_index(name='count')
+            .sort_values('count', ascending=False).head(5)
+        )
+        result[("user_gender", gender)] = sorted(top_cars['count'], reverse=True)
+    job_car = stats_df.groupby(['job_name', 'car_full_name']).size().reset_index(name='count')
+    top3_job_car = (
+        job_car.sort_values(['job_name', 'count'], ascending=[True, False])
+        .groupby('job_name').head(3)
+    )
+    top3_job_car['job_name'] = pd.Categorical(top3_job_car['job_name'], categories=JOBS, ordered=True)
+    top3_job_car = top3_job_car.sort_values(['job_name'])
+    offset_list = []
+    offset_counter = 0
+    for job in JOBS:
+        count = top3_job_car[top3_job_car['job_name'] == job].shape[0]
+        offset_list.extend([offset_counter + i for i in range(count)])
+        offset_counter += count + 4
+    top3_job_car['offset'] = offset_list
+    for job, rows in top3_job_car.groupby('job_name', observed=True):
+        result[("job_name", job)] = sorted(rows['count'], reverse=True)
+    return result
+
+
+def single_pass_top_cars(stats_df):
+    summary = top_cars_by_dimension(stats_df, TOP_K)
+    summary.chart_frame("job_name", JOBS)
+    return {
+        (dimension, value): list(rows['count'])
+        for (dimension, value), rows in summary.frame.groupby(['dimension', 'value'], sort=False)
+        if dimension != "age_group" or value in AGE_GROUPS[:3]
+    }
+
+
+def timed_ms(func, stats_df, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func(stats_df)
+    return (time.perf_counter() - start) * 1000 / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="통계 탭 상위 차량 집계 벤치마크")
+    parser.add_argument("sizes", nargs="*", type=int, default=[10_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for n in args.sizes:
+        stats_df = pd.DataFrame(synthetic_recommendation_columns(n))
+        legacy_ms, legacy = timed_ms(legacy_top_cars, stats_df, args.repeat)
+        single_ms, single = timed_ms(single_pass_top_cars, stats_df, args.repeat)
+        # 동점 차량은 순서가 다를 수 있으므로 순위별 추천 수로 비교
+        same = legacy == single
+        print(f"\n추천 {n:,}건 ({args.repeat}회 평균)")
+        print(f"  기존 (슬라이스별 groupby) {legacy_ms:10.1f} ms")
+        print(f"  한 번에 집계              {single_ms:10.1f} ms  ({legacy_ms / single_ms:.1f}배, 결과 일치: {same})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""벤치마크용 합성 데이터 생성 함수 모음"""
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Streamlit 앱 모듈(car_catalog, recommend 등)을 import 할 수 있도록 경로 추가
+APP_DIR = Path(__file__).resolve().parents[1] / "streamlit" / "ryuuung_practice"
+if str(APP_DIR) not in sys.path:
+    sys.path.insert(0, str(APP_DIR))
+
+BODY_TYPES = ["경차", "승용차", "SUV", "기타"]
+FUEL_TYPES = ["디젤", "가솔린", "하이브리드", "전기"]
+BRANDS = ["현대", "기아", "제네시스", "KGM", "르노코리아", "쉐보레", "BMW", "벤츠"]
+AGE_GROUPS = ["20대", "30대", "40대", "50대 이상"]
+GENDERS = ["남", "여"]
+JOBS = ["대학생", "사무직", "IT/개발", "서비스직", "생산직", "기타"]
+
+
+def synthetic_car_columns(n, seed=0):
+    """CarCatalog.from_columns에 넣을 합성 차량 n대의 컬럼 배열"""
+    rng = np.random.default_rng(seed)
+    car_id = np.arange(1, n + 1)
+    return {
+        "car_id": car_id,
+        "brand_name": rng.choice(BRANDS, n),
+        "car_full_name": np.array([f"합성차량 {i}" for i in car_id], dtype=object),
+        "car_price": rng.integers(900, 5500, n).astype(np.float64),
+        "car_fuel_efficiency": np.round(rng.uniform(5, 25, n), 1),
+        "car_horsepower": rng.integers(60, 400, n).astype(np.float64),
+        "car_size": np.round(rng.uniform(50, 65, n), 2),
+        "avg_score": np.round(rng.uniform(0, 10, n), 1),
+        "fuel_type_name": rng.choice(FUEL_TYPES, n),
+        "body_type_category": rng.choice(BODY_TYPES, n),
+    }
+
+
+def synthetic_recommendation_columns(n, n_cars=500, seed=0):
+    """통계 탭 집계에 넣을 합성 추천 기록 n건의 컬럼 배열 (인기 차량이 몰리도록 Zipf 분포)"""
+    rng = np.random.default_rng(seed)
+    car_index = np.minimum(rng.zipf(1.3, n), n_cars) - 1
+    car_names = np.array([f"합성차량 {i + 1}" for i in range(n_cars)], dtype=object)
+    return {
+        "age_group": rng.choice(AGE_GROUPS, n),
+        "user_gender": rng.choice(GENDERS, n),
+        "job_name": rng.choice(JOBS, n),
+        "car_full_name": car_names[car_index],
+    }
@@ -1,20 +1,11 @@
 import streamlit as st
-import base64
 
-# 파일 경로
-background_image_path = "../../docs/background.png"
-logo_image_path = "../../docs/차근차근 로고.png"
+from assets import BACKGROUND, LOGO, asset_url
 
-# base64 인코딩 함수
-def get_base64_of_bin_file(bin_file):
-    with open(bin_file, 'rb') as f:
-        data = f.read()
-    return base64.b64encode(data).decode()
-
-# 배경 및 로고 CSS
-def set_background_and_logo(bg_path, logo_path):
-    bg_base64 = get_base64_of_bin_file(bg_path)
-    logo_base64 = get_base64_of_bin_file(logo_path)
+# 배경 및 로고 CSS (이미지는 프로세스당 한 번만 인코딩, 정적 파일 제공이 켜져 있으면 URL로 참조)
+def set_background_and_logo(bg_spec, logo_spec):
+    bg_url = asset_url(bg_spec)
+    logo_url = asset_url(logo_spec)
     st.markdown(f"""
         <style>
         .block-container {{
@@ -23,7 +14,7 @@ def set_background_and_logo(bg_path, logo_path):
             padding-right: 2rem;
         }}
         .stApp {{
-            background-image: url("data:image/png;base64,{bg_base64}");
+            background-image: url("{bg_url}");
             background-size: cover;
             background-position: center;
             background-repeat: no-repeat;
@@ -87,10 +78,10 @@ def set_background_and_logo(bg_path, logo_path):
             color: #FFD600;
         }}
         </style>
-        <img src="data:image/png;base64,{logo_base64}" class="custom-logo">
+        <img src="{logo_url}" class="custom-logo">
         """, unsafe_allow_html=True)
 
-set_background_and_logo(background_image_path, logo_image_path)
+set_background_and_logo(BACKGROUND, LOGO)
 
 # 중앙 컨텐츠 (HTML+Streamlit 버튼)
 st.markdown("""
@@ -0,0 +1,163 @@
+"""정적 이미지(배경, 로고, 아이콘) 캐시
+
+이미지마다 프로세스당 한 번만 읽어서 필요하면 줄이고 WebP로 변환한다.
+결과는 원본 내용 해시 + 옵션을 키로 메모리에 보관하고, static/assets/에 같은 키의 파일 이름으로 저장한다.
+- Streamlit 정적 파일 제공(server.enableStaticServing, .streamlit/config.toml)이 켜져 있으면
+  CSS/HTML에는 /app/static/assets/... URL을 넣어 브라우저가 따로 받아 캐시하게 함
+- 꺼져 있으면 캐시해 둔 data URI를 넣음 (인코딩은 한 번만)
+- st.image에는 캐시해 둔 bytes를 넘김
+
+Pillow가 없으면 원본 그대로 쓴다 (크기 조절/WebP 변환 생략).
+"""
+import base64
+import hashlib
+import io
+import os
+import threading
+from pathlib import Path
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+APP_DIR = Path(__file__).resolve().parent
+DOCS_DIR = APP_DIR.parents[1] / "docs"
+STATIC_DIR = APP_DIR / "static" / "assets"
+STATIC_URL = "app/static/assets"
+
+# WebP 변환 여부와 품질
+ASSET_WEBP = os.getenv("ASSET_WEBP", "1") == "1"
+ASSET_WEBP_QUALITY = int(os.getenv("ASSET_WEBP_QUALITY", "85"))
+
+MIME_TYPES = {".png": "image/png", ".jpg": "image/jpeg", ".jpeg": "image/jpeg", ".webp": "image/webp"}
+PIL_FORMATS = {".png": "PNG", ".jpg": "JPEG", ".jpeg": "JPEG"}
+
+# 자주 쓰는 이미지 (화면에 표시되는 최대 폭의 2배로 줄임, 고해상도 화면 대비)
+BACKGROUND = (DOCS_DIR / "background.png", 2048)
+LOGO = (DOCS_DIR / "차근차근 로고.png", 360)
+BUDGET_ICON = (DOCS_DIR / "예산_아이콘.png", 200)
+FALLBACK_CAR_IMAGE = (DOCS_DIR / "대체이미지.png", 1000)
+
+
+class Asset:
+    """인코딩이 끝난 이미지 하나"""
+
+    def __init__(self, key, data, mime, filename):
+        self.key = key
+        self.data = data
+        self.mime = mime
+        self.filename = filename
+        self._data_uri = None
+
+    @property
+    def data_uri(self):
+        if self._data_uri is None:
+            self._data_uri = f"data:{self.mime};base64,{base64.b64encode(self.data).decode()}"
+        return self._data_uri
+
+    @property
+    def url(self):
+        """CSS/HTML에 넣을 주소 (정적 파일 제공이 켜져 있으면 static URL, 아니면 data URI)"""
+        if static_serving_enabled() and self._write_static():
+            return f"{STATIC_URL}/{self.filename}"
+        return self.data_uri
+
+    def _write_static(self):
+        """static/assets/에 파일이 없으면 저장 (이름에 내용 해시가 들어가므로 내용이 같으면 한 번만)"""
+        path = STATIC_DIR / self.filename
+        if path.exists():
+            return True
+        try:
+            STATIC_DIR.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(path.name + ".tmp")
+            tmp.write_bytes(self.data)
+            os.replace(tmp, path)
+            return True
+        except OSError as e:
+            print(f"정적 파일 저장 실패 ({path}): {e}")
+            return False
+
+
+def static_serving_enabled():
+    """Streamlit 정적 파일 제공 설정 (STATIC_SERVING 환경변수로 덮어쓸 수 있음)"""
+    env = os.getenv("STATIC_SERVING")
+    if env is not None:
+        return env == "1"
+    try:
+        import streamlit as st
+        return bool(st.get_option("server.enableStaticServing"))
+    except Exception:
+        return False
+
+
+def _encode(data, suffix, max_width, webp):
+    """원본 bytes를 (bytes, 확장자)로 변환 (Pillow가 없거나 변환할 필요가 없으면 원본)"""
+    if Image is None or (max_width is None and not webp):
+        return data, suffix
+    image = Image.open(io.BytesIO(data))
+    if max_width and image.width > max_width:
+        image = image.resize((max_width, round(image.height * max_width / image.width)), Image.LANCZOS)
+    elif not webp:
+        return data, suffix
+    out = io.BytesIO()
+    if webp:
+        image.save(out, "WEBP", quality=ASSET_WEBP_QUALITY, method=6)
+        return out.getvalue(), ".webp"
+    image.save(out, PIL_FORMATS.get(suffix, "PNG"), optimize=True)
+    return out.getvalue(), suffix
+
+
+_lock = threading.Lock()
+# (경로, 수정 시각, 크기, 옵션) → Asset / 원본 내용 해시 + 옵션 → Asset
+_by_file = {}
+_by_hash = {}
+_stats = {"hits": 0, "encoded": 0, "source_bytes": 0, "encoded_bytes": 0}
+
+
+def get_asset(path, max_width=None, webp=None):
+    """이미지를 한 번만 인코딩해 Asset으로 반환 (파일이 바뀌면 다시 인코딩)"""
+    path = Path(path)
+    webp = ASSET_WEBP if webp is None else webp
+    stat = path.stat()
+    file_key = (str(path), stat.st_mtime_ns, stat.st_size, max_width, webp)
+    asset = _by_file.get(file_key)
+    if asset is not None:
+        _stats["hits"] += 1
+        return asset
+
+    with _lock:
+        if file_key in _by_file:
+            return _by_file[file_key]
+        source = path.read_bytes()
+        digest = hashlib.sha256(source).hexdigest()[:16]
+        key = (digest, max_width, webp)
+        asset = _by_hash.get(key)
+        if asset is None:
+            data, suffix = _encode(source, path.suffix.lower(), max_width, webp)
+            filename = f"{digest}-{max_width or 'full'}{suffix}"
+            asset = Asset(key, data, MIME_TYPES.get(suffix, "application/octet-stream"), filename)
+            _by_hash[key] = asset
+            _stats["encoded"] += 1
+            _stats["source_bytes"] += len(source)
+            _stats["encoded_bytes"] += len(data)
+        _by_file[file_key] = asset
+        return asset
+
+
+def asset_url(spec):
+    """(경로, 최대 폭) 이미지의 CSS/HTML용 주소"""
+    path, max_width = spec
+    return get_asset(path, max_width).url
+
+
+def show_image(spec, **kwargs):
+    """(경로, 최대 폭) 이미지를 캐시된 bytes로 st.image에 표시"""
+    import streamlit as st
+
+    path, max_width = spec
+    st.image(get_asset(path, max_width).data, **kwargs)
+
+
+def asset_stats():
+    return dict(_stats, cached=len(_by_hash))
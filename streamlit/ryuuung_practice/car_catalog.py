@@ -0,0 +1,296 @@
+import hashlib
+import os
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+# 스냅샷 유효 시간(초)과 ETL이 기록하는 버전 마커 파일 경로
+CATALOG_TTL_SECONDS = float(os.getenv("CATALOG_TTL_SECONDS", "600"))
+CATALOG_VERSION_FILE = Path(os.getenv(
+    "CATALOG_VERSION_FILE",
+    Path(__file__).resolve().parents[2] / "DB" / "catalog_version"
+))
+
+# CAR_INFO + 조회 테이블 전체를 한 번에 읽어오는 쿼리
+CATALOG_QUERY = """
+    SELECT
+        ci.car_id,
+        bi.brand_name,
+        ci.car_full_name,
+        ci.car_price,
+        ci.car_img_url,
+        ci.car_fuel_efficiency,
+        ci.car_horsepower,
+        ci.car_engine_type,
+        ci.car_model_year,
+        ci.car_size,
+        fi.fuel_type_name,
+        bti.body_type_category,
+        COALESCE(cri.avg_score, 0) as avg_score
+    FROM teamdb.CAR_INFO ci
+    JOIN teamdb.BRAND_INFO bi
+        ON ci.car_brand = bi.brand_id
+    JOIN teamdb.BODY_TYPE_INFO bti
+        ON ci.car_body_type = bti.body_name
+    JOIN teamdb.FUEL_TYPE_INFO fi
+        ON ci.car_fuel_type = fi.fuel_type_id
+    LEFT JOIN (
+        SELECT car_id, MAX(avg_score) as avg_score
+        FROM teamdb.CAR_REVIEW_INFO
+        GROUP BY car_id
+    ) cri ON cri.car_id = ci.car_model_id
+    ORDER BY ci.car_id
+"""
+
+LOOKUP_QUERIES = {
+    "brand_name": "SELECT DISTINCT brand_name FROM teamdb.BRAND_INFO",
+    "body_type_category": "SELECT DISTINCT body_type_category FROM teamdb.BODY_TYPE_INFO",
+    "fuel_type_name": "SELECT DISTINCT fuel_type_name FROM teamdb.FUEL_TYPE_INFO",
+}
+
+# 화면에 그대로 보여주는 원본 컬럼
+RAW_COLUMNS = [
+    "car_id", "brand_name", "car_full_name", "car_price", "car_img_url",
+    "car_fuel_efficiency", "car_horsepower", "car_engine_type", "car_model_year",
+    "car_size", "fuel_type_name", "body_type_category", "avg_score",
+]
+
+# 필터용 범주형 컬럼 (문자열 비교 대신 정수 코드로 비교)
+CATEGORY_COLUMNS = ["brand_name", "body_type_category", "fuel_type_name"]
+
+# 필터/정렬용 숫자 컬럼 (DB에는 varchar로 저장되어 있어 float로 변환, 값이 없으면 NaN)
+NUMERIC_COLUMNS = [
+    "car_price", "car_fuel_efficiency", "car_horsepower", "car_size", "avg_score",
+]
+
+
+def _to_float(value):
+    try:
+        return float(str(value).replace(",", ""))
+    except (TypeError, ValueError):
+        return np.nan
+
+
+class CarCatalog:
+    """차량 카탈로그 스냅샷 (컬럼별 numpy 배열)"""
+
+    def __init__(self, rows, lookups=None, version=0):
+        columns = {col: [row.get(col) for row in rows] for col in RAW_COLUMNS}
+        self._init_columns(columns, lookups, version)
+        self.fingerprint = data_fingerprint(rows, lookups)
+
+    @classmethod
+    def from_columns(cls, columns, lookups=None, version=0):
+        """컬럼별 배열(dict)로 스냅샷 생성 (없는 컬럼은 None으로 채움)"""
+        catalog = cls.__new__(cls)
+        catalog._init_columns(columns, lookups, version)
+        return catalog
+
+    def _init_columns(self, columns, lookups, version):
+        self.version = version
+        self.fingerprint = None
+        self.loaded_at = time.monotonic()
+        self.size = len(columns["car_id"])
+        self.raw = {}
+        for col in RAW_COLUMNS:
+            values = columns.get(col)
+            self.raw[col] = np.full(self.size, None, dtype=object) if values is None else np.asarray(values, dtype=object)
+        self.num = {}
+        for col in NUMERIC_COLUMNS:
+            values = columns.get(col)
+            if isinstance(values, np.ndarray) and values.dtype.kind in "iuf":
+                self.num[col] = values.astype(np.float64)
+            else:
+                self.num[col] = np.array([_to_float(v) for v in self.raw[col]], dtype=np.float64)
+        self.codes = {}
+        self.categories = {}
+        for col in CATEGORY_COLUMNS:
+            categories = {}
+            self.codes[col] = np.array(
+                [categories.setdefault(v, len(categories)) for v in self.raw[col]], dtype=np.int32
+            )
+            self.categories[col] = categories
+        self.car_id = np.asarray(columns["car_id"]).astype(np.int64)
+        self.lookups = lookups or {}
+        self._image_by_name = None
+        # 필터 조합별 차량 수 (스냅샷이 바뀌면 객체째 교체되므로 따로 무효화할 필요 없음)
+        self._counts = {}
+
+    def _category_mask(self, column, value):
+        code = self.categories[column].get(value)
+        if code is None:
+            return np.zeros(self.size, dtype=bool)
+        return self.codes[column] == code
+
+    def __len__(self):
+        return self.size
+
+    def mask(self, price_range=None, min_efficiency=None, body_type=None, fuel_type=None, brand=None):
+        """조건에 맞는 행의 boolean 마스크 (NaN 비교는 SQL의 NULL처럼 False)"""
+        mask = np.ones(self.size, dtype=bool)
+        if price_range:
+            price = self.num["car_price"]
+            mask &= (price >= price_range[0]) & (price <= price_range[1])
+        if min_efficiency is not None:
+            mask &= self.num["car_fuel_efficiency"] >= min_efficiency
+        if body_type and body_type != "전체":
+            mask &= self._category_mask("body_type_category", body_type)
+        if fuel_type and fuel_type != "전체":
+            mask &= self._category_mask("fuel_type_name", fuel_type)
+        if brand and brand != "전체":
+            mask &= self._category_mask("brand_name", brand)
+        return mask
+
+    def rows(self, indices):
+        """인덱스 배열에 해당하는 행을 dict 리스트로 반환"""
+        return [
+            {col: self.raw[col][i] for col in RAW_COLUMNS}
+            for i in indices
+        ]
+
+    def count(self, **filters):
+        key = filter_key(filters)
+        if key not in self._counts:
+            self._counts[key] = int(np.count_nonzero(self.mask(**filters)))
+        return self._counts[key]
+
+    def _after_mask(self, after):
+        """(가격, car_id) 키보다 뒤에 오는 행의 마스크 (가격 없는 차량이 가장 앞, SQL의 NULL 정렬과 같음)"""
+        price_key, id_key = after
+        price_key = _to_float(price_key)
+        price = self.num["car_price"]
+        no_price = np.isnan(price)
+        if np.isnan(price_key):
+            return ~no_price | (self.car_id > id_key)
+        return (price > price_key) | ((price == price_key) & (self.car_id > id_key))
+
+    def page(self, limit=8, offset=0, after=None, **filters):
+        """가격 오름차순(가격 없는 차량이 먼저, 동일 가격은 car_id 순)으로 정렬한 뒤 limit/offset 만큼 반환
+        after=(가격, car_id)를 주면 그 키 다음 행부터 반환 (키셋 페이지네이션)"""
+        mask = self.mask(**filters)
+        if after is not None:
+            mask &= self._after_mask(after)
+        idx = np.flatnonzero(mask)
+        price = self.num["car_price"][idx]
+        order = np.lexsort((self.car_id[idx], np.nan_to_num(price, nan=-np.inf), ~np.isnan(price)))
+        return self.rows(idx[order][offset:offset + limit])
+
+    def image_urls(self, names):
+        """차량명 → 이미지 URL (같은 이름이 여러 개면 car_id가 가장 작은 행 기준)"""
+        if self._image_by_name is None:
+            image_by_name = {}
+            for i in np.argsort(self.car_id, kind="stable"):
+                image_by_name.setdefault(self.raw["car_full_name"][i], self.raw["car_img_url"][i])
+            self._image_by_name = image_by_name
+        return {name: self._image_by_name.get(name) for name in names}
+
+    def distinct(self, column, only_in_use=True):
+        """컬럼의 고유값 목록 (only_in_use=False면 조회 테이블 전체)"""
+        if not only_in_use and column in self.lookups:
+            return list(self.lookups[column])
+        values = []
+        seen = set()
+        for value in self.raw[column]:
+            if value is not None and value not in seen:
+                seen.add(value)
+                values.append(value)
+        return values
+
+
+def data_fingerprint(rows, lookups=None):
+    """적재한 행과 조회 목록의 내용 해시 (TTL 재적재 때 내용이 바뀌었는지 비교용)"""
+    return hashlib.sha256(repr((rows, sorted((lookups or {}).items()))).encode("utf-8")).hexdigest()
+
+
+def filter_key(filters):
+    """필터 dict를 캐시 키로 쓸 수 있는 튜플로 변환 (값이 None인 필터는 제외)"""
+    return tuple(sorted((name, value) for name, value in filters.items() if value is not None))
+
+
+def _read_version_marker():
+    """ETL이 기록한 버전 마커 (파일이 없으면 None)"""
+    try:
+        stat = CATALOG_VERSION_FILE.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _load_from_db():
+    # streamlit 없이도 CarCatalog를 쓸 수 있도록 DB 모듈은 여기서 import
+    from db_pool import fetch_all
+
+    rows = fetch_all(CATALOG_QUERY, label="load_catalog")
+    lookups = {
+        col: [row[0] for row in fetch_all(query, dictionary=False, label="load_catalog_lookup") if row[0] is not None]
+        for col, query in LOOKUP_QUERIES.items()
+    }
+    return rows, lookups
+
+
+def _report_load_error(error):
+    """적재 실패를 다른 화면 오류와 같이 st.error로 표시 (streamlit 없이 쓰는 경우에는 예외를 그대로 올림)"""
+    try:
+        import streamlit as st
+    except ImportError:
+        raise error
+    st.error(f"카탈로그 적재 실패: {error}")
+
+
+_lock = threading.Lock()
+_catalog = None
+_catalog_marker = None
+_version_counter = 0
+
+
+def get_catalog(loader=_load_from_db):
+    """프로세스 공용 카탈로그 스냅샷 반환 (TTL 만료 또는 ETL 버전 변경 시 재적재)
+    TTL 만료로 다시 읽었는데 버전 마커와 내용이 그대로면 기존 스냅샷(버전)을 유지하고 유효 시간만 연장
+    (스냅샷이 바뀌면 추천 엔진과 추천 캐시를 새로 만들기 때문)"""
+    global _catalog, _catalog_marker, _version_counter
+
+    if os.getenv("USE_CATALOG_CACHE", "1") != "1":
+        return None
+
+    marker = _read_version_marker()
+    catalog = _catalog
+    if (catalog is not None
+            and marker == _catalog_marker
+            and time.monotonic() - catalog.loaded_at < CATALOG_TTL_SECONDS):
+        return catalog
+
+    with _lock:
+        # 다른 스레드가 이미 새로 적재했으면 그대로 사용
+        if (_catalog is not None and _catalog is not catalog
+                and marker == _catalog_marker):
+            return _catalog
+        try:
+            rows, lookups = loader()
+        except Exception as e:
+            _report_load_error(e)
+            rows, lookups = None, None
+        if not rows:
+            # DB 조회 실패 시 이전 스냅샷이라도 유지
+            return _catalog
+        if (_catalog is not None and marker == _catalog_marker
+                and _catalog.fingerprint == data_fingerprint(rows, lookups)):
+            _catalog.loaded_at = time.monotonic()
+            return _catalog
+        _version_counter += 1
+        _catalog = CarCatalog(rows, lookups, version=_version_counter)
+        _catalog_marker = marker
+        return _catalog
+
+
+def catalog_version():
+    """ETL이 기록한 카탈로그 버전 (DB 조회 결과 캐시의 무효화 키로 사용)"""
+    return _read_version_marker()
+
+
+def invalidate_catalog():
+    """다음 get_catalog() 호출 때 다시 적재하도록 스냅샷 폐기"""
+    global _catalog
+    with _lock:
+        _catalog = None
@@ -0,0 +1,441 @@
+"""차량 이미지(car_img_url) 로컬 썸네일 캐시
+
+원격 이미지를 URL마다 한 번만 내려받아 CAR_THUMB_WIDTH 폭의 WebP 썸네일로 줄여 디스크에 저장하고,
+이후에는 로컬 bytes로 표시한다 (렌더링할 때마다 원본 크기 이미지를 다시 받지 않음).
+- 썸네일 파일 이름은 내용 해시 (같은 이미지를 쓰는 URL이 여러 개여도 파일은 하나)
+- URL → 파일 이름은 ref 디렉터리에 URL 해시 이름의 작은 파일로 기록 (재시작 후에도 유지)
+- 전체 크기가 CAR_IMAGE_CACHE_MAX_MB를 넘으면 오래 안 쓴(수정 시각 기준) 파일부터 삭제 (LRU)
+- 다운로드 실패/이미지가 아니면 대체이미지.png로 표시하고, 잠시(FAILURE_TTL_SECONDS) 다시 시도하지 않음
+- 썸네일은 static/car_images/에 두므로 정적 파일 제공이 켜져 있으면 HTML 카드에는 URL을 넣음
+  (꺼져 있으면 파일별로 한 번만 만든 data URI)
+
+캐시는 화면에서 처음 쓸 때 채워지고, 크롤링/ETL 뒤에 미리 채울 수도 있다:
+    python car_images.py prefetch                      # CAR_INFO의 car_img_url 전체
+    python car_images.py prefetch --url-file urls.txt  # 로컬 테스트 서버(WebScraping.fixture_server) 등
+Pillow가 없으면 원본 그대로 저장한다 (크기 조절/WebP 변환 생략).
+"""
+import argparse
+import base64
+import hashlib
+import io
+import os
+import threading
+import time
+import urllib.request
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import quote
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+from assets import APP_DIR, ASSET_WEBP_QUALITY, FALLBACK_CAR_IMAGE, MIME_TYPES, get_asset, static_serving_enabled
+
+CAR_IMAGE_DIR = Path(os.getenv("CAR_IMAGE_DIR", APP_DIR / "static" / "car_images"))
+CAR_IMAGE_REF_DIR = Path(os.getenv("CAR_IMAGE_REF_DIR", APP_DIR / "cache" / "car_image_refs"))
+STATIC_ROOT = APP_DIR / "static"
+
+# 썸네일 폭 (화면 최대 표시 폭 500px 기준), 디스크 캐시 상한
+CAR_THUMB_WIDTH = int(os.getenv("CAR_THUMB_WIDTH", "640"))
+CAR_IMAGE_CACHE_MAX_MB = float(os.getenv("CAR_IMAGE_CACHE_MAX_MB", "200"))
+# 다운로드 제한 시간/최대 크기, 실패한 URL을 다시 시도하기까지의 시간
+DOWNLOAD_TIMEOUT = float(os.getenv("CAR_IMAGE_TIMEOUT", "5"))
+MAX_DOWNLOAD_BYTES = 10 * 1024 * 1024
+FAILURE_TTL_SECONDS = 600
+# 메모리에 들고 있을 썸네일 수, 디스크 파일 사용 시각을 갱신하는 최소 간격(초)
+MEMORY_ITEMS = 256
+TOUCH_INTERVAL = 300
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+    ),
+}
+EXTENSIONS = {mime: suffix for suffix, mime in MIME_TYPES.items()}
+
+# 대체이미지.png도 없을 때 쓰는 회색 자리표시 이미지
+PLACEHOLDER_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="640" height="400" viewBox="0 0 640 400">'
+    '<rect width="640" height="400" fill="#eeeeee"/>'
+    '<text x="320" y="210" font-size="32" text-anchor="middle" fill="#999999">이미지 없음</text></svg>'
+)
+
+
+def is_remote_url(url):
+    return bool(url) and url.strip().startswith("http")
+
+
+def http_fetch(url, timeout=DOWNLOAD_TIMEOUT):
+    """URL을 내려받아 (bytes, Content-Type) 반환 (MAX_DOWNLOAD_BYTES 초과 시 ValueError)"""
+    request = urllib.request.Request(url, headers=DEFAULT_HEADERS)
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        data = response.read(MAX_DOWNLOAD_BYTES + 1)
+        content_type = response.headers.get_content_type()
+    if len(data) > MAX_DOWNLOAD_BYTES:
+        raise ValueError(f"이미지가 너무 큼 ({url})")
+    return data, content_type
+
+
+def make_thumbnail(data, content_type, width):
+    """원본 bytes를 (bytes, 확장자)로 변환 (이미지가 아니면 ValueError)"""
+    if Image is None:
+        if not content_type.startswith("image/"):
+            raise ValueError(f"이미지가 아님 ({content_type})")
+        return data, EXTENSIONS.get(content_type, ".img")
+    try:
+        image = Image.open(io.BytesIO(data))
+        image.load()
+    except Exception as e:
+        raise ValueError(f"이미지를 읽을 수 없음 ({e})") from e
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA" if "transparency" in image.info or image.mode in ("LA", "PA") else "RGB")
+    if width and image.width > width:
+        image = image.resize((width, round(image.height * width / image.width)), Image.LANCZOS)
+    out = io.BytesIO()
+    image.save(out, "WEBP", quality=ASSET_WEBP_QUALITY, method=6)
+    return out.getvalue(), ".webp"
+
+
+class CarImageCache:
+    """URL별 썸네일 디스크 캐시 (여러 스레드에서 공유)
+    fetch(url) → (bytes, Content-Type): 테스트에서는 로컬 서버 URL이나 다른 함수로 바꿔 쓸 수 있음"""
+
+    def __init__(self, image_dir=CAR_IMAGE_DIR, ref_dir=CAR_IMAGE_REF_DIR, max_bytes=None,
+                 width=CAR_THUMB_WIDTH, fetch=None):
+        self.image_dir = Path(image_dir)
+        self.ref_dir = Path(ref_dir)
+        self.max_bytes = int(CAR_IMAGE_CACHE_MAX_MB * 1024 * 1024) if max_bytes is None else max_bytes
+        self.width = width
+        self.fetch = fetch or http_fetch
+        self._lock = threading.Lock()
+        self._url_locks = {}            # URL → [잠금, 기다리는 스레드 수] (내려받는 동안만 유지)
+        self._refs = {}                 # URL → 파일 이름 (ref 파일을 매번 읽지 않도록)
+        self._memory = OrderedDict()    # 파일 이름 → bytes
+        self._data_uris = OrderedDict()  # 파일 이름 → data URI (HTML 카드용, 이름이 내용 해시라 바뀌지 않음)
+        self._touched = {}              # 파일 이름 → 마지막으로 수정 시각을 갱신한 시각
+        self._failed = {}               # URL → 다시 시도할 시각
+        self._disk_bytes = None
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "downloads": 0, "failures": 0,
+                      "downloaded_bytes": 0, "stored_bytes": 0, "evicted": 0}
+
+    # URL → 파일 이름 기록
+    def _ref_path(self, url):
+        return self.ref_dir / hashlib.sha256(url.encode()).hexdigest()[:32]
+
+    def _read_ref(self, url):
+        name = self._refs.get(url)
+        if name is None:
+            try:
+                name = self._ref_path(url).read_text().strip() or None
+            except OSError:
+                return None
+            if name:
+                self._refs[url] = name
+        return name
+
+    def _write_atomic(self, path, data):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+
+    def filename(self, url):
+        """URL의 썸네일 파일 이름 (아직 없거나 LRU로 지워졌으면 None)"""
+        name = self._read_ref(url.strip())
+        if name and (name in self._memory or (self.image_dir / name).exists()):
+            return name
+        return None
+
+    def _load(self, name):
+        """파일 이름의 썸네일 bytes (메모리 → 디스크 순, 없으면 None)"""
+        with self._lock:
+            data = self._memory.get(name)
+            if data is not None:
+                self._memory.move_to_end(name)
+                self.stats["memory_hits"] += 1
+        if data is None:
+            try:
+                data = (self.image_dir / name).read_bytes()
+            except OSError:
+                return None
+            self.stats["disk_hits"] += 1
+            self._remember(name, data)
+        self._touch(name)
+        return data
+
+    def _remember(self, name, data):
+        with self._lock:
+            self._memory[name] = data
+            self._memory.move_to_end(name)
+            while len(self._memory) > MEMORY_ITEMS:
+                self._memory.popitem(last=False)
+
+    def _touch(self, name):
+        """LRU용으로 파일 수정 시각 갱신 (TOUCH_INTERVAL마다 한 번만)"""
+        now = time.time()
+        if now - self._touched.get(name, 0) < TOUCH_INTERVAL:
+            return
+        self._touched[name] = now
+        try:
+            os.utime(self.image_dir / name)
+        except OSError:
+            pass
+
+    def get(self, url):
+        """URL의 썸네일 bytes (없으면 내려받아 저장), 실패하면 None"""
+        if not is_remote_url(url):
+            return None
+        url = url.strip()
+        name = self._read_ref(url)
+        if name:
+            data = self._load(name)
+            if data is not None:
+                return data
+        if self._failed.get(url, 0) > time.monotonic():
+            return None
+
+        # 같은 URL을 여러 스레드가 동시에 내려받지 않도록 URL별 잠금
+        with self._lock:
+            entry = self._url_locks.setdefault(url, [threading.Lock(), 0])
+            entry[1] += 1
+        try:
+            with entry[0]:
+                # 먼저 잠금을 잡은 스레드가 내려받았거나 실패했으면 그 결과를 따름
+                name = self._read_ref(url)
+                if name:
+                    data = self._load(name)
+                    if data is not None:
+                        return data
+                if self._failed.get(url, 0) > time.monotonic():
+                    return None
+                return self._download(url)
+        finally:
+            with self._lock:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del self._url_locks[url]
+
+    def _download(self, url):
+        try:
+            source, content_type = self.fetch(url)
+            data, suffix = make_thumbnail(source, content_type, self.width)
+        except Exception as e:
+            self._failed[url] = time.monotonic() + FAILURE_TTL_SECONDS
+            self.stats["failures"] += 1
+            print(f"차량 이미지 다운로드 실패 ({url}): {e}")
+            return None
+        self._failed.pop(url, None)
+
+        name = hashlib.sha256(data).hexdigest()[:32] + suffix
+        path = self.image_dir / name
+        try:
+            if not path.exists():
+                self._write_atomic(path, data)
+                self._add_disk_bytes(len(data), keep=name)
+            self._write_atomic(self._ref_path(url), name.encode())
+        except OSError as e:
+            print(f"차량 이미지 저장 실패 ({path}): {e}")
+        self.stats["downloads"] += 1
+        self.stats["downloaded_bytes"] += len(source)
+        self.stats["stored_bytes"] += len(data)
+        self._refs[url] = name
+        self._remember(name, data)
+        self._touched[name] = time.time()
+        return data
+
+    # 디스크 용량 관리 (LRU)
+    def _scan(self):
+        try:
+            entries = [entry for entry in os.scandir(self.image_dir) if entry.is_file() and not entry.name.endswith(".tmp")]
+        except OSError:
+            return []
+        files = []
+        for entry in entries:
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, entry.path))
+        return files
+
+    def _add_disk_bytes(self, size, keep=None):
+        with self._lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = sum(size for _, size, _ in self._scan())
+            else:
+                self._disk_bytes += size
+            over = self._disk_bytes > self.max_bytes
+        if over:
+            self.evict(keep=keep)
+
+    def evict(self, target=None, keep=None):
+        """디스크 사용량이 target(기본: 상한의 90%) 이하가 될 때까지 오래 안 쓴 파일부터 삭제 (keep 파일은 남김)"""
+        target = int(self.max_bytes * 0.9) if target is None else target
+        with self._lock:
+            files = sorted(self._scan())
+            total = sum(size for _, size, _ in files)
+            for _, size, path in files:
+                if total <= target:
+                    break
+                if os.path.basename(path) == keep:
+                    continue
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+                name = os.path.basename(path)
+                self._memory.pop(name, None)
+                self._data_uris.pop(name, None)
+                self._touched.pop(name, None)
+                self.stats["evicted"] += 1
+            self._disk_bytes = total
+        return total
+
+    def data_uri(self, name, data):
+        """썸네일의 data URI (파일 이름별로 한 번만 base64 인코딩, 이름을 모르면 매번 인코딩)"""
+        if name:
+            with self._lock:
+                uri = self._data_uris.get(name)
+                if uri is not None:
+                    self._data_uris.move_to_end(name)
+                    return uri
+        mime = MIME_TYPES.get(os.path.splitext(name or "")[1], "image/webp")
+        uri = f"data:{mime};base64,{base64.b64encode(data).decode()}"
+        if name:
+            with self._lock:
+                self._data_uris[name] = uri
+                while len(self._data_uris) > MEMORY_ITEMS:
+                    self._data_uris.popitem(last=False)
+        return uri
+
+    def prefetch(self, urls, workers=8):
+        """여러 URL을 동시에 내려받아 캐시를 채움, (성공 수, 실패 수) 반환"""
+        urls = list(dict.fromkeys(url.strip() for url in urls if is_remote_url(url)))
+        if not urls:
+            return 0, 0
+        with ThreadPoolExecutor(max_workers=min(workers, len(urls))) as executor:
+            results = list(executor.map(self.get, urls))
+        ok = sum(data is not None for data in results)
+        return ok, len(results) - ok
+
+    def summary(self):
+        return dict(self.stats, cached=len(self._memory), disk_bytes=self._disk_bytes)
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_car_image_cache():
+    """프로세스 전체에서 공유하는 CarImageCache"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = CarImageCache()
+    return _cache
+
+
+def _fallback_asset():
+    path, max_width = FALLBACK_CAR_IMAGE
+    try:
+        return get_asset(path, max_width)
+    except OSError:
+        return None
+
+
+def fallback_image():
+    """st.image용 대체 이미지 (대체이미지.png, 없으면 회색 자리표시 SVG)"""
+    asset = _fallback_asset()
+    return asset.data if asset else PLACEHOLDER_SVG
+
+
+def fallback_src():
+    """HTML용 대체 이미지 주소"""
+    asset = _fallback_asset()
+    return asset.url if asset else "data:image/svg+xml;charset=utf-8," + quote(PLACEHOLDER_SVG)
+
+
+def car_image(url):
+    """st.image에 넘길 차량 이미지 (로컬 썸네일 bytes, 실패하면 대체 이미지)"""
+    data = get_car_image_cache().get(url)
+    return data if data is not None else fallback_image()
+
+
+def show_car_image(url, **kwargs):
+    """차량 이미지를 로컬 썸네일로 st.image에 표시"""
+    import streamlit as st
+
+    st.image(car_image(url), **kwargs)
+
+
+def car_image_src(url):
+    """HTML <img src>에 넣을 차량 이미지 주소
+    정적 파일 제공이 켜져 있고 썸네일 파일이 static/ 아래에 실제로 있으면 static URL, 아니면 data URI
+    (디스크 저장에 실패해 메모리에만 있는 썸네일은 data URI로)"""
+    cache = get_car_image_cache()
+    data = cache.get(url)
+    if data is None:
+        return fallback_src()
+    name = cache.filename(url)
+    path = cache.image_dir / name if name else None
+    if path and static_serving_enabled() and path.exists():
+        try:
+            relative = path.resolve().relative_to(STATIC_ROOT.resolve())
+            return f"app/static/{relative.as_posix()}"
+        except ValueError:
+            pass
+    return cache.data_uri(name, data)
+
+
+def prefetch_car_images(urls, workers=8):
+    """화면에 표시할 차량 이미지들을 미리 동시에 받아 둠 (카드를 그리며 하나씩 받지 않도록)"""
+    return get_car_image_cache().prefetch(urls, workers)
+
+
+def car_image_stats():
+    return get_car_image_cache().summary()
+
+
+def _db_urls():
+    from recommendation_stats import connect
+
+    conn = connect()
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT DISTINCT car_img_url FROM teamdb.CAR_INFO WHERE car_img_url LIKE 'http%'")
+        return [row[0] for row in cursor.fetchall()]
+    finally:
+        cursor.close()
+        conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="차량 이미지 썸네일 캐시")
+    parser.add_argument("command", choices=["prefetch", "evict"], nargs="?", default="prefetch")
+    parser.add_argument("--url-file", help="DB 대신 한 줄에 하나씩 적힌 이미지 URL 목록을 사용")
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+
+    cache = get_car_image_cache()
+    if args.command == "evict":
+        total = cache.evict()
+        print(f"✅ 차량 이미지 캐시 정리 완료: {total / 1024 / 1024:.1f}MB 사용 중")
+        return
+
+    if args.url_file:
+        with open(args.url_file, encoding="utf-8") as f:
+            urls = [line.strip() for line in f if line.strip()]
+    else:
+        urls = _db_urls()
+    ok, failed = cache.prefetch(urls, args.workers)
+    print(f"✅ 차량 이미지 {ok}개 캐시 완료 (실패 {failed}개, 저장 {cache.stats['stored_bytes'] / 1024:.0f}KB)")
+
+
+if __name__ == "__main__":
+    main()
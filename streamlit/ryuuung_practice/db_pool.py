@@ -0,0 +1,316 @@
+import os
+import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+
+import mysql.connector
+from mysql.connector import pooling
+import streamlit as st
+from dotenv import load_dotenv
+
+# 환경변수 로드
+load_dotenv()
+
+# 풀 설정 (MySQLConnectionPool 최대 크기는 32)
+POOL_NAME = "chageun_pool"
+POOL_SIZE = min(int(os.getenv("DB_POOL_SIZE", "5")), 32)
+POOL_WAIT_SECONDS = float(os.getenv("DB_POOL_WAIT_SECONDS", "5"))
+
+# 서버측 prepared statement 사용 여부와 커넥션당 보관할 statement 수
+USE_PREPARED = os.getenv("DB_USE_PREPARED", "1") == "1"
+PREPARED_PER_CONNECTION = int(os.getenv("DB_PREPARED_PER_CONNECTION", "32"))
+# 세션 초기화(COM_RESET_CONNECTION)는 prepared statement도 지우므로 prepared 사용 시 기본으로 끔
+POOL_RESET_SESSION = os.getenv("DB_POOL_RESET_SESSION", "0" if USE_PREPARED else "1") == "1"
+
+# 서버에서 statement ID를 찾지 못함 (재연결 등으로 세션이 바뀐 경우)
+ER_UNKNOWN_STMT_HANDLER = 1243
+
+
+class QueryStats:
+    """쿼리 라벨별 실행 횟수와 소요 시간(ms)을 누적하는 클래스"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def record(self, label, elapsed_ms, error=False):
+        with self._lock:
+            stat = self._stats.setdefault(label, {
+                "count": 0,
+                "errors": 0,
+                "total_ms": 0.0,
+                "max_ms": 0.0,
+                "last_ms": 0.0,
+            })
+            stat["count"] += 1
+            stat["total_ms"] += elapsed_ms
+            stat["max_ms"] = max(stat["max_ms"], elapsed_ms)
+            stat["last_ms"] = elapsed_ms
+            if error:
+                stat["errors"] += 1
+
+    def snapshot(self):
+        """라벨별 통계 사본 반환 (avg_ms 포함)"""
+        with self._lock:
+            result = {}
+            for label, stat in self._stats.items():
+                row = dict(stat)
+                row["avg_ms"] = stat["total_ms"] / stat["count"] if stat["count"] else 0.0
+                result[label] = row
+            return result
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+
+# 프로세스 전체에서 공유하는 쿼리 통계
+query_stats = QueryStats()
+
+
+class StatementStats:
+    """SQL 문장별 prepare 횟수와 실행 횟수 (실행 대비 prepare가 적을수록 재사용이 잘 되는 것)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def record(self, label, prepared):
+        with self._lock:
+            stat = self._stats.setdefault(label, {"executions": 0, "prepares": 0})
+            stat["executions"] += 1
+            if prepared:
+                stat["prepares"] += 1
+
+    def snapshot(self):
+        """라벨별 통계 사본 반환 (reuse_rate = prepare 없이 실행된 비율)"""
+        with self._lock:
+            result = {}
+            for label, stat in self._stats.items():
+                row = dict(stat)
+                row["reuse_rate"] = 1 - stat["prepares"] / stat["executions"] if stat["executions"] else 0.0
+                result[label] = row
+            return result
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+
+statement_stats = StatementStats()
+
+# 실제 커넥션 → (서버 세션 ID, {SQL: prepared 커서}) (커넥션이 사라지면 함께 정리)
+_prepared_cursors = weakref.WeakKeyDictionary()
+_prepared_lock = threading.Lock()
+
+
+@contextmanager
+def timed(label):
+    """with 블록의 실행 시간을 label 이름으로 기록"""
+    start = time.perf_counter()
+    error = False
+    try:
+        yield
+    except Exception:
+        error = True
+        raise
+    finally:
+        query_stats.record(label, (time.perf_counter() - start) * 1000, error)
+
+
+# 커넥션 풀 생성 (Streamlit 서버 프로세스당 한 번만 생성)
+@st.cache_resource
+def get_pool():
+    return pooling.MySQLConnectionPool(
+        pool_name=POOL_NAME,
+        pool_size=POOL_SIZE,
+        pool_reset_session=POOL_RESET_SESSION,
+        host=os.getenv("DB_HOST"),
+        user=os.getenv("DB_USER"),
+        password=os.getenv("DB_PASSWORD"),
+        database=os.getenv("DB_NAME"),
+        charset=os.getenv("DB_CHARSET", "utf8mb4")
+    )
+
+
+def _borrow_connection(pool):
+    """풀에서 커넥션을 빌려 상태 확인 후 반환 (풀이 가득 찼으면 POOL_WAIT_SECONDS까지 대기)"""
+    deadline = time.monotonic() + POOL_WAIT_SECONDS
+    while True:
+        try:
+            conn = pool.get_connection()
+            break
+        except mysql.connector.errors.PoolError:
+            if time.monotonic() >= deadline:
+                raise
+            time.sleep(0.05)
+
+    # 오래된(끊긴) 커넥션이면 재연결 (새 세션에는 이전 prepared statement가 없으므로 보관한 커서도 버림)
+    try:
+        conn.ping(reconnect=False)
+    except mysql.connector.Error:
+        _forget_prepared(conn)
+        try:
+            conn.reconnect(attempts=2, delay=0)
+        except mysql.connector.Error:
+            conn.close()
+            raise
+    return conn
+
+
+def get_connection():
+    """풀에서 커넥션을 빌림 (실패하면 mysql.connector.Error)"""
+    with timed("connect"):
+        return _borrow_connection(get_pool())
+
+
+# DB 연결 함수 (conn.close() 호출 시 커넥션은 풀로 반환됨)
+# 연결 실패를 화면에 바로 알리고 None을 받고 싶은 곳에서 사용 (그 밖에는 get_connection/fetch_all)
+def team_db():
+    try:
+        with timed("connect"):
+            return _borrow_connection(get_pool())
+    except mysql.connector.Error as e:
+        st.error(f"DB 연결 실패: {e}")
+        return None
+
+
+def _prepared_cursor(conn, query):
+    """커넥션에 보관된 query용 prepared 커서 반환 (없으면 새로 만듦)
+    반환: (커서, 처음 prepare한 SQL 문자열, 새로 만들었는지)
+    커서는 직전 SQL과 같은 객체인지로 재사용 여부를 판단하므로 실행 시 보관된 문자열을 넘겨야 함"""
+    # 풀에서 빌린 커넥션은 실제 커넥션을 감싼 객체이므로 안쪽 커넥션 기준으로 보관
+    cnx = getattr(conn, "_cnx", conn)
+    # 풀 안에서 재연결되면 같은 커넥션 객체라도 세션 ID가 바뀌므로 보관한 커서를 버림
+    session = getattr(cnx, "connection_id", None)
+    with _prepared_lock:
+        entry = _prepared_cursors.get(cnx)
+        if entry is None or entry[0] != session:
+            entry = _prepared_cursors[cnx] = (session, OrderedDict())
+    cursors = entry[1]
+    cached = cursors.get(query)
+    if cached is not None:
+        cursors.move_to_end(query)
+        return cached[0], cached[1], False
+
+    cur = conn.cursor(prepared=True)
+    cursors[query] = (cur, query)
+    if len(cursors) > PREPARED_PER_CONNECTION:
+        _, (oldest, _) = cursors.popitem(last=False)
+        try:
+            oldest.close()
+        except mysql.connector.Error:
+            pass
+    return cur, query, True
+
+
+def _forget_prepared(conn, query=None):
+    """커넥션에 보관된 prepared 커서를 버림 (query를 주면 그 SQL의 커서만)"""
+    cnx = getattr(conn, "_cnx", conn)
+    with _prepared_lock:
+        if query is None:
+            _prepared_cursors.pop(cnx, None)
+            return
+        entry = _prepared_cursors.get(cnx)
+        cached = entry[1].pop(query, None) if entry else None
+    if cached is not None:
+        try:
+            cached[0].close()
+        except mysql.connector.Error:
+            pass
+
+
+def _execute_prepared(conn, query, params, dictionary, label):
+    """prepared statement로 실행
+    실패한 커서는 보관소에서 버리고, 보관해 둔 커서였으면(세션이 바뀌었거나 statement가 닫힌 경우 등) 한 번 다시 prepare"""
+    for attempt in range(2):
+        cur, statement, created = _prepared_cursor(conn, query)
+        try:
+            cur.execute(statement, params or ())
+            rows = cur.fetchall()
+        except mysql.connector.Error as e:
+            if e.errno == ER_UNKNOWN_STMT_HANDLER:
+                _forget_prepared(conn)
+            else:
+                _forget_prepared(conn, query)
+            if attempt == 0 and not created:
+                continue
+            raise
+        statement_stats.record(label, created)
+        if dictionary:
+            columns = cur.column_names
+            rows = [dict(zip(columns, row)) for row in rows]
+        return rows
+
+
+def _caller_name(depth):
+    """depth단계 위 호출 함수 이름 (라벨을 생략했을 때 통계 키로 씀)"""
+    return sys._getframe(depth + 1).f_code.co_name
+
+
+def fetch_all(query, params=None, dictionary=True, label=None, prepared=False):
+    """SELECT 쿼리 결과 전체를 반환
+    연결 실패와 쿼리 오류 모두 mysql.connector.Error로 올라가므로 빈 결과는 항상 "행 없음"
+    (화면에 어떻게 알릴지는 호출한 쪽에서 결정)
+    label을 생략하면 호출한 함수 이름을 통계 라벨로 씀
+    prepared=True면 서버측 prepared statement로 실행하고 커넥션별로 재사용 (USE_PREPARED=0이면 일반 실행)"""
+    label = label or _caller_name(1)
+    conn = get_connection()
+    try:
+        with timed(label):
+            if prepared and USE_PREPARED:
+                return _execute_prepared(conn, query, params, dictionary, label)
+            cur = conn.cursor(dictionary=dictionary)
+            cur.execute(query, params)
+            rows = cur.fetchall()
+        cur.close()
+        return rows
+    finally:
+        conn.close()
+
+
+def fetch_one(query, params=None, dictionary=True, label=None, prepared=False):
+    """SELECT 쿼리 결과 첫 행을 반환 (없으면 None)"""
+    label = label or _caller_name(1)
+    rows = fetch_all(query, params, dictionary=dictionary, label=label, prepared=prepared)
+    return rows[0] if rows else None
+
+
+def get_query_stats():
+    """쿼리별 타이밍 통계 반환"""
+    return query_stats.snapshot()
+
+
+def get_statement_stats():
+    """prepared statement 재사용 통계 반환"""
+    return statement_stats.snapshot()
+
+
+def render_query_stats(extra_stats=None):
+    """SHOW_QUERY_STATS=1 일 때 사이드바에 쿼리 타이밍 통계 표시
+    extra_stats: {제목: 통계 dict} 형태로 함께 보여줄 다른 통계 (캐시 적중률 등)"""
+    if os.getenv("SHOW_QUERY_STATS") != "1":
+        return
+    for title, values in (extra_stats or {}).items():
+        with st.sidebar.expander(title):
+            st.json(values)
+    statement_rows = [
+        {"query": label[:60], **{k: round(v, 3) for k, v in stat.items()}}
+        for label, stat in sorted(get_statement_stats().items(), key=lambda item: -item[1]["executions"])
+    ]
+    if statement_rows:
+        with st.sidebar.expander("Prepared statement 재사용"):
+            st.dataframe(statement_rows, use_container_width=True)
+    stats = get_query_stats()
+    with st.sidebar.expander("쿼리 타이밍 (ms)"):
+        if not stats:
+            st.write("기록 없음")
+            return
+        rows = [
+            {"query": label[:60], **{k: round(v, 2) for k, v in stat.items()}}
+            for label, stat in sorted(stats.items(), key=lambda item: -item[1]["total_ms"])
+        ]
+        st.dataframe(rows, use_container_width=True)
@@ -1,27 +1,10 @@
 import streamlit as st
 from streamlit_option_menu import option_menu
-import mysql.connector
-import base64
-import os
-from dotenv import load_dotenv
+import uuid
 
-# 환경변수 로드
-load_dotenv()
-
-# DB 연결 함수
-def team_db():
-    try:
-        conn = mysql.connector.connect(
-            host=os.getenv("DB_HOST"),
-            user=os.getenv("DB_USER"),
-            password=os.getenv("DB_PASSWORD"),
-            database=os.getenv("DB_NAME"),
-            charset=os.getenv("DB_CHARSET", "utf8mb4")
-        )
-        return conn
-    except mysql.connector.Error as e:
-        st.error(f"DB 연결 실패: {e}")
-        return None
+from db_pool import timed
+from assets import BUDGET_ICON, LOGO, show_image
+from write_behind import get_writer
 
 # 스타일 설정
 def set_custom_styles():
@@ -87,6 +70,7 @@ def team_session():
         'first': None,
         'second': None,
         'third': None,
+        'recommend_mode': '우선순위 순',
         'recommend_cars': []
     }
     for key, value in default_values.items():
@@ -98,7 +82,7 @@ st.set_page_config(page_title="차근차근 - 옵션 선택", layout="wide")
 set_custom_styles()
 
 # 로고 표시
-st.image("../../docs/차근차근 로고.png", width=180)
+show_image(LOGO, width=180)
 
 # 세션 초기화
 team_session()
@@ -143,7 +127,7 @@ elif selected == "예산 범위":
     st.markdown("### 차량 구매 예산")
     col1, col2 = st.columns([1, 1.3])
     with col1:
-        st.image("../../docs/예산_아이콘.png", width=100)
+        show_image(BUDGET_ICON, width=100)
     with col2:
         st.session_state.min_val, st.session_state.max_val = st.slider(
             "구매 예산 범위 설정 (단위: 만 원)", 1000, 5000, (st.session_state.min_val, st.session_state.max_val), step=500
@@ -199,46 +183,39 @@ elif selected == "선호도":
         key="third"
     )
 
+    # 추천 방식 선택
+    recommend_modes = ["우선순위 순", "가중치 점수"]
+    st.session_state.recommend_mode = st.radio(
+        "추천 방식",
+        recommend_modes,
+        horizontal=True,
+        index=recommend_modes.index(st.session_state.recommend_mode),
+        help="우선순위 순: 1순위가 같을 때만 2·3순위를 비교합니다. 가중치 점수: 세 항목을 순위별 가중치로 합산합니다."
+    )
+
     # 선택 결과 출력
     st.write("#### 🔎 선택한 중요도 순위")
     st.write(f"1순위: **{st.session_state.first}**")
     st.write(f"2순위: **{st.session_state.second}**")
     st.write(f"3순위: **{st.session_state.third}**")
 
-# DB에 사용자 정보 저장
+# DB에 사용자 정보 저장 (write-behind 큐에 넣고 바로 반환, 실제 저장은 백그라운드에서 일괄 처리)
+# user_id는 저장 시 정해지므로 세션에는 추천 결과와 연결할 토큰을 저장
 def save_user_info():
-    try:
-        conn = team_db()
-        if conn:
-            cur = conn.cursor()
-            
-            # user_info 테이블에 저장
-            insert_user_query = """
-            INSERT INTO teamdb.user_info 
-            (USER_AGE, USER_GENDER, user_job, user_purpose)
-            VALUES (%s, %s, %s, %s)
-            """
-            
-            user_values = (
-                st.session_state.age,
-                st.session_state.gender,
-                st.session_state.job_id,  # job_id 사용
-                st.session_state.purpose
-            )
-            
-            cur.execute(insert_user_query, user_values)
-            user_id = cur.lastrowid
-            
-            conn.commit()
-            conn.close()
-            
-            # 세션에 user_id 저장
-            st.session_state.user_id = user_id
-            return user_id
-            
-    except mysql.connector.Error as e:
-        st.error(f"사용자 정보 저장 실패: {e}")
-        return None
+    user_values = (
+        st.session_state.age,
+        st.session_state.gender,
+        st.session_state.job_id,  # job_id 사용
+        st.session_state.purpose
+    )
+
+    user_token = uuid.uuid4().hex
+    with timed("save_user_info"):
+        get_writer().add_user(user_token, user_values)
+
+    # 세션에 user_token 저장
+    st.session_state.user_token = user_token
+    return user_token
 
 # 모든 항목 완료 체크 및 다음 단계 버튼
 st.sidebar.markdown("---")
@@ -260,8 +237,8 @@ required_fields = [
 if st.sidebar.button("다음 페이지로 이동"):
     if all(required_fields):
         # 사용자 정보 저장
-        user_id = save_user_info()
-        if user_id:
+        user_token = save_user_info()
+        if user_token:
             st.sidebar.success("✅ 다음 페이지로 이동합니다!")
             st.switch_page("pages/3_third_page.py")
     else:
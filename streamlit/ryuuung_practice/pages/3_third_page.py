@@ -1,28 +1,14 @@
 import streamlit as st
 import mysql.connector
-import os
-from dotenv import load_dotenv
-import base64
 import pandas as pd
 import altair as alt
 
-# 환경변수 로드
-load_dotenv()
-
-# DB 연결 함수
-def team_db():
-    try:
-        conn = mysql.connector.connect(
-            host=os.getenv("DB_HOST"),
-            user=os.getenv("DB_USER"),
-            password=os.getenv("DB_PASSWORD"),
-            database=os.getenv("DB_NAME"),
-            charset=os.getenv("DB_CHARSET", "utf8mb4")
-        )
-        return conn
-    except mysql.connector.Error as e:
-        st.error(f"DB 연결 실패: {e}")
-        return None
+from db_pool import fetch_all, timed, render_query_stats
+from assets import LOGO, show_image
+from car_images import show_car_image
+from car_catalog import get_catalog
+from write_behind import get_writer
+from recommend import get_engine, recommend_cached, recommend_cache, recommendation_query, MODE_LEXICOGRAPHIC, MODE_WEIGHTED
 
 # 스타일 설정
 def set_custom_styles():
@@ -303,7 +289,7 @@ st.set_page_config(page_title="차근차근 - 추천 결과", layout="wide")
 set_custom_styles()
 
 # 로고 표시
-st.image("../../docs/차근차근 로고.png", width=180)
+show_image(LOGO, width=180)
 
 # 세션 상태 초기화
 def team_session():
@@ -318,6 +304,7 @@ def team_session():
         'first': None,
         'second': None,
         'third': None,
+        'recommend_mode': '우선순위 순',
         'selected_car_id': None,
         'recommendations_saved': False  # 추천 결과 저장 여부를 추적하는 플래그 추가
     }
@@ -327,115 +314,53 @@ def team_session():
 
 team_session()
 
-# 추천 차량 가져오기
+# 추천 방식 매핑 (2_second_page에서 선택)
+RECOMMEND_MODES = {
+    "우선순위 순": MODE_LEXICOGRAPHIC,
+    "가중치 점수": MODE_WEIGHTED
+}
+
+# 추천 차량 가져오기 (카탈로그 스냅샷 위의 추천 엔진 우선, 없으면 DB 조회)
 def get_filtered_cars():
+    catalog = get_catalog()
+    if catalog is None:
+        # DB 조회는 우선순위 순 정렬만 지원
+        return get_filtered_cars_sql()
+    engine = get_engine(catalog)
+    return recommend_cached(
+        engine,
+        st.session_state.min_val,
+        st.session_state.max_val,
+        body_type=st.session_state.body_type,
+        fuel_type=st.session_state.fuel_type,
+        preferences=[st.session_state.first, st.session_state.second, st.session_state.third],
+        k=3,
+        mode=RECOMMEND_MODES.get(st.session_state.recommend_mode, MODE_LEXICOGRAPHIC)
+    )
+
+# 추천 차량 DB 조회 (추천 엔진과 같은 조건/순서, DB/migrations/001 적용 후 숫자 컬럼)
+def get_filtered_cars_sql():
     try:
-        # 선호도에 따른 정렬 컬럼 매핑
-        preference_columns = {
-            "연비 (최저)": ("car_fuel_efficiency", "ASC"),
-            "가격 (최저)": ("car_price", "ASC"),
-            "평점 (네이버 평점 기준)": ("cri.avg_score", "DESC"),
-            "차체 크기 (실내 공간 기준 = 축거/전장*100)": ("car_size", "DESC"),
-            "성능 (출력-최저)": ("car_horsepower", "DESC")
-        }
-
-        # 필터 조건 동적 생성
-        filters = []
-        params = []
-
-        # 예산
-        filters.append("ci.car_price BETWEEN %s AND %s")
-        params.extend([st.session_state.min_val, st.session_state.max_val])
-
-        # 바디타입
-        if st.session_state.body_type and st.session_state.body_type != "전체":
-            filters.append("bti.body_type_category = %s")
-            params.append(st.session_state.body_type)
-
-        # 연료타입
-        if st.session_state.fuel_type and st.session_state.fuel_type != "전체":
-            filters.append("fi.fuel_type_name = %s")
-            params.append(st.session_state.fuel_type)
-
-        where_clause = " AND ".join(filters)
-
-        # 정렬 기준 설정
-        order_clauses = []
-        for pref in [st.session_state.first, st.session_state.second, st.session_state.third]:
-            if pref in preference_columns:
-                col, direction = preference_columns[pref]
-                order_clauses.append(f"{col} {direction}")
-
-        order_by = ", ".join(order_clauses) if order_clauses else "ci.car_price ASC"
-
-        query = f"""
-            SELECT DISTINCT
-                ci.car_id,
-                bi.brand_name,
-                ci.car_full_name, 
-                ci.car_price, 
-                ci.car_img_url, 
-                ci.car_fuel_efficiency, 
-                ci.car_horsepower,
-                ci.car_engine_type,
-                fi.fuel_type_name,
-                bti.body_type_category,
-                COALESCE(cri.avg_score, 0) as avg_score,
-                ci.car_size
-            FROM teamdb.CAR_INFO ci
-            JOIN teamdb.BRAND_INFO bi 
-                ON ci.car_brand = bi.brand_id 
-            JOIN teamdb.BODY_TYPE_INFO bti 
-                ON ci.car_body_type = bti.body_name 
-            JOIN teamdb.FUEL_TYPE_INFO fi
-                ON ci.car_fuel_type = fi.fuel_type_id
-            LEFT JOIN teamdb.CAR_REVIEW_INFO cri
-                ON ci.car_full_name = cri.car_name
-            WHERE {where_clause}
-            ORDER BY {order_by}
-            LIMIT 3
-        """
-
-        conn = team_db()
-        if conn:
-            cur = conn.cursor(dictionary=True)
-            cur.execute(query, tuple(params))
-            cars = cur.fetchall()
-            conn.close()
-            return cars
+        query, params = recommendation_query(
+            st.session_state.min_val,
+            st.session_state.max_val,
+            body_type=st.session_state.body_type,
+            fuel_type=st.session_state.fuel_type,
+            preferences=[st.session_state.first, st.session_state.second, st.session_state.third],
+            k=3
+        )
+        return fetch_all(query, params, label="get_filtered_cars_sql", prepared=True)
 
     except mysql.connector.Error as e:
         st.error(f"차량 추천 쿼리 실패: {e}")
         return []
 
-# 추천 결과 저장
-def save_recommendation(user_id, car_details):
-    try:
-        conn = team_db()
-        if conn:
-            cur = conn.cursor()
-
-            # recommendation 테이블에 저장
-            insert_recommendation_query = """
-            INSERT INTO teamdb.car_recommendation_info
-            (user_id, car_id)
-            VALUES (%s, %s)
-            """
-
-            for car in car_details:
-                recommendation_values = (
-                    user_id,
-                    car["car_id"]
-                )
-                cur.execute(insert_recommendation_query, recommendation_values)
-
-            conn.commit()
-            conn.close()
-            return True
-
-    except mysql.connector.Error as e:
-        st.error(f"추천 결과 저장 실패: {e}")
-        return False
+# 추천 결과 저장 (write-behind 큐에 넣고 바로 반환)
+# 저장 스레드가 여러 세션의 추천을 모아 executemany로 저장하고 통계 롤업(recommendation_stats)도 함께 갱신
+def save_recommendation(user_token, car_details):
+    with timed("save_recommendation"):
+        get_writer().add_recommendations(user_token, [car["car_id"] for car in car_details])
+    return True
 
 # 메인 컨텐츠
 with st.container():
@@ -444,9 +369,9 @@ with st.container():
     # 추천 차량 가져오기
     recommended_cars = get_filtered_cars()
 
-    # 추천 결과 저장 (세션에 user_id가 있고, 아직 저장되지 않은 경우에만)
-    if 'user_id' in st.session_state and recommended_cars and not st.session_state.recommendations_saved:
-        if save_recommendation(st.session_state.user_id, recommended_cars):
+    # 추천 결과 저장 (세션에 user_token이 있고, 아직 저장되지 않은 경우에만)
+    if 'user_token' in st.session_state and recommended_cars and not st.session_state.recommendations_saved:
+        if save_recommendation(st.session_state.user_token, recommended_cars):
             st.session_state.recommendations_saved = True  # 저장 성공 시 플래그 설정
 
     # 현재 표시할 차량 인덱스 관리
@@ -464,10 +389,7 @@ with st.container():
         # 왼쪽 컬럼 - 이미지
         with col1:
             st.markdown('<div class="car-image">', unsafe_allow_html=True)
-            if current_car['car_img_url'] and current_car['car_img_url'].strip().startswith("http"):
-                st.image(current_car['car_img_url'].strip(), width=500)
-            else:
-                st.image("../../docs/대체이미지.png", width=500)
+            show_car_image(current_car['car_img_url'], width=500)
             st.markdown('</div>', unsafe_allow_html=True)
 
         # 오른쪽 컬럼 - 정보
@@ -532,6 +454,9 @@ with st.container():
     
     st.markdown('</div>', unsafe_allow_html=True)
 
+# 쿼리 타이밍 및 추천 캐시 통계 (SHOW_QUERY_STATS=1 일 때만 표시)
+render_query_stats({"추천 캐시": recommend_cache.stats(), "저장 큐": get_writer().stats()})
+
 # 저작권 표시
 st.markdown("""
     <div class="copyright">
@@ -1,13 +1,18 @@
 import streamlit as st
 import mysql.connector
-import os
-from dotenv import load_dotenv
 import pandas as pd
 import plotly.graph_objects as go
 import altair as alt
 
-# 환경변수 로드
-load_dotenv()
+from db_pool import fetch_all, fetch_one, render_query_stats
+from assets import LOGO, show_image, asset_stats
+from car_images import show_car_image, car_image_src, prefetch_car_images, car_image_stats
+from car_catalog import get_catalog, catalog_version, filter_key, CATALOG_TTL_SECONDS
+from query_builder import SelectQuery, CAR_FROM, apply_car_filters, apply_price_seek
+from stats_summary import top_cars_by_dimension
+
+# 차량별 댓글 캐시 유지 시간(초)
+COMMENT_CACHE_TTL_SECONDS = 600
 
 def get_star_rating(score):
     """
@@ -22,21 +27,6 @@ def get_star_rating(score):
     
     return "★" * full_stars + "☆" * empty_stars
 
-# DB 연결 함수
-def team_db():
-    try:
-        conn = mysql.connector.connect(
-            host=os.getenv("DB_HOST"),
-            user=os.getenv("DB_USER"),
-            password=os.getenv("DB_PASSWORD"),
-            database=os.getenv("DB_NAME"),
-            charset=os.getenv("DB_CHARSET", "utf8mb4")
-        )
-        return conn
-    except mysql.connector.Error as e:
-        st.error(f"DB 연결 실패: {e}")
-        return None
-
 # 스타일 설정
 def set_custom_styles():
     st.markdown("""
@@ -501,15 +491,12 @@ def set_custom_styles():
 
 # 고유값 조회 함수
 def get_distinct_values(query):
-    conn = team_db()
-    if conn is None:
-        return []
     try:
-        cur = conn.cursor()
-        cur.execute(query)
-        return [row[0] for row in cur.fetchall() if row[0] is not None]
-    finally:
-        conn.close()
+        rows = fetch_all(query, dictionary=False, label="get_distinct_values")
+    except mysql.connector.Error as e:
+        st.error(f"필터 옵션 조회 실패: {e}")
+        return []
+    return [row[0] for row in rows if row[0] is not None]
 
 # 가격 범위 변환 함수
 def get_price_range(selected):
@@ -533,10 +520,9 @@ def get_min_efficiency(selected):
         return 15
     return None
 
-# 차량 검색 쿼리 생성 함수
-def make_query(price_range=None, min_efficiency=None, body_type=None, fuel_type=None, limit=8, offset=0):
-    query = """
-    SELECT
+# 차량 목록에서 가져오는 컬럼
+CAR_LIST_COLUMNS = """
+        ci.car_id,
         ci.car_full_name,
         bi.brand_name,
         bti.body_type_category,
@@ -544,100 +530,181 @@ def make_query(price_range=None, min_efficiency=None, body_type=None, fuel_type=
         ci.car_price,
         ci.car_fuel_efficiency,
         ci.car_img_url
-    FROM teamdb.CAR_INFO ci
-    JOIN teamdb.BRAND_INFO bi ON ci.car_brand = bi.brand_id
-    JOIN teamdb.BODY_TYPE_INFO bti ON ci.car_body_type = bti.body_name
-    JOIN teamdb.FUEL_TYPE_INFO fi ON ci.car_fuel_type = fi.fuel_type_id
-    WHERE 1=1
-    """
-    if price_range:
-        query += f" AND ci.car_price BETWEEN {price_range[0]} AND {price_range[1]}"
-    if min_efficiency is not None:
-        query += f" AND ci.car_fuel_efficiency >= {min_efficiency}"
-    if body_type and body_type != "전체":
-        query += f" AND bti.body_type_category = '{body_type}'"
-    if fuel_type and fuel_type != "전체":
-        query += f" AND fi.fuel_type_name = '{fuel_type}'"
-    query += f" ORDER BY ci.car_price LIMIT {limit} OFFSET {offset}"
-    return query
+"""
+
+# 차량 검색 쿼리 생성 함수 (반환: SQL, 파라미터)
+# 정렬은 (car_price, car_id) 순이고, after=(가격, car_id)를 주면 그 키 다음 행부터 조회 (키셋 페이지네이션)
+# MySQL은 NULL을 가장 앞에 정렬하므로 가격 없는 차량이 먼저 나옴
+def make_query(price_range=None, min_efficiency=None, body_type=None, fuel_type=None,
+               columns=CAR_LIST_COLUMNS, after=None, limit=8):
+    query = SelectQuery(columns, CAR_FROM)
+    apply_car_filters(query, price_range, min_efficiency, body_type, fuel_type)
+    apply_price_seek(query, after)
+    if limit is not None:
+        query.order_by("ci.car_price", "ci.car_id").limit(limit)
+    return query.build()
+
+# 차량 목록 조회 (카탈로그 스냅샷 우선, 스냅샷이 없으면 DB 조회)
+def get_car_page(filters, limit, after=None):
+    catalog = get_catalog()
+    if catalog is not None:
+        return catalog.page(limit=limit, after=after, **filters)
+    query, params = make_query(**filters, after=after, limit=limit)
+    try:
+        return fetch_all(query, params, label="car_list", prepared=True)
+    except mysql.connector.Error as e:
+        st.error(f"차량 정보 조회 실패: {e}")
+        return []
 
-# 리뷰 요약 가져오기
-def get_review_summary():
-    conn = team_db()
-    if conn is None:
+# 페이지 시작 키 조회용: 지정한 키 다음 행들의 (가격, car_id)만 가져옴
+def get_car_keys(filters, limit, after=None):
+    catalog = get_catalog()
+    if catalog is not None:
+        return [(row['car_price'], row['car_id']) for row in catalog.page(limit=limit, after=after, **filters)]
+    query, params = make_query(**filters, columns="ci.car_price, ci.car_id", after=after, limit=limit)
+    try:
+        return fetch_all(query, params, dictionary=False, label="car_page_keys", prepared=True)
+    except mysql.connector.Error as e:
+        st.error(f"차량 정보 조회 실패: {e}")
         return []
+
+# 페이지 번호 → 그 페이지 첫 행 직전의 (가격, car_id) 키
+# 필터 조합과 카탈로그 버전별로 세션에 보관하고, 모르는 페이지는 가장 가까운 앞 페이지에서 키만 읽어 채움
+def get_page_start(filters, page_no, page_size):
+    page_keys = st.session_state.setdefault("car_page_keys", {})
+    cache_key = (filter_key(filters), catalog_version())
+    starts = page_keys.get(cache_key)
+    if starts is None:
+        page_keys.clear()
+        starts = page_keys[cache_key] = {1: None}
+
+    if page_no not in starts:
+        known = max(p for p in starts if p < page_no)
+        keys = get_car_keys(filters, limit=(page_no - known) * page_size, after=starts[known])
+        for n in range(1, page_no - known + 1):
+            if n * page_size <= len(keys):
+                starts[known + n] = tuple(keys[n * page_size - 1])
+    return starts.get(page_no, starts[max(starts)]), starts
+
+# 조건에 맞는 전체 차량 수 (DB 조회 결과는 필터 조합 + 카탈로그 버전별로 캐시)
+@st.cache_data(ttl=CATALOG_TTL_SECONDS, max_entries=256, show_spinner=False)
+def _count_cars_from_db(filters_key, version):
+    query, params = make_query(**dict(filters_key), columns="COUNT(*)", limit=None)
+    # 연결 실패/쿼리 오류는 예외로 올라가므로 캐시되지 않음 (count_cars에서 처리)
+    row = fetch_one(query, params, dictionary=False, label="car_count", prepared=True)
+    return row[0] if row else 0
+
+def count_cars(filters):
+    catalog = get_catalog()
+    if catalog is not None:
+        return catalog.count(**filters)
     try:
-        cur = conn.cursor(dictionary=True)
-        query = """
+        return _count_cars_from_db(filter_key(filters), catalog_version())
+    except mysql.connector.Error as e:
+        st.error(f"전체 차량 수 조회 실패: {e}")
+        return 0
+
+# 필터 옵션 고유값 (카탈로그 스냅샷 우선)
+def get_filter_values(column, query, only_in_use=True):
+    catalog = get_catalog()
+    if catalog is not None:
+        return catalog.distinct(column, only_in_use=only_in_use)
+    return get_distinct_values(query)
+
+# 차량명 목록의 이미지 URL을 한 번에 가져오기 (카탈로그 스냅샷 우선, 없으면 IN 쿼리 한 번)
+def get_car_img_urls(car_names):
+    car_names = list(dict.fromkeys(car_names))
+    if not car_names:
+        return {}
+    catalog = get_catalog()
+    if catalog is not None:
+        return catalog.image_urls(car_names)
+
+    query, params = (
+        SelectQuery("car_full_name, car_img_url", "teamdb.CAR_INFO")
+        .where_in("car_full_name", car_names)
+        .order_by("car_id")
+        .build()
+    )
+    img_urls = {}
+    try:
+        for row in fetch_all(query, params, label="get_car_img_urls", prepared=True):
+            img_urls.setdefault(row['car_full_name'], row['car_img_url'])
+    except mysql.connector.Error as e:
+        st.error(f"차량 이미지 조회 실패: {e}")
+    return img_urls
+
+# 리뷰 요약 가져오기
+def get_review_summary():
+    query = """
         SELECT
             cri.car_name,
             cri.avg_score,
             cri.survey_people_count,
             cri.graph_info
         FROM teamdb.car_review_info cri
-        JOIN teamdb.CAR_INFO ci ON cri.car_name = ci.car_full_name
+        JOIN teamdb.CAR_INFO ci ON ci.car_id = cri.car_id
         """
-        cur.execute(query)
-        return cur.fetchall()
-    finally:
-        if conn:
-            conn.close()
+    try:
+        return fetch_all(query, label="get_review_summary", prepared=True)
+    except mysql.connector.Error as e:
+        st.error(f"리뷰 요약 조회 실패: {e}")
+        return []
 
 # 차량별 댓글 가져오기
-def get_comments_by_car(car_name):
-    conn = team_db()
-    if conn is None:
-        return []
+# 중복 댓글은 저장 시점에 걸러지므로(DB/migrations/003) 해당 차량 리뷰의 댓글만 인덱스 범위로 읽음
+# 같은 차량의 리뷰가 여러 번 수집된 경우의 중복은 content_hash로 제거 (최신 것 유지)
+# 조회 오류(연결 실패 포함)는 캐시되지 않도록 캐시 함수 밖(get_comments_by_car)에서 처리
+@st.cache_data(ttl=COMMENT_CACHE_TTL_SECONDS, show_spinner=False)
+def _comments_by_car_from_db(car_id):
+    query = """
+    SELECT
+        c.nickname,
+        c.comment_avg_score,
+        c.comment_text,
+        c.created_at,
+        c.content_hash
+    FROM teamdb.car_review_info cri
+    JOIN teamdb.comment_info c ON c.review_id = cri.review_id
+    WHERE cri.car_id = %s
+    ORDER BY c.created_at DESC
+    """
+    rows = fetch_all(query, (car_id,), label="get_comments_by_car", prepared=True)
+
+    comments = []
+    seen = set()
+    for row in rows:
+        if row["content_hash"] in seen:
+            continue
+        seen.add(row["content_hash"])
+        comments.append(row)
+    return comments
+
+def get_comments_by_car(car_id):
     try:
-        cur = conn.cursor(dictionary=True)
-        query = """
-        SELECT DISTINCT
-            ci.nickname,
-            ci.comment_avg_score,
-            ci.comment_text,
-            ci.created_at
-        FROM (
-            SELECT 
-                nickname,
-                comment_avg_score,
-                comment_text,
-                created_at,
-                review_id,
-                ROW_NUMBER() OVER (
-                    PARTITION BY nickname, comment_text
-                    ORDER BY created_at DESC
-                ) as rn
-            FROM teamdb.comment_info
-        ) ci
-        JOIN teamdb.car_review_info cri ON cri.review_id = ci.review_id
-        WHERE cri.car_name = %s AND ci.rn = 1
-        ORDER BY ci.created_at DESC
-        """
-        cur.execute(query, (car_name,))
-        return cur.fetchall()
+        return _comments_by_car_from_db(car_id)
     except mysql.connector.Error as e:
         st.error(f"댓글 정보 조회 실패: {e}")
         return []
-    finally:
-        if conn:
-            conn.close()
 
 # 페이지 설정
 st.set_page_config(page_title="차근차근 - 차량 정보", layout="wide")
 set_custom_styles()
 
 # 로고 표시
-st.image("../../docs/차근차근 로고.png", width=180)
+show_image(LOGO, width=180)
 
 # 사이드바 메뉴
 st.sidebar.title("메뉴")
 page = st.sidebar.radio("페이지 선택", ["차량 정보 조회", "리뷰와 평점", "통계 정보"])
 
 # 필터 옵션 가져오기
-body_types = ["전체"] + get_distinct_values(
+body_types = ["전체"] + get_filter_values(
+    "body_type_category",
     "SELECT DISTINCT bt.body_type_category FROM teamdb.body_type_info bt JOIN teamdb.car_info c ON bt.body_name = c.car_body_type"
 )
-fuel_types = ["전체"] + get_distinct_values(
+fuel_types = ["전체"] + get_filter_values(
+    "fuel_type_name",
     "SELECT DISTINCT f.fuel_type_name FROM teamdb.fuel_type_info f JOIN teamdb.car_info c ON f.fuel_type_id = c.car_fuel_type"
 )
 
@@ -665,40 +732,36 @@ if page == "차량 정보 조회":
 
     # 차량 목록 가져오기
     page_size = 8
-    offset = (st.session_state.pagenation - 1) * page_size
 
-    query = make_query(
+    car_filters = dict(
         price_range=get_price_range(selected_price) if selected_price != "전체" else None,
         min_efficiency=get_min_efficiency(selected_eff) if selected_eff != "전체" else None,
         body_type=selected_body if selected_body != "전체" else None,
-        fuel_type=selected_fuel if selected_fuel != "전체" else None,
-        limit=page_size,
-        offset=offset
+        fuel_type=selected_fuel if selected_fuel != "전체" else None
     )
 
-    conn = team_db()
-    cars_from_db = []
-    if conn:
-        try:
-            cur = conn.cursor(dictionary=True)
-            cur.execute(query)
-            cars_from_db = cur.fetchall()
-        except mysql.connector.Error as e:
-            st.error(f"차량 정보 조회 실패: {e}")
-        finally:
-            conn.close()
+    # 조건이 바뀌어 전체 페이지 수가 줄었으면 마지막 페이지로 이동
+    total_cars = count_cars(car_filters)
+    total_pages = (total_cars - 1) // page_size + 1
+    st.session_state.pagenation = max(1, min(st.session_state.pagenation, total_pages))
+
+    # OFFSET 대신 이전 페이지 마지막 행의 키 다음부터 조회 (깊은 페이지도 첫 페이지와 같은 비용)
+    page_start, page_starts = get_page_start(car_filters, st.session_state.pagenation, page_size)
+    cars_from_db = get_car_page(car_filters, limit=page_size, after=page_start)
+    if len(cars_from_db) == page_size:
+        last_car = cars_from_db[-1]
+        page_starts.setdefault(st.session_state.pagenation + 1, (last_car['car_price'], last_car['car_id']))
 
     # 차량 카드 표시
     if cars_from_db:
+        # 카드를 그리기 전에 이 페이지의 차량 이미지를 한 번에 받아 둠 (이미 캐시된 것은 건너뜀)
+        prefetch_car_images(car['car_img_url'] for car in cars_from_db)
         for i in range(0, len(cars_from_db), 4):
             card_row = cars_from_db[i:i + 4]
             cols = st.columns(4)
             for idx, car in enumerate(card_row):
                 with cols[idx]:
-                    if car['car_img_url'] and car['car_img_url'].strip().startswith("http"):
-                        st.image(car['car_img_url'].strip(), use_container_width=True)
-                    else:
-                        st.image("../../docs/대체이미지.png", use_container_width=True)
+                    show_car_image(car['car_img_url'], use_container_width=True)
                     st.markdown(f"**{car['car_full_name']}**")
                     st.markdown(f"{car['car_price']}만원")
                     if st.button("세부정보", key=f"detail_{i}_{idx}"):
@@ -714,10 +777,7 @@ if page == "차량 정보 조회":
 
         col1, col2 = st.columns([1, 2])
         with col1:
-            if car['car_img_url'] and car['car_img_url'].strip().startswith("http"):
-                st.image(car['car_img_url'].strip(), width=300)
-            else:
-                st.image("../../docs/대체이미지.png", width=300)
+            show_car_image(car['car_img_url'], width=300)
 
         with col2:
             st.markdown(f"### {car.get('brand_name', '')} {car['car_full_name']}")
@@ -727,30 +787,6 @@ if page == "차량 정보 조회":
             st.markdown(f"**연비:** {car.get('car_fuel_efficiency', '정보 없음')} km/L")
 
     # 페이지네이션
-    total_query = make_query(
-        price_range=get_price_range(selected_price) if selected_price != "전체" else None,
-        min_efficiency=get_min_efficiency(selected_eff) if selected_eff != "전체" else None,
-        body_type=selected_body if selected_body != "전체" else None,
-        fuel_type=selected_fuel if selected_fuel != "전체" else None,
-        limit=1000000,
-        offset=0
-    )
-
-    total_query = total_query.split("ORDER BY")[0] + "ORDER BY 1"
-
-    conn = team_db()
-    total_cars = 0
-    if conn:
-        try:
-            cur = conn.cursor()
-            cur.execute(f"SELECT COUNT(*) FROM ({total_query}) as t")
-            total_cars = cur.fetchone()[0]
-        except mysql.connector.Error as e:
-            st.error(f"전체 차량 수 조회 실패: {e}")
-        finally:
-            conn.close()
-
-    total_pages = (total_cars - 1) // page_size + 1
     page_block = 5
     current_block = (st.session_state.pagenation - 1) // page_block
     start_page = current_block * page_block + 1
@@ -789,7 +825,9 @@ elif page == "리뷰와 평점":
     with col1:
         selected_body = st.selectbox("외형", body_types, key="review_body_filter")
     with col2:
-        brand_names = ["전체"] + get_distinct_values("SELECT DISTINCT brand_name FROM teamdb.BRAND_INFO")
+        brand_names = ["전체"] + get_filter_values(
+            "brand_name", "SELECT DISTINCT brand_name FROM teamdb.BRAND_INFO", only_in_use=False
+        )
         selected_brand = st.selectbox("브랜드", brand_names, key="review_brand_filter")
     with col3:
         price_ranges = ["전체", "1000만원대", "2000만원대", "3000만원대", "4000만원 이상"]
@@ -806,46 +844,30 @@ elif page == "리뷰와 평점":
     def get_filtered_reviews():
         price_range = get_price_range(selected_price) if selected_price != "전체" else None
 
-        query = """
-        SELECT DISTINCT
+        query = SelectQuery(
+            """DISTINCT
+            cri.car_id,
             cri.car_name,
             cri.avg_score,
             cri.survey_people_count,
             cri.graph_info,
             bi.brand_name,
             bti.body_type_category,
-            ci.car_price
-        FROM teamdb.car_review_info cri
-        JOIN (
-            SELECT car_full_name, car_brand, car_body_type, car_price
-            FROM teamdb.car_info
-            GROUP BY car_full_name, car_brand, car_body_type, car_price
-        ) ci ON cri.car_name = ci.car_full_name
+            ci.car_price""",
+            """teamdb.car_review_info cri
+        JOIN teamdb.car_info ci ON ci.car_id = cri.car_id
         JOIN teamdb.brand_info bi ON ci.car_brand = bi.brand_id
-        JOIN teamdb.body_type_info bti ON ci.car_body_type = bti.body_name
-        WHERE 1=1
-        """
-
-        if selected_body != "전체":
-            query += f" AND bti.body_type_category = '{selected_body}'"
-        if selected_brand != "전체":
-            query += f" AND bi.brand_name = '{selected_brand}'"
-        if price_range:
-            query += f" AND ci.car_price BETWEEN {price_range[0]} AND {price_range[1]}"
-
-        query += f" ORDER BY {sort_options[selected_sort]}"
+        JOIN teamdb.body_type_info bti ON ci.car_body_type = bti.body_name"""
+        )
+        apply_car_filters(query, price_range=price_range, body_type=selected_body, brand=selected_brand)
+        # 정렬 기준은 sort_options에 정해진 값만 사용
+        query, params = query.order_by(sort_options[selected_sort]).build()
 
-        conn = team_db()
         reviews = []
-        if conn:
-            try:
-                cur = conn.cursor(dictionary=True)
-                cur.execute(query)
-                reviews = cur.fetchall()
-            except mysql.connector.Error as e:
-                st.error(f"리뷰 조회 실패: {e}")
-            finally:
-                conn.close()
+        try:
+            reviews = fetch_all(query, params, label="get_filtered_reviews", prepared=True)
+        except mysql.connector.Error as e:
+            st.error(f"리뷰 조회 실패: {e}")
         return reviews
 
     reviews = get_filtered_reviews()
@@ -876,6 +898,10 @@ elif page == "리뷰와 평점":
 
     # 리뷰 목록 표시
     if unique_reviews:
+        # 현재 페이지 차량들의 이미지 URL을 한 번에 조회
+        review_img_urls = get_car_img_urls(review['car_name'] for review in current_reviews)
+        prefetch_car_images(review_img_urls.values())
+
         for i, review in enumerate(current_reviews):
             car_name = review['car_name']
             
@@ -887,18 +913,7 @@ elif page == "리뷰와 평점":
             
             # 자동차 이미지 (왼쪽)
             with col1:
-                # 자동차 이미지 URL 가져오기
-                conn = team_db()
-                car_img_url = None
-                if conn:
-                    try:
-                        cur = conn.cursor(dictionary=True)
-                        cur.execute("SELECT car_img_url FROM teamdb.CAR_INFO WHERE car_full_name = %s LIMIT 1", (car_name,))
-                        result = cur.fetchone()
-                        if result:
-                            car_img_url = result['car_img_url']
-                    finally:
-                        conn.close()
+                car_img_url = review_img_urls.get(car_name)
 
                 st.markdown('''
                     <style>
@@ -952,22 +967,13 @@ elif page == "리뷰와 평점":
 
                 # 이미지와 버튼을 포함하는 컨테이너
                 with st.container():
-                    if car_img_url and car_img_url.strip().startswith("http"):
-                        st.markdown(f'''
-                            <div class="image-wrapper">
-                                <div class="car-image-container">
-                                    <img src="{car_img_url.strip()}" alt="{car_name}">
-                                </div>
-                            </div>
-                        ''', unsafe_allow_html=True)
-                    else:
-                        st.markdown(f'''
-                            <div class="image-wrapper">
-                                <div class="car-image-container">
-                                    <img src="../../docs/대체이미지.png" alt="대체 이미지">
-                                </div>
+                    st.markdown(f'''
+                        <div class="image-wrapper">
+                            <div class="car-image-container">
+                                <img src="{car_image_src(car_img_url)}" alt="{car_name}">
                             </div>
-                        ''', unsafe_allow_html=True)
+                        </div>
+                    ''', unsafe_allow_html=True)
                     
                     # 리뷰 버튼
                     if st.button("댓글 확인하러가기", key=f"review_btn_{i}"):
@@ -1054,7 +1060,7 @@ elif page == "리뷰와 평점":
             # 댓글 섹션
             if st.session_state.get(f"show_reviews_{car_name}", False):
                 st.markdown('<div class="comment-section">', unsafe_allow_html=True)
-                comments = get_comments_by_car(car_name)
+                comments = get_comments_by_car(review['car_id'])
                 if comments:
                     st.markdown("#### 사용자 댓글")
                     for comment in comments:
@@ -1112,29 +1118,26 @@ elif page == "리뷰와 평점":
 elif page == "통계 정보":
     st.header("🚗 통계 정보")
 
+    # 추천 기록 대신 (연령대, 성별, 직업, 차량)별 추천 수 롤업(DB/migrations/004)을 읽음
     def load_statistics():
-        conn = team_db()
-        if conn is None:
-            return pd.DataFrame()
+        query = """
+            SELECT
+                s.age_group,
+                s.user_gender,
+                j.job_name,
+                c.car_full_name,
+                s.reco_count
+            FROM teamdb.recommendation_stats s
+            JOIN teamdb.car_info c ON s.car_id = c.car_id
+            LEFT JOIN teamdb.job_type_info j ON s.user_job = j.job_id
+            WHERE s.reco_count > 0
+        """
         try:
-            query = """
-                SELECT
-                    u.user_age,
-                    u.user_gender,
-                    j.job_name,
-                    c.car_full_name
-                FROM teamdb.car_recommendation_info r
-                JOIN teamdb.user_info u ON r.user_id = u.user_id
-                JOIN teamdb.car_info c ON r.car_id = c.car_id
-                LEFT JOIN teamdb.job_type_info j ON u.user_job = j.job_id
-            """
-            df = pd.read_sql(query, conn)
-            return df
-        except Exception as e:
+            rows = fetch_all(query, label="load_statistics", prepared=True)
+        except mysql.connector.Error as e:
             st.error(f"통계 데이터 불러오기 실패: {e}")
             return pd.DataFrame()
-        finally:
-            conn.close()
+        return pd.DataFrame(rows, columns=["age_group", "user_gender", "job_name", "car_full_name", "reco_count"])
 
     stats_df = load_statistics()
 
@@ -1144,61 +1147,41 @@ elif page == "통계 정보":
         ### 연령별 통계
         st.subheader("📊 연령대별 선호 차량 분석")
         
-        # 연령대 그룹핑
-        stats_df['age_group'] = pd.cut(
-            stats_df['user_age'],
-            bins=[0, 29, 39, 49, 100],
-            labels=['20대', '30대', '40대', '50대 이상']
-        )
-
         # 연령대별 데이터를 한 번에 처리
         age_groups = ['20대', '30대', '40대']
         
+        # 연령대 상위 3개, 성별 상위 5개, 직업 상위 3개 차량을 한 번에 집계
+        top_cars_summary = top_cars_by_dimension(stats_df, {"age_group": 3, "user_gender": 5, "job_name": 3})
+
+        # 모든 연령대의 상위 차량 이미지 URL을 한 번에 조회
+        age_top_cars = {age: top_cars_summary.top("age_group", age) for age in age_groups}
+        stats_img_urls = get_car_img_urls(
+            name for top_cars in age_top_cars.values() for name in top_cars['car_full_name']
+        )
+        prefetch_car_images(stats_img_urls.values())
+
         # 3개의 열 생성
         cols = st.columns(3)
         
         for idx, age in enumerate(age_groups):
             with cols[idx]:
-                age_data = stats_df[stats_df['age_group'] == age]
-                if not age_data.empty:
+                top_cars = age_top_cars[age]
+                if not top_cars.empty:
                     st.markdown(f'''
                         <div class="age-stats-container">
                             <div class="age-group-title">{age}</div>
                             <div style="display: flex; flex-direction: column; gap: 15px;">
                     ''', unsafe_allow_html=True)
-                    
-                    # 상위 3개 차량 추출
-                    top_cars = (
-                        age_data.groupby('car_full_name')
-                        .size()
-                        .reset_index(name='count')
-                        .sort_values('count', ascending=False)
-                        .head(3)
-                    )
 
-                    for rank, (_, car) in enumerate(top_cars.iterrows(), 1):
-                        # 차량 이미지 URL 가져오기
-                        conn = team_db()
-                        car_img_url = None
-                        if conn:
-                            try:
-                                cur = conn.cursor(dictionary=True)
-                                cur.execute(
-                                    "SELECT car_img_url FROM teamdb.CAR_INFO WHERE car_full_name = %s LIMIT 1",
-                                    (car['car_full_name'],)
-                                )
-                                result = cur.fetchone()
-                                if result:
-                                    car_img_url = result['car_img_url']
-                            finally:
-                                conn.close()
+                    for _, car in top_cars.iterrows():
+                        car_img_url = stats_img_urls.get(car['car_full_name'])
 
                         st.markdown(f'''
                             <div class="car-card">
                                 <div class="car-rank-badge">
-                                    {rank}위
+                                    {car['rank']}위
                                 </div>
-                                <img src="{car_img_url.strip() if car_img_url and car_img_url.strip().startswith('http') else '../../docs/대체이미지.png'}" 
+                                <img src="{car_image_src(car_img_url)}" 
                                      class="car-image">
                                 <div class="car-title">
                                     {car['car_full_name']}
@@ -1220,18 +1203,11 @@ elif page == "통계 정보":
         # 성별 데이터를 한 번에 처리하기 위한 컬럼 생성
         gender_cols = st.columns(2)
         
-        genders = stats_df['user_gender'].dropna().unique()
-        for idx, gender in enumerate(genders):
+        genders = top_cars_summary.values("user_gender")
+        for idx, gender in enumerate(genders[:len(gender_cols)]):
             with gender_cols[idx]:
-                gender_data = stats_df[stats_df['user_gender'] == gender]
-                if not gender_data.empty:
-                    top_cars = (
-                        gender_data.groupby('car_full_name')
-                        .size()
-                        .reset_index(name='count')
-                        .sort_values('count', ascending=False)
-                        .head(5)
-                    )
+                top_cars = top_cars_summary.top("user_gender", gender)
+                if not top_cars.empty:
 
                     st.markdown(f"#### {gender}")
                     chart = alt.Chart(top_cars).mark_arc(innerRadius=50).encode(
@@ -1257,8 +1233,8 @@ elif page == "통계 정보":
                     """, unsafe_allow_html=True)
                     
                     st.markdown('<div class="gender-stats-table">', unsafe_allow_html=True)
-                    for idx, row in top_cars.iterrows():
-                        st.markdown(f"**{idx+1}위**: {row['car_full_name']} ({row['count']}건)")
+                    for _, row in top_cars.iterrows():
+                        st.markdown(f"**{row['rank']}위**: {row['car_full_name']} ({row['count']}건)")
                     st.markdown('</div>', unsafe_allow_html=True)
 
         ### 직업별 통계
@@ -1267,31 +1243,8 @@ elif page == "통계 정보":
         # 데이터 준비
         jobs_order = ['대학생', '사무직', 'IT/개발', '서비스직', '생산직', '기타']
 
-        job_car = (
-            stats_df.groupby(['job_name', 'car_full_name'])
-            .size()
-            .reset_index(name='count')
-        )
-
-        top3_job_car = (
-            job_car.sort_values(['job_name', 'count'], ascending=[True, False])
-            .groupby('job_name')
-            .head(3)
-        )
-
-        # 직업명 순서 고정
-        top3_job_car['job_name'] = pd.Categorical(top3_job_car['job_name'], categories=jobs_order, ordered=True)
-        top3_job_car = top3_job_car.sort_values(['job_name'])
-
-        # offset 생성
-        offset_list = []
-        offset_counter = 0
-        for job in jobs_order:
-            count = top3_job_car[top3_job_car['job_name'] == job].shape[0]
-            offset_list.extend([offset_counter + i for i in range(count)])
-            offset_counter += count + 4  # 간격
-
-        top3_job_car['offset'] = offset_list
+        # 직업 순서대로 정렬하고 직업 사이에 4칸 간격을 둔 막대 위치(offset) 계산
+        top3_job_car = top_cars_summary.chart_frame("job_name", jobs_order, gap=4)
 
         # 직업명 레이블용 데이터
         job_labels = top3_job_car.groupby('job_name').first().reset_index()[['job_name', 'offset']]
@@ -1333,6 +1286,9 @@ elif page == "통계 정보":
         full_chart = alt.hconcat(labels_chart, bars + text_car).resolve_scale(y='shared')
         st.altair_chart(full_chart, use_container_width=True)
 
+# 쿼리 타이밍 통계 (SHOW_QUERY_STATS=1 일 때만 표시)
+render_query_stats({"정적 이미지": asset_stats(), "차량 이미지": car_image_stats()})
+
 # 저작권 표시
 st.markdown("""
     <div class="copyright">
@@ -0,0 +1,104 @@
+"""페이지 공용 파라미터 바인딩 SELECT 빌더
+
+값은 항상 %s 자리표시자로만 넣고 SQL 문자열에는 넣지 않는다.
+그래서 같은 모양(어떤 필터를 썼는지)이면 값이 달라도 SQL 문장이 똑같고,
+db_pool의 서버측 prepared statement를 그대로 다시 쓸 수 있다.
+ORDER BY 같은 식별자는 코드에 정해진 값만 넘겨야 한다 (사용자 입력 금지).
+"""
+
+# IN (...) 자리표시자 개수를 이 크기들로 맞춰 문장 모양 수를 줄임 (남는 자리는 마지막 값 반복)
+IN_LIST_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128)
+
+# 차량 목록 공통 FROM 절 (ci = CAR_INFO)
+CAR_FROM = """teamdb.CAR_INFO ci
+    JOIN teamdb.BRAND_INFO bi ON ci.car_brand = bi.brand_id
+    JOIN teamdb.BODY_TYPE_INFO bti ON ci.car_body_type = bti.body_name
+    JOIN teamdb.FUEL_TYPE_INFO fi ON ci.car_fuel_type = fi.fuel_type_id"""
+
+
+def _in_list_size(n):
+    for size in IN_LIST_BUCKETS:
+        if n <= size:
+            return size
+    return n
+
+
+class SelectQuery:
+    """SELECT 문을 조건 단위로 조립해 (SQL, 파라미터)로 만드는 클래스"""
+
+    def __init__(self, columns, from_clause):
+        self.columns = columns
+        self.from_clause = from_clause
+        self._where = []
+        self._params = []
+        self._order_by = None
+        self._limit = None
+
+    def where(self, condition, *params):
+        """%s 자리표시자가 있는 조건과 그 값을 추가"""
+        self._where.append(condition)
+        self._params.extend(params)
+        return self
+
+    def where_in(self, column, values):
+        """column IN (...) 조건 추가 (값이 없으면 결과도 없음)"""
+        values = list(values)
+        if not values:
+            self._where.append("1 = 0")
+            return self
+        size = _in_list_size(len(values))
+        values += [values[-1]] * (size - len(values))
+        return self.where(f"{column} IN ({', '.join(['%s'] * size)})", *values)
+
+    def order_by(self, *clauses):
+        self._order_by = ", ".join(clauses)
+        return self
+
+    def limit(self, limit):
+        self._limit = limit
+        return self
+
+    def build(self):
+        """(SQL, 파라미터 튜플) 반환"""
+        query = f"SELECT {self.columns}\nFROM {self.from_clause}"
+        params = list(self._params)
+        if self._where:
+            query += "\nWHERE " + "\n  AND ".join(self._where)
+        if self._order_by:
+            query += f"\nORDER BY {self._order_by}"
+        if self._limit is not None:
+            query += "\nLIMIT %s"
+            params.append(self._limit)
+        return query, tuple(params)
+
+
+def apply_car_filters(query, price_range=None, min_efficiency=None, body_type=None, fuel_type=None, brand=None):
+    """차량 필터 조건 추가 ("전체"나 None은 무시)
+    car_info의 (category_id, car_fuel_type, car_price) 인덱스를 쓰도록 car_info 컬럼 기준으로 비교"""
+    if price_range:
+        query.where("ci.car_price BETWEEN %s AND %s", price_range[0], price_range[1])
+    if min_efficiency is not None:
+        query.where("ci.car_fuel_efficiency >= %s", min_efficiency)
+    if body_type and body_type != "전체":
+        query.where(
+            "ci.category_id IN (SELECT category_id FROM teamdb.BODY_TYPE_INFO WHERE body_type_category = %s)",
+            body_type
+        )
+    if fuel_type and fuel_type != "전체":
+        query.where(
+            "ci.car_fuel_type IN (SELECT fuel_type_id FROM teamdb.FUEL_TYPE_INFO WHERE fuel_type_name = %s)",
+            fuel_type
+        )
+    if brand and brand != "전체":
+        query.where("ci.car_brand IN (SELECT brand_id FROM teamdb.BRAND_INFO WHERE brand_name = %s)", brand)
+    return query
+
+
+def apply_price_seek(query, after):
+    """(car_price, car_id) 키 다음 행만 남기는 키셋 조건 추가 (MySQL은 NULL 가격을 가장 앞에 정렬)"""
+    if after is None:
+        return query
+    price_key, id_key = after
+    if price_key is None:
+        return query.where("(ci.car_price IS NOT NULL OR ci.car_id > %s)", id_key)
+    return query.where("(ci.car_price > %s OR (ci.car_price = %s AND ci.car_id > %s))", price_key, price_key, id_key)
@@ -0,0 +1,309 @@
+import heapq
+import itertools
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from query_builder import SelectQuery, CAR_FROM, apply_car_filters
+
+# 선호도에 따른 정렬 컬럼 매핑 (recommendation_query의 ORDER BY와 동일)
+PREFERENCE_COLUMNS = {
+    "연비 (최저)": ("car_fuel_efficiency", "ASC"),
+    "가격 (최저)": ("car_price", "ASC"),
+    "평점 (네이버 평점 기준)": ("avg_score", "DESC"),
+    "차체 크기 (실내 공간 기준 = 축거/전장*100)": ("car_size", "DESC"),
+    "성능 (출력-최저)": ("car_horsepower", "DESC")
+}
+
+# 선호도가 없을 때의 기본 정렬
+DEFAULT_ORDER = [("car_price", "ASC")]
+
+# 특징 행렬 컬럼 순서
+FEATURE_COLUMNS = ["car_fuel_efficiency", "car_price", "avg_score", "car_size", "car_horsepower"]
+
+# 추천 방식: 우선순위 순 정렬(기존 ORDER BY) / 가중치 점수
+MODE_LEXICOGRAPHIC = "lexicographic"
+MODE_WEIGHTED = "weighted"
+
+# 옵션 페이지(2_second_page)에서 고를 수 있는 값들 (사전 계산용)
+BUDGET_STEPS = list(range(1000, 5001, 500))
+FUEL_TYPES = ["디젤", "가솔린", "하이브리드", "전기"]
+BODY_TYPES = ["경차", "승용차", "SUV", "기타"]
+
+# 추천 결과 캐시 크기와 카탈로그 버전별 전체 사전 계산 여부
+RECOMMEND_CACHE_SIZE = int(os.getenv("RECOMMEND_CACHE_SIZE", "100000"))
+PRECOMPUTE_RECOMMENDATIONS = os.getenv("PRECOMPUTE_RECOMMENDATIONS", "0") == "1"
+
+
+# 카탈로그 스냅샷이 없을 때 쓰는 추천 SQL (3_third_page.get_filtered_cars_sql)
+RECOMMEND_SQL_COLUMNS = """DISTINCT
+    ci.car_id,
+    bi.brand_name,
+    ci.car_full_name,
+    ci.car_price,
+    ci.car_img_url,
+    ci.car_fuel_efficiency,
+    ci.car_horsepower,
+    ci.car_engine_type,
+    fi.fuel_type_name,
+    bti.body_type_category,
+    COALESCE(cri.avg_score, 0) as avg_score,
+    ci.car_size"""
+
+RECOMMEND_SQL_FROM = CAR_FROM + """
+    LEFT JOIN (
+        SELECT car_id, MAX(avg_score) as avg_score
+        FROM teamdb.CAR_REVIEW_INFO
+        GROUP BY car_id
+    ) cri ON cri.car_id = ci.car_model_id"""
+
+
+def order_columns(preferences):
+    """선호도 목록을 (컬럼, 방향) 목록으로 변환 (없으면 기본 정렬)"""
+    order = [PREFERENCE_COLUMNS[pref] for pref in preferences if pref in PREFERENCE_COLUMNS]
+    return order or DEFAULT_ORDER
+
+
+def recommendation_query(min_val, max_val, body_type=None, fuel_type=None, preferences=(), k=3):
+    """RecommendEngine.top_k_indices와 같은 조건/순서의 추천 SQL (SQL, 파라미터) 반환
+    ORDER BY 컬럼은 PREFERENCE_COLUMNS에 정해진 값만 쓰고, 동점이면 car_id 순"""
+    order_clauses = [
+        f"{col if col == 'avg_score' else 'ci.' + col} {direction}"
+        for col, direction in order_columns(preferences)
+    ]
+    order_clauses.append("ci.car_id ASC")
+    query = SelectQuery(RECOMMEND_SQL_COLUMNS, RECOMMEND_SQL_FROM)
+    apply_car_filters(query, price_range=(min_val, max_val), body_type=body_type, fuel_type=fuel_type)
+    return query.order_by(*order_clauses).limit(k).build()
+
+
+def rank_weights(n):
+    """순위 n개에 대한 가중치 (Rank Order Centroid, 합계 1)
+    n=3 이면 [0.611, 0.278, 0.111]"""
+    return np.array([sum(1 / j for j in range(i, n + 1)) / n for i in range(1, n + 1)])
+
+
+class RecommendEngine:
+    """카탈로그 스냅샷 위에서 동작하는 추천 엔진 (DB 조회 없음)"""
+
+    def __init__(self, catalog):
+        self.catalog = catalog
+        self.version = catalog.version
+        self.car_id = catalog.car_id
+        self.features = np.column_stack(
+            [catalog.num[col] for col in FEATURE_COLUMNS]
+        ) if len(catalog) else np.empty((0, len(FEATURE_COLUMNS)))
+
+        # 정렬 키를 미리 계산: 항상 오름차순으로 비교할 수 있도록 DESC는 부호를 뒤집음
+        # MySQL은 NULL을 ASC에서는 맨 앞, DESC에서는 맨 뒤에 두므로 NaN을 -inf로 치환
+        self.sort_keys = {}
+        for pos, col in enumerate(FEATURE_COLUMNS):
+            values = self.features[:, pos]
+            asc = np.where(np.isnan(values), -np.inf, values)
+            desc = np.where(np.isnan(values), np.inf, -values)
+            self.sort_keys[(col, "ASC")] = asc
+            self.sort_keys[(col, "DESC")] = desc
+
+        # 가중치 모드용 정규화 점수 (카탈로그 버전당 한 번 계산)
+        # min-max로 0~1 정규화 후 ASC 항목은 뒤집어 항상 1이 가장 좋은 값이 되도록 함, 값이 없으면 0
+        self.normalized = {}
+        for pos, col in enumerate(FEATURE_COLUMNS):
+            values = self.features[:, pos]
+            valid = ~np.isnan(values)
+            norm = np.zeros(len(values))
+            if valid.any():
+                lo, hi = values[valid].min(), values[valid].max()
+                span = hi - lo
+                norm[valid] = (values[valid] - lo) / span if span > 0 else 1.0
+            self.normalized[(col, "DESC")] = norm
+            self.normalized[(col, "ASC")] = np.where(valid, 1.0 - norm, 0.0)
+
+    def order_columns(self, preferences):
+        """선호도 목록을 (컬럼, 방향) 목록으로 변환"""
+        return order_columns(preferences)
+
+    def filter_mask(self, min_val, max_val, body_type=None, fuel_type=None):
+        return self.catalog.mask(
+            price_range=(min_val, max_val),
+            body_type=body_type,
+            fuel_type=fuel_type
+        )
+
+    def top_k_indices(self, mask, preferences, k=3):
+        """조건에 맞는 행을 선호도 순(동점은 car_id 순)으로 정렬한 상위 k개 인덱스"""
+        idx = np.flatnonzero(mask)
+        if idx.size == 0 or k <= 0:
+            return idx[:0]
+
+        keys = [self.sort_keys[col_dir] for col_dir in self.order_columns(preferences)]
+
+        # 후보가 많으면 1순위 키로 k번째 값까지만 남긴 뒤 정렬 (동점은 모두 포함)
+        if idx.size > k:
+            primary = keys[0][idx]
+            kth = np.partition(primary, k - 1)[k - 1]
+            idx = idx[primary <= kth]
+
+        # lexsort는 마지막 키가 1순위
+        sort_keys = [self.car_id[idx]] + [key[idx] for key in reversed(keys)]
+        order = np.lexsort(sort_keys)
+        return idx[order[:k]]
+
+    def weighted_top_k_indices(self, mask, preferences, k=3):
+        """선호도 순위 가중치로 합산한 점수가 높은 상위 k개 인덱스 (동점은 car_id 순)"""
+        idx = np.flatnonzero(mask)
+        if idx.size == 0 or k <= 0:
+            return idx[:0]
+
+        order = self.order_columns(preferences)
+        weights = rank_weights(len(order))
+        scores = np.zeros(idx.size)
+        for weight, col_dir in zip(weights, order):
+            scores += weight * self.normalized[col_dir][idx]
+
+        # k번째 점수 이상인 후보만 남긴 뒤 크기 k의 힙으로 선택
+        if idx.size > k:
+            kth = np.partition(scores, idx.size - k)[idx.size - k]
+            keep = scores >= kth
+            idx, scores = idx[keep], scores[keep]
+        car_ids = self.car_id[idx]
+        best = heapq.nlargest(k, range(idx.size), key=lambda i: (scores[i], -car_ids[i]))
+        return idx[best]
+
+    def recommend(self, min_val, max_val, body_type=None, fuel_type=None, preferences=(), k=3,
+                  mode=MODE_LEXICOGRAPHIC):
+        """예산/바디타입/연료타입 조건과 선호도 순위로 상위 k개 차량 반환"""
+        mask = self.filter_mask(min_val, max_val, body_type, fuel_type)
+        if mode == MODE_WEIGHTED:
+            indices = self.weighted_top_k_indices(mask, preferences, k)
+        else:
+            indices = self.top_k_indices(mask, preferences, k)
+        return self.catalog.rows(indices)
+
+
+class RecommendationCache:
+    """카탈로그 버전별 추천 결과 LRU 캐시 (값은 카탈로그 행 인덱스)"""
+
+    def __init__(self, maxsize=RECOMMEND_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._data = OrderedDict()
+        self.version = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.precomputed = 0
+
+    def _switch_version(self, version):
+        # 더 새로운 카탈로그 버전이면 이전 결과는 모두 버림
+        if self.version is None or version > self.version:
+            self._data.clear()
+            self.version = version
+            self.precomputed = 0
+
+    def get(self, version, key):
+        with self._lock:
+            self._switch_version(version)
+            value = self._data.get(key) if version == self.version else None
+            if value is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, version, key, value):
+        with self._lock:
+            if version != self.version:
+                # 이미 다음 버전으로 넘어간 뒤 계산된 결과는 저장하지 않음
+                return
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "version": self.version,
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "evictions": self.evictions,
+                "precomputed": self.precomputed,
+            }
+
+
+# 프로세스 전체에서 공유하는 추천 결과 캐시
+recommend_cache = RecommendationCache()
+
+
+def cache_key(min_val, max_val, body_type, fuel_type, preferences, k=3, mode=MODE_LEXICOGRAPHIC):
+    """(min_val, max_val, body_type, fuel_type, first, second, third, k, mode)"""
+    first, second, third = (list(preferences) + [None, None, None])[:3]
+    return (min_val, max_val, body_type, fuel_type, first, second, third, k, mode)
+
+
+def _compute_indices(engine, key):
+    min_val, max_val, body_type, fuel_type, first, second, third, k, mode = key
+    mask = engine.filter_mask(min_val, max_val, body_type, fuel_type)
+    preferences = [first, second, third]
+    if mode == MODE_WEIGHTED:
+        return engine.weighted_top_k_indices(mask, preferences, k)
+    return engine.top_k_indices(mask, preferences, k)
+
+
+def recommend_cached(engine, min_val, max_val, body_type=None, fuel_type=None, preferences=(), k=3,
+                     mode=MODE_LEXICOGRAPHIC, cache=recommend_cache):
+    """engine.recommend()와 같은 결과를 캐시를 거쳐 반환"""
+    key = cache_key(min_val, max_val, body_type, fuel_type, preferences, k, mode)
+    indices = cache.get(engine.version, key)
+    if indices is None:
+        indices = tuple(_compute_indices(engine, key))
+        cache.put(engine.version, key, indices)
+    return engine.catalog.rows(indices)
+
+
+def precompute_all(engine, cache=recommend_cache, k=3):
+    """옵션 페이지에서 가능한 모든 입력 조합의 추천 결과를 미리 계산"""
+    with cache._lock:
+        cache._switch_version(engine.version)
+    triples = list(itertools.permutations(PREFERENCE_COLUMNS, 3))
+    budgets = [(lo, hi) for lo in BUDGET_STEPS for hi in BUDGET_STEPS if lo <= hi]
+    count = 0
+    for (min_val, max_val), body_type, fuel_type, triple, mode in itertools.product(
+            budgets, BODY_TYPES, FUEL_TYPES, triples, (MODE_LEXICOGRAPHIC, MODE_WEIGHTED)):
+        if cache.version != engine.version:
+            # 계산 도중 카탈로그가 바뀌면 중단
+            break
+        key = cache_key(min_val, max_val, body_type, fuel_type, triple, k, mode)
+        cache.put(engine.version, key, tuple(_compute_indices(engine, key)))
+        count += 1
+    with cache._lock:
+        if cache.version == engine.version:
+            cache.precomputed = count
+    return count
+
+
+_lock = threading.Lock()
+_engine = None
+
+
+def get_engine(catalog):
+    """카탈로그 버전이 바뀔 때만 엔진(특징 행렬)을 다시 만든다"""
+    global _engine
+    engine = _engine
+    if engine is not None and engine.catalog is catalog:
+        return engine
+    with _lock:
+        if _engine is None or _engine.catalog is not catalog:
+            _engine = RecommendEngine(catalog)
+            if PRECOMPUTE_RECOMMENDATIONS:
+                # 새 버전이 올라오면 백그라운드에서 전체 조합을 미리 계산
+                threading.Thread(target=precompute_all, args=(_engine,), daemon=True).start()
+        return _engine
@@ -0,0 +1,115 @@
+"""추천 통계 롤업 테이블 (DB/migrations/004) 갱신
+
+recommendation_stats에 (연령대, 성별, 직업, car_id)별 추천 수를 미리 모아 두고,
+recommendation_stats_state.last_reco_id까지의 car_recommendation_info가 반영되어 있음을 기록한다.
+compact()는 그 뒤에 추가된 추천만 집계해 더하므로 몇 번을 실행해도 중복 집계되지 않는다.
+
+- 추천 저장(3_third_page.save_recommendation)이 같은 트랜잭션에서 compact()를 호출
+- seed.sql처럼 직접 넣은 추천은 주기 작업으로 반영: python recommendation_stats.py compact
+- 통계를 처음부터 다시 만들 때: python recommendation_stats.py rebuild
+"""
+import argparse
+import os
+
+import mysql.connector
+from dotenv import load_dotenv
+
+# 연령대 구간 (상한 나이 포함, 4_fourth_page의 기존 pd.cut 구간과 동일), 범위 밖은 '기타'
+AGE_GROUPS = [(29, "20대"), (39, "30대"), (49, "40대"), (100, "50대 이상")]
+OTHER_AGE_GROUP = "기타"
+
+
+def age_group_sql(column):
+    """나이 컬럼을 연령대 이름으로 바꾸는 CASE 식"""
+    cases = " ".join(f"WHEN {column} <= {upper} THEN '{name}'" for upper, name in AGE_GROUPS)
+    return f"CASE WHEN {column} <= 0 THEN '{OTHER_AGE_GROUP}' {cases} ELSE '{OTHER_AGE_GROUP}' END"
+
+
+# (last_reco_id, 상한] 구간의 추천을 집계해 롤업에 더함
+COMPACT_QUERY = f"""
+    INSERT INTO teamdb.recommendation_stats (age_group, user_gender, user_job, car_id, reco_count)
+    SELECT d.age_group, d.user_gender, d.user_job, d.car_id, d.cnt
+    FROM (
+        SELECT
+            {age_group_sql("u.user_age")} AS age_group,
+            u.user_gender,
+            u.user_job,
+            r.car_id,
+            COUNT(*) AS cnt
+        FROM teamdb.car_recommendation_info r
+        JOIN teamdb.user_info u ON r.user_id = u.user_id
+        WHERE r.reco_id > %s AND r.reco_id <= %s
+        GROUP BY age_group, u.user_gender, u.user_job, r.car_id
+    ) d
+    ON DUPLICATE KEY UPDATE reco_count = recommendation_stats.reco_count + d.cnt
+"""
+
+
+def lock_stats(cursor):
+    """롤업 상태 행을 잠그고 마지막으로 반영된 reco_id를 반환
+    추천 저장 시 INSERT 전에 먼저 잠가야 reco_id 순서대로 반영된다 (트랜잭션 안에서 호출)"""
+    cursor.execute("SELECT last_reco_id FROM teamdb.recommendation_stats_state WHERE id = 1 FOR UPDATE")
+    row = cursor.fetchone()
+    if row is None:
+        cursor.execute("INSERT INTO teamdb.recommendation_stats_state (id, last_reco_id) VALUES (1, 0)")
+        return 0
+    return row[0]
+
+
+def compact(cursor, last_reco_id=None):
+    """아직 반영되지 않은 추천을 롤업에 더하고 반영한 추천 수를 반환 (트랜잭션 안에서 호출)"""
+    if last_reco_id is None:
+        last_reco_id = lock_stats(cursor)
+    cursor.execute("SELECT COALESCE(MAX(reco_id), 0) FROM teamdb.car_recommendation_info")
+    upper = cursor.fetchone()[0]
+    if upper <= last_reco_id:
+        return 0
+    cursor.execute(
+        "SELECT COUNT(*) FROM teamdb.car_recommendation_info WHERE reco_id > %s AND reco_id <= %s",
+        (last_reco_id, upper)
+    )
+    added = cursor.fetchone()[0]
+    cursor.execute(COMPACT_QUERY, (last_reco_id, upper))
+    cursor.execute("UPDATE teamdb.recommendation_stats_state SET last_reco_id = %s WHERE id = 1", (upper,))
+    return added
+
+
+def rebuild(cursor):
+    """롤업을 비우고 전체 추천 기록으로 다시 집계 (트랜잭션 안에서 호출)"""
+    lock_stats(cursor)
+    cursor.execute("DELETE FROM teamdb.recommendation_stats")
+    return compact(cursor, last_reco_id=0)
+
+
+def connect():
+    load_dotenv()
+    return mysql.connector.connect(
+        host=os.getenv("DB_HOST", "localhost"),
+        user=os.getenv("DB_USER"),
+        password=os.getenv("DB_PASSWORD"),
+        database=os.getenv("DB_NAME", "teamdb"),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="추천 통계 롤업 갱신")
+    parser.add_argument("command", choices=["compact", "rebuild"], nargs="?", default="compact")
+    args = parser.parse_args()
+
+    conn = connect()
+    cursor = conn.cursor()
+    try:
+        conn.start_transaction()
+        added = rebuild(cursor) if args.command == "rebuild" else compact(cursor)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+        conn.close()
+    print(f"✅ 추천 통계 {args.command} 완료: 추천 {added}건 반영")
+
+
+if __name__ == "__main__":
+    main()
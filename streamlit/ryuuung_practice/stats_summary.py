@@ -0,0 +1,91 @@
+"""통계 탭용 차원별 상위 차량 집계
+
+연령대/성별/직업 각각의 값마다 추천 수 상위 k개 차량을 한 번에 구한다.
+차원 값과 차량명을 정수 코드로 바꾼 뒤 (차원 값, 차량) 키 하나로 합쳐 np.bincount 한 번으로 세고,
+정렬 한 번으로 그룹별 상위 k개를 고른다 (슬라이스마다 groupby를 다시 돌리지 않음).
+"""
+import numpy as np
+import pandas as pd
+
+# 통계 탭 차트별 상위 개수
+DEFAULT_TOP_K = {"age_group": 3, "user_gender": 5, "job_name": 3}
+
+RESULT_COLUMNS = ["dimension", "value", "rank", "car_full_name", "count"]
+
+
+class TopCars:
+    """차원별 상위 차량 집계 결과 (상위 k개 행만 보관)
+    frame 컬럼: dimension, value, rank(1부터), car_full_name, count"""
+
+    def __init__(self, frame):
+        self.frame = frame
+
+    def __len__(self):
+        return len(self.frame)
+
+    def values(self, dimension):
+        """집계된 차원 값 목록 (정렬 순)"""
+        return list(self.frame.loc[self.frame["dimension"] == dimension, "value"].unique())
+
+    def top(self, dimension, value):
+        """차원 값 하나의 상위 차량 (rank, car_full_name, count), 없으면 빈 DataFrame"""
+        rows = self.frame[(self.frame["dimension"] == dimension) & (self.frame["value"] == value)]
+        return rows[["rank", "car_full_name", "count"]].reset_index(drop=True)
+
+    def chart_frame(self, dimension, order, gap=4):
+        """막대 차트용: order 순서로 정렬하고 그룹 사이에 gap 칸을 띄운 y 위치(offset) 추가"""
+        rows = self.frame[(self.frame["dimension"] == dimension) & self.frame["value"].isin(order)]
+        position = rows["value"].map({value: i for i, value in enumerate(order)})
+        rows = rows.assign(_position=position).sort_values(["_position", "rank"])
+        offset = np.arange(len(rows)) + gap * rows["_position"].to_numpy()
+        return rows.drop(columns="_position").rename(columns={"value": dimension}).assign(offset=offset).reset_index(drop=True)
+
+
+def top_cars_by_dimension(df, top_k=None, car_column="car_full_name", weight_column="reco_count"):
+    """df의 차원 컬럼(top_k의 키)별로 값마다 상위 k개 차량을 구해 TopCars로 반환
+    weight_column이 있으면 그 값을 추천 수로 더하고(롤업 행), 없으면 행 수를 셈
+    동점이면 차량명 순"""
+    top_k = top_k or DEFAULT_TOP_K
+    if df.empty:
+        return TopCars(pd.DataFrame(columns=RESULT_COLUMNS))
+
+    car_codes, car_names = pd.factorize(df[car_column], sort=True)
+    n_cars = len(car_names)
+    weights = df[weight_column].to_numpy(dtype=np.float64) if weight_column in df else np.ones(len(df))
+
+    keys = []
+    key_weights = []
+    group_dimension = []
+    group_value = []
+    group_k = []
+    for dimension, k in top_k.items():
+        codes, values = pd.factorize(df[dimension], sort=True)
+        valid = (codes >= 0) & (car_codes >= 0)
+        # 그룹 번호 = 지금까지의 그룹 수 + 차원 값 코드, 키 = 그룹 번호 * 차량 수 + 차량 코드
+        keys.append((len(group_value) + codes[valid]).astype(np.int64) * n_cars + car_codes[valid])
+        key_weights.append(weights[valid])
+        group_dimension += [dimension] * len(values)
+        group_value += list(values)
+        group_k += [k] * len(values)
+
+    counts = np.bincount(np.concatenate(keys), weights=np.concatenate(key_weights),
+                         minlength=len(group_value) * n_cars)
+    present = np.flatnonzero(counts)
+    group = present // n_cars
+    car = present % n_cars
+
+    # 그룹 순 → 추천 수 내림차순 → 차량명 순으로 정렬한 뒤 그룹 안 순위 계산
+    order = np.lexsort((car, -counts[present], group))
+    group, car, count = group[order], car[order], counts[present][order]
+    rank = np.arange(len(group)) - np.searchsorted(group, group, side="left") + 1
+    keep = rank <= np.asarray(group_k)[group]
+    group, car, count, rank = group[keep], car[keep], count[keep], rank[keep]
+
+    frame = pd.DataFrame({
+        "dimension": np.asarray(group_dimension, dtype=object)[group],
+        "value": np.asarray(group_value, dtype=object)[group],
+        "rank": rank,
+        "car_full_name": np.asarray(car_names, dtype=object)[car],
+        "count": count.astype(np.int64),
+    })
+    return TopCars(frame)
@@ -0,0 +1,340 @@
+"""사용자 정보/추천 결과 저장을 백그라운드에서 모아서 처리하는 write-behind 큐
+
+페이지는 큐에 넣기만 하고 바로 화면을 그린다 (DB를 기다리지 않음).
+저장 스레드가 여러 세션의 항목을 batch_size개 또는 flush_interval초마다 모아
+user_info와 car_recommendation_info를 executemany로 한 트랜잭션에 저장하고,
+같은 트랜잭션에서 추천 통계 롤업(recommendation_stats)도 갱신한다.
+
+user_id는 저장할 때 정해지므로 세션은 임의의 토큰(user_token)으로 자기 사용자 행을 가리킨다.
+큐가 가득 찼거나 MySQL에 저장하지 못한 항목은 스필 파일(JSONL)에 남겼다가 다음 저장 때 먼저 다시 시도한다.
+"""
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+import mysql.connector
+
+import recommendation_stats
+
+logger = logging.getLogger(__name__)
+
+# 큐 크기(넘치면 스필 파일로), 배치 크기, 최대 대기 후 저장 간격(초), 저장 실패 후 재시도 간격(초)
+WRITE_BEHIND_QUEUE_SIZE = int(os.getenv("WRITE_BEHIND_QUEUE_SIZE", "1000"))
+WRITE_BEHIND_BATCH_SIZE = int(os.getenv("WRITE_BEHIND_BATCH_SIZE", "50"))
+WRITE_BEHIND_FLUSH_INTERVAL = float(os.getenv("WRITE_BEHIND_FLUSH_INTERVAL", "1.0"))
+WRITE_BEHIND_RETRY_SECONDS = float(os.getenv("WRITE_BEHIND_RETRY_SECONDS", "30"))
+WRITE_BEHIND_SPILL_FILE = Path(os.getenv(
+    "WRITE_BEHIND_SPILL_FILE",
+    Path(__file__).resolve().parent / "write_behind_spill.jsonl"
+))
+
+# 사용자 행을 찾지 못한 추천을 몇 번까지 다시 시도할지, 토큰 → user_id를 몇 개까지 기억할지
+MAX_DEFER_ATTEMPTS = 10
+USER_ID_CACHE_SIZE = 10000
+
+INSERT_USER_QUERY = """
+    INSERT INTO teamdb.user_info
+    (USER_AGE, USER_GENDER, user_job, user_purpose)
+    VALUES (%s, %s, %s, %s)
+"""
+
+INSERT_RECOMMENDATION_QUERY = """
+    INSERT INTO teamdb.car_recommendation_info
+    (user_id, car_id)
+    VALUES (%s, %s)
+"""
+
+# 항목 자체의 문제(제약 조건 위반, 잘못된 값 등)로 보는 오류: 한 건씩 다시 저장하며 그 항목만 건너뜀
+# 그 밖의 오류(연결 끊김, 교착 상태 1213, 잠금 대기 초과 1205 등)는 일시적인 것으로 보고 스필 파일에 남겼다가 재시도
+# 테이블/컬럼 없음(1146, 1054) 같은 ProgrammingError는 항목이 아니라 스키마 문제라 모든 항목이 실패하므로
+# 버리지 않고 일시적인 오류처럼 스필 파일에 남겨, 마이그레이션을 적용한 뒤 저장되게 함
+ITEM_ERRORS = (
+    mysql.connector.IntegrityError,
+    mysql.connector.DataError,
+)
+
+_STOP = object()
+
+
+class WriteBehindQueue:
+    """user/recommendation 항목을 모아 저장하는 크기 제한 큐 (put은 절대 기다리지 않음)
+
+    항목 형식 (스필 파일에도 같은 dict를 한 줄씩 저장)
+    - {"type": "user", "token": ..., "values": [나이, 성별, 직업 ID, 목적]}
+    - {"type": "recommendation", "token": ..., "car_ids": [...], "user_id": (알면), "attempts": n}"""
+
+    def __init__(self, connect, batch_size=WRITE_BEHIND_BATCH_SIZE, max_queue=WRITE_BEHIND_QUEUE_SIZE,
+                 flush_interval=WRITE_BEHIND_FLUSH_INTERVAL, retry_seconds=WRITE_BEHIND_RETRY_SECONDS,
+                 spill_path=WRITE_BEHIND_SPILL_FILE):
+        self.connect = connect
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.retry_seconds = retry_seconds
+        self.spill_path = Path(spill_path)
+        self.replay_path = self.spill_path.with_name(self.spill_path.name + ".replay")
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._spill_lock = threading.Lock()
+        self._user_ids = OrderedDict()
+        self._retry_at = 0.0
+        self._closed = False
+
+        self.queued = 0
+        self.written = 0
+        self.batches = 0
+        self.spilled = 0
+        self.failures = 0
+        self.dropped = 0
+        self.max_depth = 0
+        self.last_error = None
+
+        self._thread = threading.Thread(target=self._run, name="write-behind", daemon=True)
+        self._thread.start()
+
+    def add_user(self, token, values):
+        self._put({"type": "user", "token": token, "values": list(values)})
+
+    def add_recommendations(self, token, car_ids):
+        self._put({"type": "recommendation", "token": token, "car_ids": list(car_ids), "attempts": 0})
+
+    def _put(self, item):
+        if self._closed:
+            self._spill([item])
+            return
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            # 화면을 기다리게 하지 않고 스필 파일로 (다음 저장 때 반영)
+            self._spill([item])
+            return
+        self.queued += 1
+        self.max_depth = max(self.max_depth, self._queue.qsize())
+
+    # 스필 파일
+    def _spill(self, items):
+        if not items:
+            return
+        with self._spill_lock:
+            with open(self.spill_path, "a", encoding="utf-8") as f:
+                for item in items:
+                    # 이미 저장된 사용자의 추천이면 재시작 후에도 연결할 수 있도록 user_id를 함께 기록
+                    user_id = self._user_ids.get(item["token"]) if item["type"] == "recommendation" else None
+                    if user_id is not None and not item.get("user_id"):
+                        item = dict(item, user_id=user_id)
+                    f.write(json.dumps(item, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+        self.spilled += len(items)
+
+    @staticmethod
+    def _read_jsonl(path):
+        items = []
+        if not path.exists():
+            return items
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    items.append(json.loads(line))
+                except ValueError:
+                    # 쓰다가 중단된 마지막 줄
+                    break
+        return items
+
+    def _load_replay(self):
+        """스필 파일을 재시도 파일로 옮기고 재시도할 항목 전체를 반환 (저장에 성공해야 재시도 파일을 지움)"""
+        with self._spill_lock:
+            if self.spill_path.exists():
+                if not self.replay_path.exists():
+                    os.replace(self.spill_path, self.replay_path)
+                else:
+                    with open(self.replay_path, "a", encoding="utf-8") as out:
+                        out.write(self.spill_path.read_text(encoding="utf-8"))
+                        out.flush()
+                        os.fsync(out.fileno())
+                    self.spill_path.unlink()
+            return self._read_jsonl(self.replay_path)
+
+    def pending_spill(self):
+        """스필/재시도 파일에 남아 있는 항목 수"""
+        with self._spill_lock:
+            return len(self._read_jsonl(self.spill_path)) + len(self._read_jsonl(self.replay_path))
+
+    # 저장
+    def _remember_user(self, token, user_id):
+        self._user_ids[token] = user_id
+        self._user_ids.move_to_end(token)
+        if len(self._user_ids) > USER_ID_CACHE_SIZE:
+            self._user_ids.popitem(last=False)
+
+    def write_batch(self, items):
+        """항목들을 한 트랜잭션으로 저장하고, 사용자 행을 찾지 못해 미룬 추천 항목 목록을 반환"""
+        users = [item for item in items if item["type"] == "user"]
+        recommendations = [item for item in items if item["type"] == "recommendation"]
+
+        conn = self.connect()
+        cur = conn.cursor()
+        new_user_ids = {}
+        try:
+            # 통계 롤업이 reco_id 순서대로 반영되도록 INSERT 전에 롤업 상태 행을 먼저 잠금
+            last_reco_id = recommendation_stats.lock_stats(cur) if recommendations else None
+
+            if users:
+                cur.execute("SELECT @@auto_increment_increment")
+                step = cur.fetchone()[0]
+                cur.executemany(INSERT_USER_QUERY, [tuple(item["values"]) for item in users])
+                # 여러 행 INSERT 한 문장으로 보내지므로 lastrowid는 첫 행의 ID이고 나머지는 연속
+                first_id = cur.lastrowid
+                for offset, item in enumerate(users):
+                    new_user_ids[item["token"]] = first_id + offset * step
+
+            rows = []
+            deferred = []
+            for item in recommendations:
+                user_id = item.get("user_id") or new_user_ids.get(item["token"]) or self._user_ids.get(item["token"])
+                if user_id is None:
+                    deferred.append(dict(item, attempts=item.get("attempts", 0) + 1))
+                    continue
+                rows += [(user_id, car_id) for car_id in item["car_ids"]]
+            if rows:
+                cur.executemany(INSERT_RECOMMENDATION_QUERY, rows)
+            if recommendations:
+                recommendation_stats.compact(cur, last_reco_id)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cur.close()
+            conn.close()
+
+        for token, user_id in new_user_ids.items():
+            self._remember_user(token, user_id)
+
+        kept = []
+        for item in deferred:
+            if item["attempts"] > MAX_DEFER_ATTEMPTS:
+                self.dropped += 1
+                logger.warning("추천 결과 저장 포기: 사용자 행을 찾지 못했습니다 (token=%s)", item["token"])
+            else:
+                kept.append(item)
+        return kept
+
+    def _write_one_by_one(self, items):
+        """한 건씩 저장하며 항목 오류(ITEM_ERRORS)가 난 항목만 건너뜀
+        반환: (미룬 추천 항목, 일시적인 오류로 저장하지 못한 나머지 항목, 그 오류)"""
+        deferred = []
+        for index, item in enumerate(items):
+            try:
+                deferred += self.write_batch([item])
+            except ITEM_ERRORS as e:
+                self.dropped += 1
+                logger.warning("write-behind 항목 저장 실패, 건너뜀 (%s, token=%s): %s", item["type"], item["token"], e)
+            except Exception as e:
+                return deferred, items[index:], e
+        return deferred, [], None
+
+    def _retry_later(self, now, error):
+        self._retry_at = now + self.retry_seconds
+        self.failures += 1
+        self.last_error = str(error)
+        logger.warning("write-behind 저장 실패, %.0f초 뒤 재시도: %s", self.retry_seconds, error)
+
+    def _flush(self, batch):
+        now = time.monotonic()
+        if now < self._retry_at:
+            # 최근에 저장에 실패했으면 재시도 시각까지는 DB에 붙지 않고 스필 파일에 모음
+            self._spill(batch)
+            return
+
+        replay = self._load_replay()
+        items = replay + batch
+        if not items:
+            return
+        dropped = self.dropped
+        unsaved = []
+        try:
+            deferred = self.write_batch(items)
+        except ITEM_ERRORS as e:
+            # 잘못된 항목 하나 때문에 배치 전체가 계속 실패하지 않도록 한 건씩 다시 저장
+            self.last_error = str(e)
+            deferred, unsaved, error = self._write_one_by_one(items)
+            if error is not None:
+                # 이미 저장한 항목은 빼고 나머지(재시도 파일 항목 포함)를 스필 파일에 남겨 재시도
+                self._retry_later(now, error)
+        except Exception as e:
+            # 일시적인 오류: 재시도 파일은 그대로 두고 이번 배치만 스필 파일에 남김
+            self._spill(batch)
+            self._retry_later(now, e)
+            return
+
+        with self._spill_lock:
+            if self.replay_path.exists():
+                self.replay_path.unlink()
+        self._spill(unsaved + deferred)
+        self.written += len(items) - len(unsaved) - len(deferred) - (self.dropped - dropped)
+        self.batches += 1
+
+    def _run(self):
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            try:
+                item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                item = None
+            if item is _STOP:
+                self._flush(batch)
+                return
+            if item is not None:
+                batch.append(item)
+            if len(batch) >= self.batch_size or time.monotonic() >= deadline:
+                try:
+                    self._flush(batch)
+                except Exception as e:
+                    # 스필 파일도 쓰지 못한 경우에도 저장 스레드는 계속 동작
+                    self.last_error = str(e)
+                    logger.exception("write-behind 오류: 항목 %d건 유실", len(batch))
+                batch = []
+                deadline = time.monotonic() + self.flush_interval
+
+    def close(self):
+        """큐에 남은 항목을 저장(실패하면 스필)하고 저장 스레드를 종료"""
+        if not self._closed:
+            self._closed = True
+            self._queue.put(_STOP)
+            self._thread.join()
+
+    def stats(self):
+        return {
+            "queued": self.queued,
+            "written": self.written,
+            "batches": self.batches,
+            "depth": self._queue.qsize(),
+            "max_depth": self.max_depth,
+            "spilled": self.spilled,
+            "failures": self.failures,
+            "dropped": self.dropped,
+            "last_error": self.last_error,
+        }
+
+
+_lock = threading.Lock()
+_writer = None
+
+
+def get_writer():
+    """프로세스 공용 write-behind 큐 (처음 호출 시 생성, 프로세스 종료 시 남은 항목 저장)"""
+    global _writer
+    with _lock:
+        if _writer is None:
+            # streamlit 없이도 WriteBehindQueue를 쓸 수 있도록 DB 모듈은 여기서 import
+            from db_pool import get_connection
+
+            _writer = WriteBehindQueue(get_connection)
+            atexit.register(_writer.close)
+        return _writer
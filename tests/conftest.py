@@ -0,0 +1,8 @@
+import sys
+from pathlib import Path
+
+# 앱 모듈(streamlit/ryuuung_practice)과 크롤러 모듈(WebScraping)은 패키지가 아니라 평평한 모듈이므로 경로를 추가
+ROOT = Path(__file__).resolve().parents[1]
+for path in (ROOT / "streamlit" / "ryuuung_practice", ROOT / "WebScraping"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
@@ -0,0 +1,139 @@
+"""car_images 썸네일 캐시를 로컬 fixture_server에 붙여 동시 요청, 재시작, LRU 정리, 실패 대체 이미지 확인"""
+import io
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import car_images
+from car_images import CarImageCache, PLACEHOLDER_SVG
+from fixture_server import FixtureHandler, start_fixture_server
+
+
+class CountingHandler(FixtureHandler):
+    """경로별 요청 수를 세고, 동시 요청이 겹치도록 조금 늦게 응답"""
+    lock = threading.Lock()
+    counts = {}
+    delay = 0.1
+
+    def do_GET(self):
+        with self.lock:
+            self.counts[self.path] = self.counts.get(self.path, 0) + 1
+        time.sleep(self.delay)
+        super().do_GET()
+
+
+def image_bytes(color, size=(800, 500)):
+    """테스트용 PNG (Pillow가 없으면 PNG 시그니처만 있는 bytes, 캐시는 Content-Type만 확인)"""
+    if car_images.Image is None:
+        return b"\x89PNG\r\n\x1a\n" + bytes(color) * 100
+    out = io.BytesIO()
+    car_images.Image.new("RGB", size, color).save(out, "PNG")
+    return out.getvalue()
+
+
+@pytest.fixture
+def server(tmp_path):
+    site = tmp_path / "site"
+    site.mkdir()
+    for name, color in (("red.png", (255, 0, 0)), ("green.png", (0, 255, 0)), ("blue.png", (0, 0, 255))):
+        (site / name).write_bytes(image_bytes(color))
+    # 같은 이미지를 다른 URL로
+    (site / "red_copy.png").write_bytes((site / "red.png").read_bytes())
+    CountingHandler.counts = {}
+    server, base_url = start_fixture_server(site, handler_class=CountingHandler)
+    yield base_url
+    server.shutdown()
+    server.server_close()
+
+
+def make_cache(tmp_path, **kwargs):
+    return CarImageCache(image_dir=tmp_path / "images", ref_dir=tmp_path / "refs", **kwargs)
+
+
+def test_concurrent_get_downloads_once(server, tmp_path):
+    cache = make_cache(tmp_path)
+    url = f"{server}/red.png"
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: cache.get(url), range(8)))
+
+    assert CountingHandler.counts == {"/red.png": 1}
+    assert cache.stats["downloads"] == 1
+    assert all(data == results[0] for data in results) and results[0]
+    # 내려받기가 끝나면 URL별 잠금은 남지 않음
+    assert cache._url_locks == {}
+
+
+def test_restart_reuses_content_hash_file(server, tmp_path):
+    cache = make_cache(tmp_path)
+    data = cache.get(f"{server}/red.png")
+    name = cache.filename(f"{server}/red.png")
+    # 내용이 같은 다른 URL은 같은 파일을 가리킴
+    assert cache.get(f"{server}/red_copy.png") == data
+    assert cache.filename(f"{server}/red_copy.png") == name
+    assert len(os.listdir(tmp_path / "images")) == 1
+
+    restarted = make_cache(tmp_path)
+    assert restarted.get(f"{server}/red.png") == data
+    assert restarted.filename(f"{server}/red.png") == name
+    assert restarted.stats["disk_hits"] == 1 and restarted.stats["downloads"] == 0
+    assert CountingHandler.counts == {"/red.png": 1, "/red_copy.png": 1}
+
+
+def test_evicts_least_recently_used_by_mtime(server, tmp_path):
+    cache = make_cache(tmp_path)
+    urls = {color: f"{server}/{color}.png" for color in ("red", "green", "blue")}
+    for url in urls.values():
+        assert cache.get(url) is not None
+    paths = {color: tmp_path / "images" / cache.filename(url) for color, url in urls.items()}
+
+    # green이 가장 오래 안 쓴 파일, red가 가장 최근에 쓴 파일
+    now = time.time()
+    for age, color in ((300, "green"), (200, "blue"), (100, "red")):
+        os.utime(paths[color], (now - age, now - age))
+    sizes = {color: path.stat().st_size for color, path in paths.items()}
+
+    total = cache.evict(target=sizes["red"] + sizes["blue"])
+    assert total == sizes["red"] + sizes["blue"]
+    assert not paths["green"].exists() and paths["blue"].exists() and paths["red"].exists()
+    assert cache.filename(urls["green"]) is None
+    assert cache.stats["evicted"] == 1
+
+    # 지워진 썸네일은 다음 요청 때 다시 내려받음
+    assert cache.get(urls["green"]) is not None
+    assert CountingHandler.counts["/green.png"] == 2
+
+
+def test_failed_download_falls_back_to_placeholder_until_ttl(server, tmp_path, monkeypatch):
+    cache = make_cache(tmp_path)
+    monkeypatch.setattr(car_images, "_cache", cache)
+    monkeypatch.setattr(car_images, "FALLBACK_CAR_IMAGE", (tmp_path / "없는 대체이미지.png", 1000))
+    monkeypatch.setattr(car_images, "static_serving_enabled", lambda: False)
+    url = f"{server}/missing.png"
+
+    assert car_images.car_image(url) == PLACEHOLDER_SVG
+    assert car_images.car_image_src(url).startswith("data:image/svg+xml")
+    # 실패 TTL 동안은 다시 요청하지 않음
+    assert car_images.car_image(url) == PLACEHOLDER_SVG
+    assert CountingHandler.counts == {"/missing.png": 1}
+    assert cache.stats["failures"] == 1
+
+    # TTL이 지나면 다시 시도 (그 사이 파일이 생겼으면 썸네일로 표시)
+    (tmp_path / "site" / "missing.png").write_bytes(image_bytes((0, 0, 0)))
+    cache._failed[url] = time.monotonic() - 1
+    assert car_images.car_image(url) not in (None, PLACEHOLDER_SVG)
+    assert CountingHandler.counts == {"/missing.png": 2}
+
+
+def test_data_uri_is_built_once_per_file(server, tmp_path, monkeypatch):
+    cache = make_cache(tmp_path)
+    monkeypatch.setattr(car_images, "_cache", cache)
+    monkeypatch.setattr(car_images, "static_serving_enabled", lambda: False)
+
+    first = car_images.car_image_src(f"{server}/red.png")
+    assert first.startswith("data:image/")
+    assert car_images.car_image_src(f"{server}/red.png") is first
+    # 내용이 같은 다른 URL도 같은 data URI를 씀
+    assert car_images.car_image_src(f"{server}/red_copy.png") is first
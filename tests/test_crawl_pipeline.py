@@ -0,0 +1,92 @@
+"""crawl_pipeline의 저장 스레드가 결과를 배치마다 체크포인트에 남기고 다시 실행하면 이어서 수집하는지 확인"""
+import pytest
+
+pytest.importorskip("selenium")
+
+from WebScraping.car_info.car_info_dto import CarInfo
+from WebScraping.car_info.car_info_snapshot import load_car_info
+from WebScraping.crawl_pipeline import CrawlWriter, ModelResult, save_car_info
+
+
+class FakeReviewDAO:
+    def __init__(self, fail_names=()):
+        self.fail_names = set(fail_names)
+        self.saved = []
+
+    def insert_car_reviews(self, car_reviews):
+        ids = []
+        for car_review in car_reviews:
+            if car_review.car_name in self.fail_names:
+                ids.append(None)
+                continue
+            self.saved.append(car_review)
+            car_review.review_id = len(self.saved)
+            ids.append(car_review.review_id)
+        return ids
+
+
+class FakeCommentDAO:
+    def __init__(self):
+        self.saved = []
+
+    def insert_comments(self, comments):
+        self.saved.extend(comments)
+        return list(range(len(self.saved) - len(comments), len(self.saved)))
+
+
+def make_result(idx, review=True, errors=()):
+    car_info = CarInfo(idx, f"모델{idx}", "중형 세단", "가솔린", 3000 + idx, 200, 12.5, "2024", 58.0, "엔진", None, "현대")
+    result = ModelResult(idx=idx, model_url=f"http://example.com/{idx}", car_info=car_info, errors=list(errors))
+    if review:
+        result.review = {"car_name": f"모델{idx}", "avg_score": 9.0, "survey_people_count": 10, "graph_info": ""}
+        result.comments = [
+            {"nickname": "닉", "comment_avg_score": 9.0, "comment_text": "좋아요", "created_at": "2025-01-01 00:00:00"}
+        ]
+    return result
+
+
+def make_writer(path, review_dao, comment_dao, batch_size=2):
+    writer = CrawlWriter(path, save_db=False, batch_size=batch_size)
+    writer.daos = (review_dao, comment_dao)
+    return writer
+
+
+def test_results_are_written_per_batch_and_resumed(tmp_path):
+    path = tmp_path / "crawl_checkpoint.jsonl"
+    review_dao, comment_dao = FakeReviewDAO(fail_names={"모델3"}), FakeCommentDAO()
+    writer = make_writer(path, review_dao, comment_dao)
+    results = [make_result(1), make_result(2, review=False), make_result(3), make_result(4, errors=["상세정보 타임아웃"])]
+    for result in results:
+        writer.put(result)
+    writer.close()
+
+    assert [car_review.car_name for car_review in review_dao.saved] == ["모델1", "모델4"]
+    assert len(comment_dao.saved) == 2
+    assert writer.stats()["batches"] == 2
+
+    # 리뷰 저장에 실패한 모델과 오류가 난 모델만 다시 수집
+    urls = [result.model_url for result in results]
+    resumed = CrawlWriter(path, save_db=False)
+    assert resumed.done_urls() == {urls[0], urls[1]}
+
+    # 다시 수집해 저장하면 마지막 기록이 쓰임
+    resumed.daos = (FakeReviewDAO(), FakeCommentDAO())
+    resumed.put(make_result(3))
+    resumed.put(make_result(4))
+    resumed.close()
+    assert CrawlWriter(path, save_db=False).done_urls() == set(urls)
+
+    car_infos = save_car_info(resumed.records(), urls, tmp_path / "snapshot")
+    assert [car_info.id for car_info in car_infos] == [1, 2, 3, 4]
+    assert load_car_info(tmp_path / "snapshot") == car_infos
+
+
+def test_skip_db_records_reviews_as_not_saved(tmp_path):
+    path = tmp_path / "crawl_checkpoint.jsonl"
+    writer = CrawlWriter(path, save_db=False)
+    writer.put(make_result(1))
+    writer.put(make_result(2, review=False))
+    writer.close()
+    records = writer.records()
+    assert records["http://example.com/1"]["has_review"] and not records["http://example.com/1"]["review_saved"]
+    assert writer.done_urls() == {"http://example.com/2"}
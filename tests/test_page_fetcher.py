@@ -0,0 +1,110 @@
+"""page_fetcher를 로컬 fixture_server에 붙여 순서 보존, 재시도/백오프, 호스트별 요청 간격 확인"""
+import threading
+import time
+import urllib.error
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from fixture_server import FixtureHandler, start_fixture_server
+from page_fetcher import HostRateLimiter, HttpFetcher, fetch_pages, fetch_with_retry
+
+
+class RecordingHandler(FixtureHandler):
+    """요청 시각을 기록하고 ?delay=초 만큼 늦게, ?fail=n 이면 처음 n번은 503으로 응답"""
+    lock = threading.Lock()
+    requests = []
+    failures = {}
+
+    def do_GET(self):
+        query = parse_qs(urlsplit(self.path).query)
+        with self.lock:
+            self.requests.append((self.path, time.monotonic()))
+            failed = self.failures.get(self.path, 0)
+            should_fail = failed < int(query.get("fail", ["0"])[0])
+            if should_fail:
+                self.failures[self.path] = failed + 1
+        if should_fail:
+            self.send_error(503)
+            return
+        time.sleep(float(query.get("delay", ["0"])[0]))
+        super().do_GET()
+
+
+@pytest.fixture
+def server(tmp_path):
+    for i in range(6):
+        (tmp_path / f"page{i}.html").write_text(f"<p>page {i}</p>", encoding="utf-8")
+    RecordingHandler.requests = []
+    RecordingHandler.failures = {}
+    server, base_url = start_fixture_server(tmp_path, handler_class=RecordingHandler)
+    yield base_url
+    server.shutdown()
+    server.server_close()
+
+
+def request_times(path):
+    return [at for requested, at in RecordingHandler.requests if requested == path]
+
+
+def test_fetch_pages_keeps_input_order(server):
+    # 앞쪽 페이지일수록 늦게 응답하도록 해서 완료 순서와 입력 순서를 다르게 만듦
+    urls = [f"{server}/page{i}.html?delay={(5 - i) * 0.05}" for i in range(6)]
+    results = fetch_pages(urls, HttpFetcher(timeout=5).fetch, workers=6, retries=0)
+    assert results == [f"<p>page {i}</p>" for i in range(6)]
+
+
+def test_fetch_pages_reports_failures_in_place(server):
+    urls = [f"{server}/page0.html", f"{server}/missing.html", f"{server}/page1.html"]
+    results = fetch_pages(urls, HttpFetcher(timeout=5).fetch, workers=3, retries=2, backoff=0.01)
+    assert results[0] == "<p>page 0</p>"
+    assert isinstance(results[1], urllib.error.HTTPError) and results[1].code == 404
+    assert results[2] == "<p>page 1</p>"
+    # 404는 재시도하지 않음
+    assert len(request_times("/missing.html")) == 1
+
+
+def test_fetch_with_retry_backs_off_then_succeeds(server):
+    backoff = 0.05
+    path = "/page2.html?fail=2"
+    assert fetch_with_retry(HttpFetcher(timeout=5).fetch, server + path, retries=3, backoff=backoff) == "<p>page 2</p>"
+    times = request_times(path)
+    assert len(times) == 3
+    # n번째 재시도 전에는 최소 backoff * 2^n 만큼 기다림
+    for attempt, (before, after) in enumerate(zip(times, times[1:])):
+        assert after - before >= backoff * 2 ** attempt
+
+
+def test_fetch_with_retry_reports_after_retries(server):
+    path = "/page3.html?fail=10"
+    with pytest.raises(urllib.error.HTTPError) as error:
+        fetch_with_retry(HttpFetcher(timeout=5).fetch, server + path, retries=2, backoff=0.01)
+    assert error.value.code == 503
+    assert len(request_times(path)) == 3
+
+    results = fetch_pages([server + "/page4.html?fail=10"], HttpFetcher(timeout=5).fetch, retries=1, backoff=0.01)
+    assert isinstance(results[0], urllib.error.HTTPError) and results[0].code == 503
+    assert len(request_times("/page4.html?fail=10")) == 2
+
+
+def test_rate_limiter_spaces_requests_per_host(server):
+    requests_per_second = 20
+    limiter = HostRateLimiter(requests_per_second)
+    urls = [f"{server}/page{i}.html" for i in range(6)]
+    results = fetch_pages(urls, HttpFetcher(timeout=5).fetch, workers=6, rate_limiter=limiter, retries=0)
+    assert not any(isinstance(result, Exception) for result in results)
+
+    times = sorted(at for _, at in RecordingHandler.requests)
+    assert len(times) == 6
+    # 요청 도착 시각은 네트워크 지연만큼 흔들리므로 간격의 일부만 여유로 둠
+    interval = 1.0 / requests_per_second
+    assert times[-1] - times[0] >= interval * (len(times) - 1) * 0.9
+    assert min(after - before for before, after in zip(times, times[1:])) >= interval * 0.5
+
+
+def test_rate_limiter_does_not_delay_other_hosts():
+    limiter = HostRateLimiter(requests_per_second=1)
+    start = time.monotonic()
+    for host in ("a.example", "b.example", "c.example"):
+        limiter.wait(f"http://{host}/page")
+    assert time.monotonic() - start < 0.5
@@ -0,0 +1,209 @@
+"""추천 엔진 결과를 3페이지 SQL(recommendation_query)의 ORDER BY 결과와 비교하고 추천 캐시 버전 처리를 확인
+
+MySQL 대신 sqlite 메모리 DB에 teamdb 스키마를 붙여 같은 SQL을 실행한다.
+sqlite도 MySQL처럼 NULL을 ASC에서는 맨 앞, DESC에서는 맨 뒤에 정렬한다.
+"""
+import itertools
+import sqlite3
+
+import numpy as np
+import pytest
+
+from car_catalog import CarCatalog, CATALOG_QUERY
+from recommend import (
+    RecommendEngine, RecommendationCache, PREFERENCE_COLUMNS, recommendation_query, recommend_cached,
+    cache_key,
+)
+
+SCHEMA = """
+    CREATE TABLE teamdb.BRAND_INFO (brand_id INTEGER PRIMARY KEY, brand_name TEXT);
+    CREATE TABLE teamdb.BODY_TYPE_INFO (body_id INTEGER, body_name TEXT, body_type_category TEXT, category_id INTEGER);
+    CREATE TABLE teamdb.FUEL_TYPE_INFO (fuel_type_id INTEGER PRIMARY KEY, fuel_type_name TEXT);
+    CREATE TABLE teamdb.CAR_INFO (
+        car_id INTEGER PRIMARY KEY, car_full_name TEXT, car_body_type TEXT, category_id INTEGER,
+        car_fuel_type INTEGER, car_price REAL, car_horsepower REAL, car_fuel_efficiency REAL,
+        car_model_year TEXT, car_size REAL, car_engine_type TEXT, car_img_url TEXT,
+        car_brand INTEGER, car_model_id INTEGER
+    );
+    CREATE TABLE teamdb.CAR_REVIEW_INFO (review_id INTEGER PRIMARY KEY, car_id INTEGER, avg_score REAL);
+"""
+
+BRANDS = [(1, "현대"), (2, "기아")]
+BODY_TYPES = [(1, "중형 세단", "승용차", 2), (2, "중형 SUV", "SUV", 3)]
+FUEL_TYPES = [(2, "가솔린"), (7, "디젤")]
+
+# (car_id, 바디, 연료, 가격, 출력, 연비, 크기, 모델 ID) - 값이 같은 차량과 NULL이 섞이도록 구성
+CARS = [
+    (1, "중형 세단", 2, 3000, 200, 12.0, 58.0, 101),
+    (2, "중형 세단", 2, 3000, 200, 12.0, 58.0, 102),
+    (3, "중형 SUV", 7, 2500, None, 14.5, 60.5, 103),
+    (4, "중형 SUV", 2, 4000, 300, None, 60.5, 104),
+    (5, "중형 세단", 7, 2500, 180, 14.5, None, 105),
+    (6, "중형 SUV", 7, None, 250, 11.0, 59.0, 106),
+    (7, "중형 세단", 2, 3500, 200, 10.0, 57.0, None),
+    (8, "중형 SUV", 2, 2000, 150, 16.0, 56.0, 108),
+    (9, "중형 세단", 7, 4500, 300, 9.5, 61.0, 109),
+    (10, "중형 SUV", 2, 3000, 220, 12.0, 58.0, 110),
+    (11, "중형 세단", 2, 2000, None, None, None, 111),
+    (12, "중형 SUV", 7, 3500, 250, 13.0, 59.0, 112),
+]
+
+# (car_id(모델 ID), 평점) - 같은 모델에 평점이 여러 개면 최댓값, 평점이 없으면 0
+REVIEWS = [(101, 9.0), (102, 9.0), (103, 8.5), (103, 9.5), (105, 9.5), (108, 7.0), (110, 9.0), (112, 8.0)]
+
+FILTERS = [
+    (0, 10000, None, None),
+    (2000, 3500, None, None),
+    (0, 10000, "SUV", None),
+    (0, 10000, None, "디젤"),
+    (2500, 4500, "승용차", "가솔린"),
+]
+
+
+@pytest.fixture(scope="module")
+def db():
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    conn.execute("ATTACH DATABASE ':memory:' AS teamdb")
+    conn.executescript(SCHEMA)
+    conn.executemany("INSERT INTO teamdb.BRAND_INFO VALUES (?, ?)", BRANDS)
+    conn.executemany("INSERT INTO teamdb.BODY_TYPE_INFO VALUES (?, ?, ?, ?)", BODY_TYPES)
+    conn.executemany("INSERT INTO teamdb.FUEL_TYPE_INFO VALUES (?, ?)", FUEL_TYPES)
+    category_ids = {name: category_id for _, name, _, category_id in BODY_TYPES}
+    conn.executemany(
+        "INSERT INTO teamdb.CAR_INFO VALUES (?, ?, ?, ?, ?, ?, ?, ?, '2024', ?, '엔진', ?, ?, ?)",
+        [
+            (car_id, f"차량{car_id}", body, category_ids[body], fuel, price, hp, eff, size,
+             f"http://example.com/{car_id}.png", car_id % 2 + 1, model_id)
+            for car_id, body, fuel, price, hp, eff, size, model_id in CARS
+        ],
+    )
+    conn.executemany("INSERT INTO teamdb.CAR_REVIEW_INFO (car_id, avg_score) VALUES (?, ?)", REVIEWS)
+    yield conn
+    conn.close()
+
+
+def run_sql(conn, query, params):
+    return [dict(row) for row in conn.execute(query.replace("%s", "?"), params)]
+
+
+@pytest.fixture(scope="module")
+def engine(db):
+    rows = run_sql(db, CATALOG_QUERY, ())
+    return RecommendEngine(CarCatalog(rows, version=1))
+
+
+def preference_orders():
+    """선호도 없음, 1~3개 조합 전체"""
+    yield ()
+    for n in (1, 2, 3):
+        yield from itertools.permutations(PREFERENCE_COLUMNS, n)
+
+
+@pytest.mark.parametrize("min_val, max_val, body_type, fuel_type", FILTERS)
+def test_top_k_matches_sql_order_by(db, engine, min_val, max_val, body_type, fuel_type):
+    mask = engine.filter_mask(min_val, max_val, body_type, fuel_type)
+    for preferences in preference_orders():
+        for k in (1, 3, 20):
+            query, params = recommendation_query(min_val, max_val, body_type, fuel_type, preferences, k)
+            expected = [row["car_id"] for row in run_sql(db, query, params)]
+            got = engine.car_id[engine.top_k_indices(mask, preferences, k)].tolist()
+            assert got == expected, (preferences, k)
+
+
+def test_sql_rows_match_catalog_rows(db, engine):
+    preferences = ["평점 (네이버 평점 기준)", "가격 (최저)"]
+    query, params = recommendation_query(0, 10000, preferences=preferences, k=5)
+    sql_rows = run_sql(db, query, params)
+    engine_rows = engine.recommend(0, 10000, preferences=preferences, k=5)
+    for sql_row, engine_row in zip(sql_rows, engine_rows):
+        for col in sql_row:
+            assert sql_row[col] == engine_row[col], col
+
+
+@pytest.mark.parametrize("min_val, max_val, body_type, fuel_type", FILTERS)
+def test_weighted_single_preference_matches_sql_on_non_null(db, engine, min_val, max_val, body_type, fuel_type):
+    """선호도가 하나면 가중치 점수 순서는 값이 있는 행에서 ORDER BY와 같음"""
+    mask = engine.filter_mask(min_val, max_val, body_type, fuel_type)
+    for pref, (col, _) in PREFERENCE_COLUMNS.items():
+        query, params = recommendation_query(min_val, max_val, body_type, fuel_type, [pref], k=100)
+        expected = [row["car_id"] for row in run_sql(db, query, params) if row[col] is not None]
+        has_value = mask & ~np.isnan(engine.catalog.num[col])
+        got = engine.car_id[engine.weighted_top_k_indices(has_value, [pref], k=100)].tolist()
+        assert got == expected, pref
+
+
+def test_weighted_scores_missing_values_lowest(engine):
+    """가중치 모드에서 값이 없는 항목은 방향과 관계없이 최저 점수(0) (SQL ASC처럼 맨 앞에 오지 않음)"""
+    mask = engine.filter_mask(0, 10000)
+    for pref, col_dir in PREFERENCE_COLUMNS.items():
+        got = engine.weighted_top_k_indices(mask, [pref], k=int(mask.sum()))
+        scores = engine.normalized[col_dir][got]
+        missing = np.isnan(engine.catalog.num[col_dir[0]][got])
+        assert (scores[missing] == 0).all(), pref
+        assert (np.diff(scores) <= 0).all(), pref
+        assert scores[0] > 0, pref
+
+
+def test_weighted_ties_break_by_car_id(engine):
+    # 1, 2번은 모든 값이 같음
+    mask = np.isin(engine.car_id, [2, 1])
+    preferences = list(PREFERENCE_COLUMNS)[:3]
+    assert engine.car_id[engine.weighted_top_k_indices(mask, preferences, k=2)].tolist() == [1, 2]
+    assert engine.car_id[engine.weighted_top_k_indices(mask, preferences, k=1)].tolist() == [1]
+
+
+def test_cache_switches_to_newer_version():
+    cache = RecommendationCache(maxsize=10)
+    assert cache.get(1, "a") is None
+    cache.put(1, "a", (0,))
+    assert cache.get(1, "a") == (0,)
+
+    # 새 버전을 조회하면 이전 버전 결과는 모두 버림
+    assert cache.get(2, "a") is None
+    assert cache.stats()["version"] == 2
+    assert cache.stats()["size"] == 0
+
+    # 이전 버전으로 조회해도 현재 버전을 되돌리지 않고 적중하지 않음
+    cache.put(2, "a", (1,))
+    assert cache.get(1, "a") is None
+    assert cache.stats()["version"] == 2
+    assert cache.get(2, "a") == (1,)
+
+
+def test_cache_drops_put_after_version_bump():
+    cache = RecommendationCache(maxsize=10)
+    assert cache.get(1, "a") is None
+    # 버전 1 결과를 계산하는 동안 버전 2 요청이 먼저 들어온 경우
+    assert cache.get(2, "b") is None
+    cache.put(1, "a", (0,))
+    assert cache.stats()["size"] == 0
+    assert cache.get(1, "a") is None
+    assert cache.get(2, "a") is None
+
+
+def test_cache_evicts_least_recently_used():
+    cache = RecommendationCache(maxsize=2)
+    cache.get(1, "a")
+    cache.put(1, "a", (0,))
+    cache.put(1, "b", (1,))
+    assert cache.get(1, "a") == (0,)
+    cache.put(1, "c", (2,))
+    assert cache.get(1, "b") is None
+    assert cache.get(1, "a") == (0,)
+    assert cache.stats()["evictions"] == 1
+
+
+def test_recommend_cached_uses_engine_version(db, engine):
+    cache = RecommendationCache(maxsize=10)
+    preferences = ["가격 (최저)"]
+    first = recommend_cached(engine, 0, 10000, preferences=preferences, cache=cache)
+    assert first == engine.recommend(0, 10000, preferences=preferences)
+    assert recommend_cached(engine, 0, 10000, preferences=preferences, cache=cache) == first
+    assert cache.stats()["hits"] == 1
+
+    # 카탈로그가 새 버전으로 바뀌면 이전 결과를 쓰지 않음
+    newer = RecommendEngine(CarCatalog(run_sql(db, CATALOG_QUERY, ())[:3], version=2))
+    assert recommend_cached(newer, 0, 10000, preferences=preferences, cache=cache) == \
+        newer.recommend(0, 10000, preferences=preferences)
+    assert cache.get(1, cache_key(0, 10000, None, None, preferences)) is None
@@ -0,0 +1,189 @@
+"""write_behind 저장 스레드를 가짜 연결로 돌려 항목 오류는 건너뛰고 일시적/스키마 오류는 스필 후 재시도하는지 확인"""
+import logging
+
+import pytest
+
+mysql_connector = pytest.importorskip("mysql.connector")
+pytest.importorskip("dotenv")
+
+import write_behind
+from write_behind import WriteBehindQueue
+
+
+class FakeDB:
+    """user_info / car_recommendation_info / 롤업 상태만 흉내 내는 저장소
+    fail(error, when)으로 조건에 맞는 executemany에서 오류를 냄"""
+
+    def __init__(self):
+        self.users = []
+        self.recommendations = []
+        self.last_reco_id = 0
+        self.connections = 0
+        self._failures = []
+
+    def fail(self, error, when=lambda query, rows: True, times=None):
+        self._failures.append([error, when, times])
+
+    def check(self, query, rows):
+        for failure in self._failures:
+            error, when, times = failure
+            if times != 0 and when(query, rows):
+                if times is not None:
+                    failure[2] -= 1
+                raise error
+
+    def connect(self):
+        self.connections += 1
+        return FakeConnection(self)
+
+
+class FakeConnection:
+    def __init__(self, db):
+        self.db = db
+        self.users = []
+        self.recommendations = []
+        self.last_reco_id = None
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.db.users += self.users
+        self.db.recommendations += self.recommendations
+        if self.last_reco_id is not None:
+            self.db.last_reco_id = self.last_reco_id
+
+    def rollback(self):
+        self.users, self.recommendations, self.last_reco_id = [], [], None
+
+    def close(self):
+        pass
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.lastrowid = None
+        self._row = None
+
+    def execute(self, query, params=None):
+        db = self.conn.db
+        total = len(db.recommendations) + len(self.conn.recommendations)
+        if "@@auto_increment_increment" in query:
+            self._row = (1,)
+        elif "SELECT last_reco_id" in query:
+            self._row = (db.last_reco_id,)
+        elif "MAX(reco_id)" in query:
+            self._row = (total,)
+        elif "SELECT COUNT(*)" in query:
+            self._row = (params[1] - params[0],)
+        elif "UPDATE teamdb.recommendation_stats_state" in query:
+            self.conn.last_reco_id = params[0]
+
+    def executemany(self, query, rows):
+        rows = list(rows)
+        self.conn.db.check(query, rows)
+        if "user_info" in query:
+            self.lastrowid = len(self.conn.db.users) + len(self.conn.users) + 1
+            self.conn.users += rows
+        else:
+            self.conn.recommendations += rows
+
+    def fetchone(self):
+        return self._row
+
+    def close(self):
+        pass
+
+
+def make_queue(db, tmp_path, **kwargs):
+    kwargs.setdefault("flush_interval", 60)
+    kwargs.setdefault("retry_seconds", 0)
+    return WriteBehindQueue(db.connect, spill_path=tmp_path / "spill.jsonl", **kwargs)
+
+
+def inserts_user(age):
+    return lambda query, rows: "user_info" in query and any(row[0] == age for row in rows)
+
+
+def test_batch_links_recommendations_to_new_users(tmp_path):
+    db = FakeDB()
+    writer = make_queue(db, tmp_path)
+    writer.add_user("a", [25, "남", 1, "출퇴근"])
+    writer.add_user("b", [35, "여", 2, "여행"])
+    writer.add_recommendations("b", [10, 11])
+    writer.add_recommendations("a", [12])
+    writer.close()
+
+    assert db.users == [(25, "남", 1, "출퇴근"), (35, "여", 2, "여행")]
+    assert db.recommendations == [(2, 10), (2, 11), (1, 12)]
+    assert db.last_reco_id == 3
+    assert writer.stats()["written"] == 4
+    assert writer.pending_spill() == 0
+
+
+def test_item_error_skips_only_that_item(tmp_path, caplog):
+    db = FakeDB()
+    db.fail(mysql_connector.IntegrityError("중복", errno=1062), inserts_user(99))
+    writer = make_queue(db, tmp_path)
+    writer.add_user("a", [25, "남", 1, "출퇴근"])
+    writer.add_user("bad", [99, "남", 1, "출퇴근"])
+    writer.add_user("c", [45, "여", 3, "가족"])
+    with caplog.at_level(logging.WARNING, logger=write_behind.__name__):
+        writer.close()
+
+    assert [user[0] for user in db.users] == [25, 45]
+    assert writer.stats()["dropped"] == 1
+    assert writer.pending_spill() == 0
+    assert any("token=bad" in record.getMessage() for record in caplog.records)
+
+
+@pytest.mark.parametrize("error", [
+    mysql_connector.ProgrammingError("Table 'teamdb.user_info' doesn't exist", errno=1146),
+    mysql_connector.ProgrammingError("Unknown column 'user_purpose'", errno=1054),
+    mysql_connector.OperationalError("Lost connection", errno=2013),
+])
+def test_schema_and_transient_errors_are_spilled_and_retried(tmp_path, caplog, error):
+    db = FakeDB()
+    db.fail(error, times=1)
+    writer = make_queue(db, tmp_path)
+    writer.add_user("a", [25, "남", 1, "출퇴근"])
+    writer.add_recommendations("a", [10])
+    with caplog.at_level(logging.WARNING, logger=write_behind.__name__):
+        writer.close()
+
+    # 버리지 않고 스필 파일에 남김
+    assert db.users == [] and db.recommendations == []
+    stats = writer.stats()
+    assert stats["dropped"] == 0 and stats["failures"] == 1
+    assert writer.pending_spill() == 2
+    assert any("재시도" in record.getMessage() for record in caplog.records)
+
+    # 마이그레이션 적용(또는 연결 복구) 후 다음 저장 때 스필 파일 항목부터 저장
+    retried = make_queue(db, tmp_path)
+    retried.close()
+    assert db.users == [(25, "남", 1, "출퇴근")]
+    assert db.recommendations == [(1, 10)]
+    assert retried.pending_spill() == 0
+
+
+def test_transient_error_during_one_by_one_keeps_the_rest(tmp_path):
+    db = FakeDB()
+    # 배치 전체는 항목 오류로 실패하고, 한 건씩 저장하던 중 연결이 끊김
+    db.fail(mysql_connector.IntegrityError("중복", errno=1062), inserts_user(99))
+    db.fail(mysql_connector.OperationalError("Lost connection", errno=2013), inserts_user(45), times=1)
+    writer = make_queue(db, tmp_path)
+    writer.add_user("a", [25, "남", 1, "출퇴근"])
+    writer.add_user("bad", [99, "남", 1, "출퇴근"])
+    writer.add_user("c", [45, "여", 3, "가족"])
+    writer.add_user("d", [55, "여", 4, "레저"])
+    writer.close()
+
+    assert [user[0] for user in db.users] == [25]
+    assert writer.stats()["dropped"] == 1
+    assert writer.pending_spill() == 2
+
+    retried = make_queue(db, tmp_path)
+    retried.close()
+    assert [user[0] for user in db.users] == [25, 45, 55]
+    assert retried.pending_spill() == 0